@@ -0,0 +1,88 @@
+"""Benchmarks parquet read latency by write layout.
+
+Writes a wide feature table with each `ParquetWriteOptions` layout and times full reads,
+column reads and filtered column reads with the same reader `DataCard.load_data` uses.
+
+Usage:
+    python examples/benchmarks/parquet_layouts.py --rows 1000000 --columns 200
+"""
+import argparse
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+import numpy as np
+import pyarrow as pa
+
+from opsml.data.formatter import read_parquet, write_parquet
+from opsml.types import ParquetWriteOptions
+
+LAYOUTS: Dict[str, ParquetWriteOptions] = {
+    "single file (default)": ParquetWriteOptions(),
+    "single file, 64k row groups, zstd": ParquetWriteOptions(row_group_size=65_536, compression="zstd"),
+    "partitioned by month": ParquetWriteOptions(partition_cols=["month"], row_group_size=65_536),
+    "1M rows per file": ParquetWriteOptions(max_rows_per_file=1_000_000, row_group_size=65_536),
+}
+
+
+def create_table(rows: int, columns: int) -> pa.Table:
+    rng = np.random.default_rng(42)
+
+    # rows are sorted by day so row group statistics are selective
+    day = np.sort(rng.integers(0, 365, rows))
+    data = {
+        "day": day,
+        "month": day // 31,
+        **{f"feature_{idx}": rng.random(rows) for idx in range(columns)},
+    }
+    return pa.table(data)
+
+
+def time_read(read: Callable[[], Any], repeats: int) -> float:
+    latencies = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        read()
+        latencies.append(time.perf_counter() - start)
+    return statistics.median(latencies)
+
+
+def main(rows: int, columns: int, repeats: int) -> None:
+    table = create_table(rows, columns)
+    selected = [f"feature_{idx}" for idx in range(10)]
+
+    print(f"{'layout':<36}{'full (s)':>12}{'10 cols (s)':>14}{'10 cols, 1 week (s)':>22}")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for name, options in LAYOUTS.items():
+            path = Path(tmp_dir, name.replace(" ", "_").replace(",", ""))
+            if not options.is_dataset:
+                path = path.with_suffix(".parquet")
+
+            write_parquet(table, path, options)
+
+            full = time_read(lambda: read_parquet(path), repeats)  # pylint: disable=cell-var-from-loop
+            cols = time_read(
+                lambda: read_parquet(path, columns=selected), repeats
+            )  # pylint: disable=cell-var-from-loop
+            filtered = time_read(
+                lambda: read_parquet(  # pylint: disable=cell-var-from-loop
+                    path,
+                    columns=selected,
+                    filters=[("month", "=", 3), ("day", ">=", 100), ("day", "<", 107)],
+                ),
+                repeats,
+            )
+            print(f"{name:<36}{full:>12.3f}{cols:>14.3f}{filtered:>22.3f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark parquet read latency by layout")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--columns", type=int, default=200)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    main(rows=args.rows, columns=args.columns, repeats=args.repeats)
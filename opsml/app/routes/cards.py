@@ -2,16 +2,22 @@
 # Copyright (c) Shipt, Inc.
 # This source code is licensed under the MIT license found in the
 # LICENSE file in the root directory of this source tree.
-from typing import Optional, Union
+import json
+import time
+from typing import Any, AsyncIterator, Dict, Optional, Union
 
-from fastapi import APIRouter, Body, Depends, HTTPException, Request, status
+from fastapi import APIRouter, Body, Depends, Header, HTTPException, Request, status
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
 
 from opsml.app.core.dependencies import verify_token
 from opsml.app.routes.pydantic_models import (
     AddCardRequest,
     AddCardResponse,
+    CardChangesResponse,
     DeleteCardRequest,
     DeleteCardResponse,
+    LineageResponse,
     ListCardRequest,
     ListCardResponse,
     NamesResponse,
@@ -26,11 +32,17 @@ from opsml.app.routes.pydantic_models import (
 from opsml.app.routes.utils import get_registry_type_from_table
 from opsml.helpers.logging import ArtifactLogger
 from opsml.registry import CardRegistry
+from opsml.registry.sql.base.server import CHANGE_POLL_INTERVAL
+from opsml.registry.sql.base.utils import card_change_notifier
+from opsml.types import LineageDirection
 
 logger = ArtifactLogger.get_logger()
 
 router = APIRouter()
 
+# max seconds a single long-poll request or event stream is held open
+MAX_CHANGES_TIMEOUT = 60.0
+
 
 @router.post("/cards/uid", response_model=UidExistsResponse, name="check_uid")
 def check_uid(
@@ -165,6 +177,9 @@ def list_cards(
             tags=payload.tags,
             ignore_release_candidates=payload.ignore_release_candidates,
             query_terms=payload.query_terms,
+            match_all_tags=payload.match_all_tags,
+            columns=payload.columns,
+            uids=payload.uids,
         )
 
         return ListCardResponse(cards=cards)
@@ -176,6 +191,173 @@ def list_cards(
         ) from error
 
 
+async def _wait_for_card_changes(
+    registry: CardRegistry,
+    since: Optional[int],
+    name: Optional[str],
+    repository: Optional[str],
+    timeout: float,
+) -> Dict[str, Any]:
+    """Long-polls for card changes. The change log is queried in the threadpool, but waiting happens
+    on the event loop so idle watchers don't hold a threadpool worker."""
+
+    deadline = time.monotonic() + timeout
+
+    while True:
+        result: Dict[str, Any] = await run_in_threadpool(
+            registry._registry.get_card_changes,
+            since=since,
+            name=name,
+            repository=repository,
+        )
+        remaining = deadline - time.monotonic()
+
+        if since is None or result["changes"] or remaining <= 0:
+            return result
+
+        await card_change_notifier.async_wait(timeout=min(remaining, CHANGE_POLL_INTERVAL))
+
+
+async def _stream_card_changes(
+    registry: CardRegistry,
+    since: Optional[int],
+    name: Optional[str],
+    repository: Optional[str],
+    timeout: float,
+) -> AsyncIterator[str]:
+    """Yields card changes as server-sent events until the timeout is reached. Clients are expected
+    to reconnect with the Last-Event-ID header to resume from the last received change."""
+
+    deadline = time.monotonic() + timeout
+    cursor = since
+
+    if cursor is None:
+        cursor = (await run_in_threadpool(registry._registry.get_card_changes))["cursor"]
+
+    yield f"retry: 1000\nid: {cursor}\n\n"
+
+    while (remaining := deadline - time.monotonic()) > 0:
+        result = await _wait_for_card_changes(
+            registry=registry,
+            since=cursor,
+            name=name,
+            repository=repository,
+            timeout=remaining,
+        )
+
+        for change in result["changes"]:
+            yield f"id: {change['cursor']}\nevent: card_change\ndata: {json.dumps(change)}\n\n"
+
+        cursor = result["cursor"]
+
+
+@router.get("/cards/changes", response_model=CardChangesResponse, name="card_changes")
+async def card_changes(
+    request: Request,
+    registry_type: str,
+    since: Optional[int] = None,
+    name: Optional[str] = None,
+    repository: Optional[str] = None,
+    timeout: float = 0,
+    stream: bool = False,
+    last_event_id: Optional[int] = Header(default=None),
+) -> Union[CardChangesResponse, StreamingResponse]:
+    """Returns card changes recorded after a cursor
+
+    Args:
+        request:
+            FastAPI request object
+        registry_type:
+            Type of registry
+        since:
+            Cursor to retrieve changes after. If not provided, the latest cursor is returned
+        name:
+            Optional card name to filter by
+        repository:
+            Optional repository to filter by
+        timeout:
+            Seconds to wait for changes if none are available (long-poll). If streaming,
+            the number of seconds to keep the event stream open.
+        stream:
+            Whether to stream changes as server-sent events
+        last_event_id:
+            Last event id received by a reconnecting event stream client. Takes precedence over `since`
+
+    Returns:
+        `CardChangesResponse` or an event stream of changes
+    """
+
+    registry: CardRegistry = getattr(request.app.state.registries, registry_type)
+    timeout = min(max(timeout, 0), MAX_CHANGES_TIMEOUT)
+
+    if stream:
+        return StreamingResponse(
+            _stream_card_changes(
+                registry=registry,
+                since=last_event_id if last_event_id is not None else since,
+                name=name,
+                repository=repository,
+                timeout=timeout or MAX_CHANGES_TIMEOUT,
+            ),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache"},
+        )
+
+    try:
+        result = await _wait_for_card_changes(
+            registry=registry,
+            since=since,
+            name=name,
+            repository=repository,
+            timeout=timeout,
+        )
+        return CardChangesResponse(**result)
+
+    except Exception as error:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"""Error retrieving card changes. {error}""",
+        ) from error
+
+
+@router.get("/cards/lineage", response_model=LineageResponse, name="card_lineage")
+def card_lineage(
+    request: Request,
+    uid: str,
+    direction: LineageDirection = LineageDirection.DOWNSTREAM,
+    depth: int = 10,
+) -> LineageResponse:
+    """Returns the lineage edges of a card. Lineage spans all registries, so the card's
+    registry doesn't need to be provided
+
+    Args:
+        request:
+            FastAPI request object
+        uid:
+            Card uid
+        direction:
+            Lineage direction (upstream or downstream)
+        depth:
+            Max number of edges to walk
+
+    Returns:
+        `LineageResponse`
+    """
+
+    # lineage edges are stored in a single table shared by all registries
+    registry: CardRegistry = request.app.state.registries.data
+
+    try:
+        edges = registry._registry.lineage(uid=uid, direction=direction, depth=depth)
+        return LineageResponse(edges=edges)
+
+    except Exception as error:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"""Error retrieving card lineage. {error}""",
+        ) from error
+
+
 @router.post(
     "/cards/create",
     response_model=AddCardResponse,
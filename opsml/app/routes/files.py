@@ -3,6 +3,7 @@
 # This source code is licensed under the MIT license found in the
 # LICENSE file in the root directory of this source tree.
 import io
+import itertools
 import tempfile
 import zipfile as zp
 from pathlib import Path
@@ -117,14 +118,26 @@ def download_file(request: Request, path: str) -> StreamingResponse:
     logger.info("Server: Downloading file {}", path)
     storage_client: StorageClientBase = request.app.state.storage_client
     try:
+        chunks = storage_client.iterfile(
+            Path(swap_opsml_root(request, Path(path))),
+            config.download_chunk_size,
+        )
+
+        # read the first chunk before streaming so missing files return a 404 instead of a broken stream
+        first_chunk = next(chunks, b"")
+
         return StreamingResponse(
-            storage_client.iterfile(
-                Path(swap_opsml_root(request, Path(path))),
-                config.download_chunk_size,
-            ),
+            itertools.chain([first_chunk], chunks),
             media_type="application/octet-stream",
         )
 
+    except FileNotFoundError as error:
+        logger.error("Server: File not found {}", path)
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"File not found. {error}",
+        ) from error
+
     except Exception as error:
         logger.error("Server: Error downloading file {}", path)
         raise HTTPException(
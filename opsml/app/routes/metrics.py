@@ -8,7 +8,12 @@ from typing import Any, Dict, List, cast
 
 from fastapi import APIRouter, HTTPException, Request, status
 
-from opsml.app.routes.pydantic_models import GetMetricRequest, Metrics, Success
+from opsml.app.routes.pydantic_models import (
+    GetMetricRequest,
+    GetRunMetricsRequest,
+    Metrics,
+    Success,
+)
 from opsml.helpers.logging import ArtifactLogger
 from opsml.registry.sql.base.server import ServerRunCardRegistry
 
@@ -69,3 +74,29 @@ def get_metric(request: Request, payload: GetMetricRequest) -> Metrics:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to get metrics"
         ) from error
+
+
+@router.post("/metrics/runs", response_model=Metrics, name="run_metrics_get")
+def get_run_metrics(request: Request, payload: GetRunMetricsRequest) -> Metrics:
+    """Get metrics for multiple runs from metric table
+
+    Args:
+        request:
+            FastAPI request object
+        payload:
+            GetRunMetricsRequest
+
+    Returns:
+        `MetricsModel`
+    """
+
+    run_reg: ServerRunCardRegistry = request.app.state.registries.run._registry
+    try:
+        metrics = run_reg.get_run_metrics(payload.run_uids, payload.name)
+        return Metrics(metric=metrics)
+
+    except Exception as error:
+        logger.error(f"Failed to get run metrics: {error}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to get run metrics"
+        ) from error
@@ -3,8 +3,6 @@
 # LICENSE file in the root directory of this source tree.
 
 
-import json
-import tempfile
 from pathlib import Path
 from typing import Any, Dict, List, Optional, cast
 
@@ -28,6 +26,7 @@ from opsml.helpers.logging import ArtifactLogger
 from opsml.model.challenger import ModelChallenger
 from opsml.model.registrar import ModelRegistrar, RegistrationError, RegistrationRequest
 from opsml.registry.registry import CardRegistries, CardRegistry
+from opsml.storage.card_cache import card_cache
 from opsml.types import CardInfo, ModelMetadata, RegistryTableNames, SaveName, Suffix
 
 logger = ArtifactLogger.get_logger()
@@ -74,7 +73,7 @@ async def model_versions_page(
         model = model or selected_model[0]["name"]
         version = version or selected_model[0]["version"]
 
-    versions = registry.list_cards(name=model, limit=50)
+    versions = registry.list_cards(name=model, limit=50, columns=["uid", "version", "date"])
 
     metadata = post_model_metadata(
         request=request,
@@ -166,16 +165,18 @@ def post_model_metadata(request: Request, payload: CardRequest) -> ModelMetadata
             uid=payload.uid,
         )[0]
 
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            lpath = Path(tmp_dir, SaveName.MODEL_METADATA.value).with_suffix(Suffix.JSON.value)
-            card_uri = f"{storage_root}/{RegistryTableNames.MODEL.value}/{card['repository']}/{card['name']}/v{card['version']}"
-            rpath = Path(card_uri, SaveName.MODEL_METADATA.value).with_suffix(Suffix.JSON.value)
-            request.app.state.storage_client.get(rpath, lpath)
+        # registered model metadata does not change, so repeat page views are served from memory
+        cached_metadata = card_cache.get(card["uid"], ModelMetadata)
+        if cached_metadata is not None:
+            return cast(ModelMetadata, cached_metadata)
 
-            with lpath.open(encoding="utf-8") as json_file:
-                metadata = json.load(json_file)
+        card_uri = (
+            f"{storage_root}/{RegistryTableNames.MODEL.value}/{card['repository']}/{card['name']}/v{card['version']}"
+        )
+        rpath = Path(card_uri, SaveName.MODEL_METADATA.value).with_suffix(Suffix.JSON.value)
+        metadata = ModelMetadata.model_validate_json(request.app.state.storage_client.read_bytes(rpath))
 
-            return ModelMetadata(**metadata)
+        return card_cache.put(card["uid"], metadata, ModelMetadata)
 
     except Exception as exc:
         logger.error("Error loading model metadata: {}", exc)
@@ -84,11 +84,14 @@ class ListCardRequest(BaseModel):
     registry_type: Optional[str] = None
     table_name: Optional[str] = None
     query_terms: Optional[Dict[str, Any]] = None
+    match_all_tags: bool = True
+    columns: Optional[List[str]] = None
+    uids: Optional[List[str]] = None
 
     @model_validator(mode="before")
     @classmethod
     def update_limit(cls, env_vars: Dict[str, Optional[Union[str, int]]]) -> Dict[str, Optional[Union[str, int]]]:
-        if not any((env_vars.get(key) for key in ["name", "repository", "limit"])):
+        if not any((env_vars.get(key) for key in ["name", "repository", "limit", "uids"])):
             env_vars["limit"] = 20
         return env_vars
 
@@ -97,6 +100,15 @@ class ListCardResponse(BaseModel):
     cards: Optional[List[Dict[str, Any]]] = None
 
 
+class CardChangesResponse(BaseModel):
+    cursor: int
+    changes: List[Dict[str, Any]]
+
+
+class LineageResponse(BaseModel):
+    edges: List[Dict[str, Any]]
+
+
 class AddCardRequest(BaseModel):
     card: Dict[str, Any]
     registry_type: Optional[str] = None
@@ -230,6 +242,11 @@ class GetMetricRequest(BaseModel):
     names_only: bool = False
 
 
+class GetRunMetricsRequest(BaseModel):
+    run_uids: List[str]
+    name: Optional[List[str]] = None
+
+
 class CompareMetricRequest(BaseModel):
     metric_name: List[str]
     lower_is_better: Union[bool, List[bool]]
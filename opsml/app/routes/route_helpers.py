@@ -3,6 +3,7 @@
 # This source code is licensed under the MIT license found in the
 # LICENSE file in the root directory of this source tree.
 
+import io
 import json
 import tempfile
 from pathlib import Path
@@ -62,12 +63,12 @@ class RouteHelper:
             `ArtifactCard` and `str`
         """
         if version is None:
-            selected_card = registry.load_card(uid=versions[0]["uid"], **kwargs)
+            selected_card = registry.load_card(uid=versions[0]["uid"], lazy=True, **kwargs)
             version = selected_card.version
 
             return selected_card, str(version)
 
-        return registry.load_card(name=name, version=version), version
+        return registry.load_card(name=name, version=version, lazy=True, **kwargs), version
 
 
 class AuditRouteHelper(RouteHelper):
@@ -347,7 +348,7 @@ class DataRouteHelper(RouteHelper):
         """
 
         registry: CardRegistry = request.app.state.registries.data
-        versions = registry.list_cards(name=name, limit=50)
+        versions = registry.list_cards(name=name, limit=50, columns=["uid", "version", "date"])
 
         datacard, version = self._check_version(
             registry,
@@ -576,14 +577,10 @@ class ProjectRouteHelper(RouteHelper):
 
         paths = client.storage_client.ls(graph_path)
         logger.debug("Found {} graphs in {}", paths, graph_path)
-        if paths:
-            with tempfile.TemporaryDirectory() as tmp_dir:
-                for path in paths:
-                    rpath = graph_path / Path(path).name
-                    lpath = Path(tmp_dir) / rpath.name
-                    client.storage_client.get(rpath, lpath)
-                    graph: Dict[str, Any] = joblib.load(lpath)
-                    loaded_graphs[graph["name"]] = graph
+        for path in paths:
+            rpath = graph_path / Path(path).name
+            graph: Dict[str, Any] = joblib.load(io.BytesIO(client.storage_client.read_bytes(rpath)))
+            loaded_graphs[graph["name"]] = graph
 
         return loaded_graphs
 
@@ -53,6 +53,7 @@ def get_model_versions(registry: CardRegistry, model: str, repository: str) -> L
         for card in registry.list_cards(
             name=model,
             repository=repository,
+            columns=["version"],
         )
     ]
 
@@ -108,7 +109,7 @@ def get_runcard_from_model(
     run_uid = modelcard.get("runcard_uid", None)
 
     if run_uid is not None:
-        return cast(RunCard, registries.run.load_card(uid=run_uid))
+        return cast(RunCard, registries.run.load_card(uid=run_uid, lazy=True))
 
     return None
 
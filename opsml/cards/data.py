@@ -62,19 +62,41 @@ class DataCard(ArtifactCard):
     interface: SerializeAsAny[Union[DataInterface, Dataset]]
     metadata: DataCardMetadata = DataCardMetadata()
 
-    def load_data(self, **kwargs: Union[str, int]) -> None:  # pylint: disable=differing-param-doc
+    def load_data(  # pylint: disable=differing-param-doc
+        self,
+        columns: Optional[List[str]] = None,
+        filters: Optional[Any] = None,
+        **kwargs: Union[str, int],
+    ) -> None:
         """
         Load data to interface
 
         Args:
+            columns:
+                Optional list of columns to load. Only used for parquet data (pandas, polars, arrow).
+
+            filters:
+                Optional row filters. Either a pyarrow compute expression or a list of
+                (column, op, value) tuples, e.g. [("date", ">=", "2024-01-01")]. Row groups
+                that can't match the filters are skipped using parquet statistics.
+                Only used for parquet data (pandas, polars, arrow).
+
             kwargs:
                 Keyword arguments to pass to the data loader
 
-            ---- Supported kwargs for ImageData and TextDataset ----
-
             split:
                 Split to use for data. If not provided, then all data will be loaded.
-                Only used for subclasses of `Dataset`.
+                For `DataInterface` subclasses, loads the rows of the `DataSplit` with this label.
+                Only the split's file is read if the split was saved with `ParquetWriteOptions(save_splits=True)`,
+                otherwise the full data is loaded and split in memory.
+
+            lazy:
+                Load `PolarsData` to a polars LazyFrame that scans the parquet files instead of reading them
+                into memory. Files are scanned directly from storage, or from the local artifact cache
+                (`OPSML_ARTIFACT_CACHE_DIR`), which is required in client mode.
+                Load `NumpyData` to a read only zarr array. Slicing the array only fetches the chunks it touches.
+
+            ---- Supported kwargs for ImageData and TextDataset ----
 
             batch_size:
                 What batch size to use when loading data. Only used for subclasses of `Dataset`.
@@ -90,15 +112,58 @@ class DataCard(ArtifactCard):
                     10 chunks to write in parallel. This is useful for large datasets.
 
         """
-        from opsml.storage.card_loader import DataCardLoader
+        from opsml.storage.data_card_loader import DataCardLoader
+
+        DataCardLoader(self).load_data(columns=columns, filters=filters, **kwargs)
+
+    def stream_data(self, **kwargs: Any) -> Any:  # pylint: disable=differing-param-doc
+        """
+        Returns an iterable over the decoded records of an `ImageDataset` or `TextDataset`. Records are
+        read straight from the saved parquet shards in storage, so no files are written to `data_dir`.
+        When torch is installed, the iterable is a `torch.utils.data.IterableDataset` that can be passed
+        to a `DataLoader`, and shards are divided between workers.
+
+        Args:
+            kwargs:
+                Keyword arguments to pass to the stream
+
+            split:
+                Optional split to stream. If not provided, all splits are streamed.
+
+            batch_size:
+                Optional batch size. If provided, lists of records are yielded instead of single records.
+
+            shuffle:
+                Whether to shuffle the order of shards. Call `set_epoch` on the iterable to reshuffle each epoch.
+
+            seed:
+                Seed used to shuffle shards. Defaults to 0.
+
+            prefetch:
+                Number of record batches to read ahead in a background thread. Defaults to 2.
+
+            rank:
+                Rank of this process when training across multiple processes. Defaults to 0.
+
+            world_size:
+                Number of processes training across. Defaults to 1.
+
+        Example:
+
+            ```python
+            stream = datacard.stream_data(split="train", shuffle=True)
+            loader = torch.utils.data.DataLoader(stream, batch_size=32, num_workers=4, collate_fn=collate)
+            ```
+        """
+        from opsml.storage.data_card_loader import DataCardLoader
 
-        DataCardLoader(self).load_data(**kwargs)
+        return DataCardLoader(self).stream_data(**kwargs)
 
     def load_data_profile(self) -> None:
         """
         Load data to interface
         """
-        from opsml.storage.card_loader import DataCardLoader
+        from opsml.storage.data_card_loader import DataCardLoader
 
         DataCardLoader(self).load_data_profile()
 
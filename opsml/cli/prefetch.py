@@ -0,0 +1,78 @@
+import argparse
+from typing import List, Optional
+
+
+def prefetch_models(
+    cache_dir: str,
+    uids: Optional[List[str]] = None,
+    name: Optional[str] = None,
+    repository: Optional[str] = None,
+    version: Optional[str] = None,
+    artifacts: Optional[List[str]] = None,
+) -> None:
+    """
+    Downloads model artifacts to a local artifact cache. Meant to be run as an init container
+    that shares the cache directory with the serving container.
+
+    Args:
+        cache_dir:
+            Local directory to download artifacts to. The serving process should set
+            `OPSML_ARTIFACT_CACHE_DIR` to the same directory
+        uids:
+            Optional list of model card uids to prefetch
+        name:
+            Optional model card name to prefetch
+        repository:
+            Optional model card repository
+        version:
+            Optional model card version
+        artifacts:
+            Artifacts to download. Defaults to onnx and preprocessor
+    """
+
+    # pylint: disable=import-outside-toplevel
+    from opsml.registry import CardRegistry
+    from opsml.settings.config import config
+    from opsml.types import CardInfo
+
+    config.opsml_artifact_cache_dir = cache_dir
+
+    infos = [CardInfo(uid=uid) for uid in uids or []]
+    if name is not None:
+        infos.append(CardInfo(name=name, repository=repository, version=version))
+
+    if not infos:
+        raise ValueError("A model uid or name is required to prefetch")
+
+    registry = CardRegistry(registry_type="model")
+    futures = registry.prefetch(infos=infos, artifacts=artifacts or ["onnx", "preprocessor"])
+
+    for future in futures:
+        modelcard = future.result()
+        print(f"Prefetched {modelcard.repository}/{modelcard.name} v{modelcard.version} ({modelcard.uid})")
+
+
+def cli() -> None:
+    parser = argparse.ArgumentParser(description="Prefetch model artifacts to a local artifact cache")
+    parser.add_argument("--cache-dir", type=str, required=True, help="local directory to download artifacts to")
+    parser.add_argument("--uid", type=str, action="append", help="model card uid to prefetch (can be repeated)")
+    parser.add_argument("--name", type=str, default=None, help="model card name to prefetch")
+    parser.add_argument("--repository", type=str, default=None, help="model card repository")
+    parser.add_argument("--version", type=str, default=None, help="model card version")
+    parser.add_argument(
+        "--artifacts",
+        type=str,
+        nargs="+",
+        default=["onnx", "preprocessor"],
+        help="artifacts to download (model, onnx, preprocessor, sample_data)",
+    )
+    args = parser.parse_args()
+
+    prefetch_models(
+        cache_dir=args.cache_dir,
+        uids=args.uid,
+        name=args.name,
+        repository=args.repository,
+        version=args.version,
+        artifacts=args.artifacts,
+    )
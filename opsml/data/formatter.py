@@ -1,16 +1,28 @@
 # Copyright (c) Shipt, Inc.
 # This source code is licensed under the MIT license found in the
 # LICENSE file in the root directory of this source tree.
-from typing import Any, Dict, Union, cast
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union, cast
 
+import numpy as np
 import pandas as pd
 import polars as pl
 import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
 from numpy.typing import NDArray
+from pyarrow import feather
 
-from opsml.types import AllowedDataType, Feature
+from opsml.types import AllowedDataType, Feature, IpcWriteOptions, ParquetWriteOptions
 
-ValidArrowData = Union[NDArray[Any], pd.DataFrame, pl.DataFrame, pa.Table]
+ValidArrowData = Union[NDArray[Any], pd.DataFrame, pl.DataFrame, pl.LazyFrame, pa.Table]
+
+# rows of multi-file datasets are written grouped by partition, so their position is saved to restore the row order
+ROW_ORDER_COLUMN = "__opsml_row_order__"
+
+# file (ignored by dataset discovery) holding the arrow schema of a multi-file dataset
+COMMON_METADATA = "_common_metadata"
 
 
 class SchemaValidator:
@@ -35,28 +47,28 @@ class SchemaValidator:
 class PolarsSchemaValidator(SchemaValidator):
     def __init__(
         self,
-        data: pl.DataFrame,
+        data: Union[pl.DataFrame, pl.LazyFrame],
         schema: Dict[str, Feature],
     ):
         """Instantiates schema validator for Polars dataframes
 
         Args:
             data:
-                Polars dataframe
+                Polars dataframe or lazyframe
             schema:
                 Polars schema
         """
 
         super().__init__(data=data, schema=schema)
 
-    def validate_schema(self) -> pl.DataFrame:
+    def validate_schema(self) -> Union[pl.DataFrame, pl.LazyFrame]:
         """Validate polars schema. Columns are converted if schema does not match"""
 
         self.data = self.data.with_columns(
             [pl.col(col).cast(getattr(pl, self.schema[col].feature_type)) for col in self.data.columns]
         )
 
-        return cast(pl.DataFrame, self.data)
+        return cast(Union[pl.DataFrame, pl.LazyFrame], self.data)
 
     @staticmethod
     def validate_data(data_type: str) -> bool:
@@ -80,12 +92,22 @@ class PandasSchemaValidator(SchemaValidator):
         super().__init__(data=data, schema=schema)
 
     def validate_schema(self) -> pd.DataFrame:
-        """Validate pandas schema. Columns are converted if schema does not match"""
+        """Validate pandas schema. Columns that don't match the schema are converted in a single cast.
+        Columns that already match, and Arrow backed columns (which keep the Arrow types they were saved with),
+        are left untouched"""
 
-        for col in self.data.columns:
-            self.data[col] = self.data[col].astype(self.schema[col].feature_type)
+        dtypes = {
+            col: self.schema[col].feature_type
+            for col, dtype in self.data.dtypes.items()
+            if col in self.schema
+            and not isinstance(dtype, pd.ArrowDtype)
+            and str(dtype) != self.schema[col].feature_type
+        }
 
-        return cast(pd.DataFrame, self.data)
+        if not dtypes:
+            return cast(pd.DataFrame, self.data)
+
+        return cast(pd.DataFrame, self.data.astype(dtypes, copy=False))
 
     @staticmethod
     def validate_data(data_type: str) -> bool:
@@ -121,3 +143,208 @@ def check_data_schema(
     if validator is None:
         return data
     return validator(data=data, schema=schema).validate_schema()
+
+
+def read_parquet(path: Path, options: Optional[ParquetWriteOptions] = None, **kwargs: Any) -> pa.Table:
+    """Reads a parquet dataset. Columns and filters are pushed down to the parquet reader, so only
+    the requested columns of row groups that can match the filters (based on row group statistics) are read
+
+    Args:
+        path:
+            Path to parquet file or directory
+        options:
+            Optional `ParquetWriteOptions` the data was written with. Multi-file datasets are read
+            with their saved schema and in their saved row order
+        kwargs:
+            columns:
+                Optional list of columns to read
+            filters:
+                Optional row filters. Either a pyarrow compute expression or a list of
+                (column, op, value) tuples, e.g. [("date", ">=", "2024-01-01")]
+            filesystem:
+                Optional filesystem to read from. When reading from object storage, only
+                the byte ranges of the selected row groups and columns are fetched
+
+    Returns:
+        pyarrow table
+    """
+    filesystem = kwargs.get("filesystem")
+    columns = kwargs.get("columns")
+
+    schema, partitioning = None, "hive"
+    if options is not None and options.is_dataset:
+        schema, partitioning = dataset_partitioning(path, options, filesystem)
+        if columns is not None:
+            columns = [*columns, ROW_ORDER_COLUMN]
+
+    # pre-buffering coalesces range requests to object storage, but the read buffers stay referenced
+    # by the table, roughly doubling its memory. Local files are read without it
+    dataset = pq.ParquetDataset(
+        path_or_paths=path.as_posix(),
+        schema=schema,
+        partitioning=partitioning,
+        filters=kwargs.get("filters"),
+        filesystem=filesystem,
+        pre_buffer=filesystem is not None,
+    )
+    table = dataset.read(columns=columns)
+
+    if schema is None:
+        return table
+
+    # restore the saved row order, column types and (pandas) schema metadata
+    table = table.sort_by(ROW_ORDER_COLUMN).drop_columns(ROW_ORDER_COLUMN)
+    return table.cast(pa.schema([schema.field(name) for name in table.column_names], metadata=schema.metadata))
+
+
+def dataset_partitioning(
+    path: Path,
+    options: ParquetWriteOptions,
+    filesystem: Optional[Any] = None,
+) -> Tuple[pa.Schema, Optional[ds.Partitioning]]:
+    """Gets the saved schema and partitioning of a multi-file dataset written by `write_parquet`.
+    Partition values are parsed with the saved column types instead of being inferred
+
+    Args:
+        path:
+            Path to dataset directory
+        options:
+            `ParquetWriteOptions` the dataset was written with
+        filesystem:
+            Optional filesystem to read from
+
+    Returns:
+        Tuple of dataset schema (including the row order column) and partitioning
+    """
+    schema = pq.read_schema(Path(path, COMMON_METADATA).as_posix(), filesystem=filesystem)
+
+    if not options.partition_cols:
+        return schema, None
+
+    partition_schema = pa.schema([schema.field(name) for name in options.partition_cols])
+    return schema, ds.partitioning(partition_schema, flavor="hive")
+
+
+def write_parquet(table: pa.Table, path: Path, options: Optional[ParquetWriteOptions] = None) -> None:
+    """Writes a pyarrow table to parquet. Tables are written to a single file unless the options
+    partition the data or limit rows per file, in which case a directory of parquet files is written
+
+    Args:
+        table:
+            pyarrow table
+        path:
+            Path to write to
+        options:
+            Optional `ParquetWriteOptions`. Defaults to a single snappy compressed file
+    """
+    if options is None:
+        pq.write_table(table, path)
+        return
+
+    if not options.is_dataset:
+        pq.write_table(
+            table,
+            path,
+            row_group_size=options.row_group_size,
+            compression=options.compression,
+            compression_level=options.compression_level,
+            use_dictionary=options.use_dictionary,
+            write_statistics=options.write_statistics,
+        )
+        return
+
+    file_options = ds.ParquetFileFormat().make_write_options(
+        compression=options.compression,
+        compression_level=options.compression_level,
+        use_dictionary=options.use_dictionary,
+        write_statistics=options.write_statistics,
+    )
+
+    # row groups can't be larger than files
+    max_rows_per_group = min(
+        options.row_group_size or 1024 * 1024,
+        options.max_rows_per_file or 1024 * 1024,
+    )
+
+    table = table.append_column(ROW_ORDER_COLUMN, pa.array(np.arange(table.num_rows, dtype=np.int64)))
+
+    ds.write_dataset(
+        table,
+        base_dir=path.as_posix(),
+        format="parquet",
+        file_options=file_options,
+        partitioning=options.partition_cols,
+        partitioning_flavor="hive" if options.partition_cols else None,
+        max_rows_per_file=options.max_rows_per_file or 0,
+        max_rows_per_group=max_rows_per_group,
+        basename_template="part-{i}.parquet",
+        existing_data_behavior="overwrite_or_ignore",
+    )
+    pq.write_metadata(table.schema, Path(path, COMMON_METADATA).as_posix())
+
+
+def read_ipc(path: Path, **kwargs: Any) -> pa.Table:
+    """Reads an Arrow IPC (Feather v2) file. Local files are memory mapped by default, so uncompressed
+    files are read without copying. Memory mapped tables reference the file, so it must exist for as
+    long as the table is used
+
+    Args:
+        path:
+            Path to arrow file
+        kwargs:
+            columns:
+                Optional list of columns to read
+            filters:
+                Optional row filters. Either a pyarrow compute expression or a list of
+                (column, op, value) tuples, e.g. [("date", ">=", "2024-01-01")]
+            filesystem:
+                Optional filesystem to read from. Files on a filesystem are read into memory
+            memory_map:
+                Whether to memory map local files. Defaults to True. Files that are removed after
+                reading (e.g. temporary downloads) should be read into memory instead
+
+    Returns:
+        pyarrow table
+    """
+    filesystem = kwargs.get("filesystem")
+    columns = kwargs.get("columns")
+    filters = kwargs.get("filters")
+
+    # filters can reference columns that aren't selected, so columns are selected after filtering
+    read_columns = columns if filters is None else None
+
+    if filesystem is not None:
+        with filesystem.open(path.as_posix(), "rb") as file_:
+            table = feather.read_table(pa.PythonFile(file_, mode="r"), columns=read_columns, memory_map=False)
+    else:
+        table = feather.read_table(path.as_posix(), columns=read_columns, memory_map=kwargs.get("memory_map", True))
+
+    if filters is None:
+        return table
+
+    if not isinstance(filters, pc.Expression):
+        filters = pq.filters_to_expression(filters)
+
+    table = table.filter(filters)
+    if columns is not None:
+        table = table.select(columns)
+    return table
+
+
+def write_ipc(table: pa.Table, path: Path, options: IpcWriteOptions) -> None:
+    """Writes a pyarrow table to an Arrow IPC (Feather v2) file
+
+    Args:
+        table:
+            pyarrow table
+        path:
+            Path to write to
+        options:
+            `IpcWriteOptions`
+    """
+    feather.write_feather(
+        table,
+        path.as_posix(),
+        compression=options.compression or "uncompressed",
+        chunksize=options.chunksize,
+    )
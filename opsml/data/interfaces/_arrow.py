@@ -1,11 +1,17 @@
 from pathlib import Path
-from typing import Optional
+from typing import Any, List, Optional
 
 import pyarrow as pa
-import pyarrow.parquet as pq
 
+from opsml.data.formatter import read_ipc, read_parquet, write_ipc, write_parquet
 from opsml.data.interfaces._base import DataInterface
-from opsml.types import AllowedDataType, Feature, Suffix
+from opsml.types import (
+    AllowedDataType,
+    Feature,
+    IpcWriteOptions,
+    ParquetWriteOptions,
+    Suffix,
+)
 
 
 class ArrowData(DataInterface):
@@ -27,10 +33,17 @@ class ArrowData(DataInterface):
             Dictionary or feature descriptions
         sql_logic:
             Sql logic used to generate data
+        parquet_options:
+            Optional `ParquetWriteOptions` used when saving data to parquet
+        ipc_options:
+            Optional `IpcWriteOptions`. If provided, data is saved to an Arrow IPC (Feather v2) file
+            instead of parquet and memory mapped at load time
 
     """
 
     data: Optional[pa.Table] = None
+    parquet_options: Optional[ParquetWriteOptions] = None
+    ipc_options: Optional[IpcWriteOptions] = None
 
     def save_data(self, path: Path) -> None:
         """Saves pandas dataframe to parquet"""
@@ -45,13 +58,28 @@ class ArrowData(DataInterface):
             for feature, type_ in zip(schema.names, schema.types)
         }
 
-        pq.write_table(self.data, path)
+        if self.ipc_options is not None:
+            write_ipc(self.data, path, self.ipc_options)
+            return
 
-    def load_data(self, path: Path) -> None:
-        """Load parquet dataset to pandas dataframe"""
+        write_parquet(self.data, path, self.parquet_options)
+
+    def load_data(self, path: Path, **kwargs: Any) -> None:
+        """Load parquet dataset or arrow file to pyarrow table
+
+        Args:
+            path:
+                Path to parquet dataset or arrow file
+            kwargs:
+                Optional columns, filters, filesystem and memory_map to read with. See `read_parquet` and `read_ipc`
+        """
+
+        if self.ipc_options is not None:
+            self.data = read_ipc(path, **kwargs)
+            return
 
         load_path = path.with_suffix(self.data_suffix)
-        pa_table: pa.Table = pq.ParquetDataset(path_or_paths=load_path).read()
+        pa_table: pa.Table = read_parquet(load_path, self.parquet_options, **kwargs)
 
         self.data = pa_table
 
@@ -61,9 +89,20 @@ class ArrowData(DataInterface):
 
     @property
     def data_suffix(self) -> str:
-        """Returns suffix for storage"""
+        """Returns suffix for storage. Multi-file datasets are saved as a directory"""
+        if self.ipc_options is not None:
+            return Suffix.ARROW.value
+        if self.parquet_options is not None and self.parquet_options.is_dataset:
+            return Suffix.NONE.value
         return Suffix.PARQUET.value
 
+    @property
+    def saved_splits(self) -> List[str]:
+        """Labels of data splits that are saved to their own parquet file"""
+        if self.parquet_options is not None and self.parquet_options.save_splits:
+            return [data_split.label for data_split in self.data_splits]
+        return []
+
     @staticmethod
     def name() -> str:
         return ArrowData.__name__
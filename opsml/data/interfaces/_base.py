@@ -133,12 +133,14 @@ class DataInterface(BaseModel):
             )
         }
 
-    def load_data(self, path: Path) -> None:
+    def load_data(self, path: Path, **kwargs: Any) -> None:
         """Load data from pathlib object
 
         Args:
             path:
                 Pathlib object
+            kwargs:
+                Additional kwargs used by interface subclasses
         """
 
         self.data = joblib.load(path)
@@ -200,8 +202,8 @@ class DataInterface(BaseModel):
 
     def split_data(self) -> Dict[str, Data]:
         """
-        Loops through data splits and splits data either by indexing or
-        column values
+        Splits data by all data splits in a single pass, either by indexing,
+        row slices or column values
 
         Example:
 
@@ -237,19 +239,55 @@ class DataInterface(BaseModel):
             raise ValueError("Data must not be None. Either supply data or load data")
 
         if len(self.data_splits) > 0:
-            data_holder: Dict[str, Data] = {}
-            for data_split in self.data_splits:
-                label, data = DataSplitter.split(
-                    split=data_split,
-                    dependent_vars=self.dependent_vars,
-                    data=self.data,
-                    data_type=self.data_type,
-                )
-                data_holder[label] = data
-
-            return data_holder
+            return DataSplitter.split_all(
+                splits=self.data_splits,
+                dependent_vars=self.dependent_vars,
+                data=self.data,
+                data_type=self.data_type,
+            )
         raise ValueError("No data splits provided")
 
+    def get_split_rows(self, label: str) -> Any:
+        """Returns all rows (including dependent variables) of a data split
+
+        Args:
+            label:
+                Label of the data split
+        """
+        if self.data is None:
+            raise ValueError("Data must not be None. Either supply data or load data")
+
+        data_split = next((split for split in self.data_splits if split.label == label), None)
+        if data_split is None:
+            raise ValueError(f"Data split {label} not found. Available splits: {[s.label for s in self.data_splits]}")
+
+        splits = DataSplitter.split_all(
+            splits=[data_split],
+            dependent_vars=[],
+            data=self.data,
+            data_type=self.data_type,
+        )
+        return splits[label].X
+
+    def save_data_splits(self, path: Path) -> None:
+        """Saves the rows of each split in `saved_splits` to its own file in a directory
+
+        Args:
+            path:
+                Directory to save splits to. Each split is saved to {path}/{label}{data_suffix}
+        """
+        path.mkdir(parents=True, exist_ok=True)
+
+        for label in self.saved_splits:
+            # save through a shallow copy so the full data and feature map are left untouched
+            interface = self.model_copy(update={"data": self.get_split_rows(label)})
+            interface.save_data(Path(path, label).with_suffix(self.data_suffix))
+
+    @property
+    def saved_splits(self) -> List[str]:
+        """Labels of data splits that are saved to their own file and can be loaded individually"""
+        return []
+
     @property
     def data_suffix(self) -> str:
         """Returns suffix for storage"""
@@ -2,11 +2,14 @@
 # This source code is licensed under the MIT license found in the
 # LICENSE file in the root directory of this source tree.
 from pathlib import Path
-from typing import Dict, Optional, Union
+from typing import Any, Dict, Optional, Union
 
 import pyarrow as pa
 
-from opsml.data.interfaces.custom_data.arrow_reader import PyarrowDatasetReader
+from opsml.data.interfaces.custom_data.arrow_reader import (
+    PyarrowDatasetReader,
+    PyarrowDatasetStream,
+)
 from opsml.data.interfaces.custom_data.arrow_writer import PyarrowDatasetWriter
 from opsml.data.interfaces.custom_data.base import (
     Dataset,
@@ -19,6 +22,8 @@ from opsml.types import CommonKwargs
 logger = ArtifactLogger.get_logger()
 
 try:
+    from PIL import Image
+
     from opsml.data.interfaces.custom_data.image import ImageMetadata
 
     class ImageDataset(Dataset):
@@ -91,6 +96,30 @@ try:
             """
             PyarrowDatasetReader(dataset=self, lpath=path, **kwargs).load_dataset()  # type: ignore[arg-type]
 
+        def stream_data(self, path: Path, **kwargs: Any) -> PyarrowDatasetStream:
+            """Returns an iterable over the decoded records of the saved dataset. Records are read straight
+            from the parquet shards instead of being written back to files in data_dir
+
+            Args:
+                path:
+                    Path the dataset was saved to
+
+                kwargs:
+                    Keyword arguments to pass to `PyarrowDatasetStream` (split, batch_size, shuffle, seed,
+                    prefetch, rank, world_size, storage_client)
+            """
+            return PyarrowDatasetStream(dataset=self, path=path, **kwargs)
+
+        def decode_record(self, record: Dict[str, Any]) -> Dict[str, Any]:
+            """Decodes the raw image bytes of a streamed record to a PIL image under `image`
+
+            Args:
+                record:
+                    Arrow record
+            """
+            record["image"] = Image.frombytes(record["mode"], (record["width"], record["height"]), record.pop("bytes"))
+            return record
+
         def split_data(self) -> None:
             """Creates data splits based on subdirectories of data_dir and supplied split value"""
             if bool(self.splits):
@@ -1,11 +1,20 @@
+from collections.abc import MutableMapping
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Optional, Union
 
 import numpy as np
 import zarr
+from numcodecs import Blosc
+from zarr.storage import KVStore
 
 from opsml.data.interfaces._base import DataInterface
-from opsml.types import AllowedDataType, Feature, Suffix
+from opsml.types import AllowedDataType, Feature, Suffix, ZarrWriteOptions
+
+_BLOSC_SHUFFLE = {
+    "shuffle": Blosc.SHUFFLE,
+    "bitshuffle": Blosc.BITSHUFFLE,
+    "noshuffle": Blosc.NOSHUFFLE,
+}
 
 
 class NumpyData(DataInterface):
@@ -13,7 +22,7 @@ class NumpyData(DataInterface):
 
     Args:
         data:
-            Numpy array
+            Numpy array. Lazily loaded data is a read only `zarr.Array`
         dependent_vars:
             List of dependent variables. Can be string or index if using numpy
         data_splits:
@@ -26,16 +35,35 @@ class NumpyData(DataInterface):
             Dictionary or feature descriptions
         sql_logic:
             Sql logic used to generate data
+        zarr_options:
+            Optional `ZarrWriteOptions` used to chunk and compress data when saving to zarr
     """
 
-    data: Optional[np.ndarray[Any, Any]] = None
+    data: Optional[Union[np.ndarray[Any, Any], zarr.Array]] = None
+    zarr_options: Optional[ZarrWriteOptions] = None
 
     def save_data(self, path: Path) -> None:
         """Saves numpy array as a zarr file"""
 
         assert self.data is not None, "No data detected in interface"
 
-        zarr.save(path, self.data)
+        if self.zarr_options is None:
+            zarr.save(path, self.data)
+        else:
+            compressor = None
+            if self.zarr_options.compressor is not None:
+                compressor = Blosc(
+                    cname=self.zarr_options.compressor,
+                    clevel=self.zarr_options.compression_level,
+                    shuffle=_BLOSC_SHUFFLE[self.zarr_options.shuffle],
+                )
+
+            zarr.save_array(
+                str(path),
+                self.data,
+                chunks=self.zarr_options.chunks or True,
+                compressor=compressor,
+            )
 
         self.feature_map = {
             "features": Feature(
@@ -44,8 +72,27 @@ class NumpyData(DataInterface):
             )
         }
 
-    def load_data(self, path: Path) -> None:
-        """Load numpy array from zarr file"""
+    def load_data(self, path: Path, **kwargs: Any) -> None:
+        """Load numpy array from zarr file
+
+        Args:
+            path:
+                Path to zarr file
+            kwargs:
+                If lazy is True, data is opened as a read only `zarr.Array` instead of read into memory.
+                Only the chunks touched by a slice are read. An optional store (key-value mapping of the
+                zarr files) can be provided to read chunks from remote storage
+        """
+
+        if kwargs.get("lazy", False):
+            store = kwargs.get("store")
+
+            # zarr only accepts mutable mappings as stores, so read only mappings are wrapped
+            if store is not None and not isinstance(store, MutableMapping):
+                store = KVStore(store)
+
+            self.data = zarr.open_array(store if store is not None else str(path), mode="r")
+            return
 
         self.data = zarr.load(path)
 
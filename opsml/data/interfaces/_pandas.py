@@ -1,13 +1,12 @@
 from pathlib import Path
-from typing import Optional, cast
+from typing import Any, List, Optional, cast
 
 import pandas as pd
 import pyarrow as pa
-import pyarrow.parquet as pq
 
-from opsml.data.formatter import check_data_schema
+from opsml.data.formatter import check_data_schema, read_parquet, write_parquet
 from opsml.data.interfaces._base import DataInterface
-from opsml.types import AllowedDataType, Feature, Suffix
+from opsml.types import AllowedDataType, Feature, ParquetWriteOptions, Suffix
 
 
 class PandasData(DataInterface):
@@ -28,9 +27,17 @@ class PandasData(DataInterface):
             Dictionary or feature descriptions
         sql_logic:
             Sql logic used to generate data
+        parquet_options:
+            Optional `ParquetWriteOptions` used when saving data to parquet
+        arrow_dtypes:
+            Whether to load data to a dataframe backed by Arrow (`pd.ArrowDtype`) instead of numpy.
+            Arrow backed dataframes reuse the buffers read from parquet instead of converting them,
+            so loading takes roughly the memory of the data itself
     """
 
     data: Optional[pd.DataFrame] = None
+    parquet_options: Optional[ParquetWriteOptions] = None
+    arrow_dtypes: bool = False
 
     def save_data(self, path: Path) -> None:
         """Saves pandas dataframe to parquet"""
@@ -44,15 +51,28 @@ class PandasData(DataInterface):
             )
             for key, value in self.data.dtypes.to_dict().items()
         }
-        pq.write_table(arrow_table, path)
+        write_parquet(arrow_table, path, self.parquet_options)
 
-    def load_data(self, path: Path) -> None:
-        """Load parquet dataset to pandas dataframe"""
+    def load_data(self, path: Path, **kwargs: Any) -> None:
+        """Load parquet dataset to pandas dataframe
 
-        pa_table: pa.Table = pq.ParquetDataset(path_or_paths=path).read()
+        Args:
+            path:
+                Path to parquet dataset
+            kwargs:
+                Optional columns, filters and filesystem to read with. See `read_parquet`
+        """
 
+        pa_table: pa.Table = read_parquet(path, self.parquet_options, **kwargs)
+
+        # self_destruct releases each arrow column once it's converted and split_blocks skips block
+        # consolidation, so the table and dataframe aren't both held in memory
         data = check_data_schema(
-            pa_table.to_pandas(),
+            pa_table.to_pandas(
+                types_mapper=pd.ArrowDtype if self.arrow_dtypes else None,
+                split_blocks=True,
+                self_destruct=True,
+            ),
             self.feature_map,
             self.data_type,
         )
@@ -65,9 +85,18 @@ class PandasData(DataInterface):
 
     @property
     def data_suffix(self) -> str:
-        """Returns suffix for storage"""
+        """Returns suffix for storage. Multi-file datasets are saved as a directory"""
+        if self.parquet_options is not None and self.parquet_options.is_dataset:
+            return Suffix.NONE.value
         return Suffix.PARQUET.value
 
+    @property
+    def saved_splits(self) -> List[str]:
+        """Labels of data splits that are saved to their own parquet file"""
+        if self.parquet_options is not None and self.parquet_options.save_splits:
+            return [data_split.label for data_split in self.data_splits]
+        return []
+
     @staticmethod
     def name() -> str:
         return PandasData.__name__
@@ -1,13 +1,22 @@
 from pathlib import Path
-from typing import Optional, cast
+from typing import Any, List, Optional, Union, cast
 
 import polars as pl
 import pyarrow as pa
-import pyarrow.parquet as pq
+import pyarrow.dataset as ds
 
-from opsml.data.formatter import check_data_schema
+from opsml.data.formatter import (
+    ROW_ORDER_COLUMN,
+    check_data_schema,
+    dataset_partitioning,
+    read_parquet,
+    write_parquet,
+)
 from opsml.data.interfaces._base import DataInterface
-from opsml.types import AllowedDataType, Feature, Suffix
+from opsml.helpers.logging import ArtifactLogger
+from opsml.types import AllowedDataType, Feature, ParquetWriteOptions, Suffix
+
+logger = ArtifactLogger.get_logger()
 
 
 class PolarsData(DataInterface):
@@ -15,7 +24,7 @@ class PolarsData(DataInterface):
 
     Args:
         data:
-            Polars DataFrame
+            Polars DataFrame or LazyFrame. LazyFrames are streamed to parquet when saved
         dependent_vars:
             List of dependent variables. Can be string or index if using numpy
         data_splits:
@@ -28,14 +37,19 @@ class PolarsData(DataInterface):
             Dictionary or feature descriptions
         sql_logic:
             Sql logic used to generate data
+        parquet_options:
+            Optional `ParquetWriteOptions` used when saving data to parquet
     """
 
-    data: Optional[pl.DataFrame] = None
+    data: Optional[Union[pl.DataFrame, pl.LazyFrame]] = None
+    parquet_options: Optional[ParquetWriteOptions] = None
 
     def save_data(self, path: Path) -> None:
-        """Saves pandas dataframe to parquet"""
+        """Saves polars dataframe to parquet. LazyFrames are streamed to parquet with `sink_parquet`"""
 
         assert self.data is not None, "No data detected in interface"
+
+        # LazyFrame schemas are resolved from the query plan without collecting data
         self.feature_map = {
             key: Feature(
                 feature_type=str(value),
@@ -44,20 +58,89 @@ class PolarsData(DataInterface):
             for key, value in self.data.schema.items()
         }
 
-        pq.write_table(self.data.to_arrow(), path)
+        if isinstance(self.data, pl.LazyFrame):
+            return self._sink_data(self.data, path)
+
+        write_parquet(self.data.to_arrow(), path, self.parquet_options)
+        return None
+
+    def _sink_data(self, data: pl.LazyFrame, path: Path) -> None:
+        """Streams a LazyFrame to a parquet file. Queries that can't run in the streaming engine
+        and multi-file layouts are collected with the streaming engine and written instead"""
+        options = self.parquet_options or ParquetWriteOptions()
+
+        # the plan of a streamable query starts with a streaming pipeline
+        streamable = data.explain(streaming=True, comm_subplan_elim=False).startswith("--- PIPELINE")
 
-    def load_data(self, path: Path) -> None:
-        """Load parquet dataset to pandas dataframe"""
+        if streamable and not options.is_dataset:
+            data.sink_parquet(
+                path,
+                compression=options.compression,
+                compression_level=options.compression_level,
+                statistics=options.write_statistics,
+                row_group_size=options.row_group_size,
+            )
+            return
+
+        logger.warning("LazyFrame can't be streamed to parquet, collecting data before saving")
+        write_parquet(data.collect(streaming=True).to_arrow(), path, self.parquet_options)
+
+    def _scan_data(self, path: Path, **kwargs: Any) -> pl.LazyFrame:
+        """Scans a parquet file or dataset to a LazyFrame"""
+        if kwargs.get("filters") is not None:
+            raise ValueError("filters are not supported when loading lazily. Use LazyFrame.filter instead")
+
+        filesystem = kwargs.get("filesystem")
+        is_local = filesystem is None or "file" in filesystem.protocol
+
+        if self.parquet_options is not None and self.parquet_options.is_dataset:
+            schema, partitioning = dataset_partitioning(path, self.parquet_options, filesystem)
+            dataset = ds.dataset(
+                path.as_posix(),
+                schema=schema,
+                format="parquet",
+                partitioning=partitioning,
+                filesystem=filesystem,
+            )
+            data = pl.scan_pyarrow_dataset(dataset).sort(ROW_ORDER_COLUMN).drop(ROW_ORDER_COLUMN)
+        elif is_local and path.is_file():
+            data = pl.scan_parquet(path)
+        else:
+            dataset = ds.dataset(path.as_posix(), format="parquet", partitioning="hive", filesystem=filesystem)
+            data = pl.scan_pyarrow_dataset(dataset)
+
+        if kwargs.get("columns") is not None:
+            data = data.select(kwargs["columns"])
+
+        return data
+
+    def load_data(self, path: Path, **kwargs: Any) -> None:
+        """Load parquet dataset to polars dataframe
+
+        Args:
+            path:
+                Path to parquet dataset
+            kwargs:
+                Optional columns, filters and filesystem to read with. See `read_parquet`.
+                If lazy is True, data is scanned to a LazyFrame instead of read into memory.
+                Files at path must exist for as long as the LazyFrame is used
+        """
 
         load_path = path.with_suffix(self.data_suffix)
-        pa_table: pa.Table = pq.ParquetDataset(path_or_paths=load_path).read()
+
+        if kwargs.pop("lazy", False):
+            data = self._scan_data(load_path, **kwargs)
+        else:
+            pa_table: pa.Table = read_parquet(load_path, self.parquet_options, **kwargs)
+            data = pl.from_arrow(data=pa_table)
+
         data = check_data_schema(
-            pl.from_arrow(data=pa_table),
+            data,
             self.feature_map,
             self.data_type,
         )
 
-        self.data = cast(pl.DataFrame, data)
+        self.data = cast(Union[pl.DataFrame, pl.LazyFrame], data)
 
     @property
     def data_type(self) -> str:
@@ -65,9 +148,18 @@ class PolarsData(DataInterface):
 
     @property
     def data_suffix(self) -> str:
-        """Returns suffix for storage"""
+        """Returns suffix for storage. Multi-file datasets are saved as a directory"""
+        if self.parquet_options is not None and self.parquet_options.is_dataset:
+            return Suffix.NONE.value
         return Suffix.PARQUET.value
 
+    @property
+    def saved_splits(self) -> List[str]:
+        """Labels of data splits that are saved to their own parquet file"""
+        if self.parquet_options is not None and self.parquet_options.save_splits:
+            return [data_split.label for data_split in self.data_splits]
+        return []
+
     @staticmethod
     def name() -> str:
         return PolarsData.__name__
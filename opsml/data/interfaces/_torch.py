@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 from opsml.data.interfaces._base import DataInterface
 from opsml.types import AllowedDataType, Feature, Suffix
@@ -7,6 +7,9 @@ from opsml.types import AllowedDataType, Feature, Suffix
 try:
     import torch
 
+    # name of the tensor in safetensors files
+    SAFETENSORS_KEY = "data"
+
     class TorchData(DataInterface):
         """Torch dataset interface
 
@@ -25,20 +28,37 @@ try:
                 Sql logic used to generate data
             is_dataset:
                 Whether data is a torch dataset or not
+            as_safetensors:
+                Whether to save the tensor in safetensors format. Safetensors files are memory mapped
+                at load time instead of being unpickled
         """
 
         data: Optional[torch.Tensor] = None
+        as_safetensors: bool = False
 
         def save_data(self, path: Path) -> None:
             """Saves torch dataset or tensor(s)"""
 
             assert self.data is not None, "No data detected in interface"
 
-            torch.save(self.data, path)
+            if self.as_safetensors:
+                from safetensors.torch import save_file
+
+                save_file({SAFETENSORS_KEY: self.data.contiguous()}, path)
+            else:
+                torch.save(self.data, path)
+
             self.feature_map["features"] = Feature(feature_type=str(self.data.dtype), shape=self.data.shape)
 
-        def load_data(self, path: Path) -> None:
+        def load_data(self, path: Path, **kwargs: Any) -> None:
             """Load torch tensors or torch datasets"""
+            if path.suffix == Suffix.SAFETENSORS.value:
+                from safetensors import safe_open
+
+                with safe_open(str(path), framework="pt", device="cpu") as file_:
+                    self.data = file_.get_tensor(SAFETENSORS_KEY)
+                return
+
             self.data = torch.load(path)
 
         @property
@@ -48,6 +68,8 @@ try:
         @property
         def data_suffix(self) -> str:
             """Returns suffix for storage"""
+            if self.as_safetensors:
+                return Suffix.SAFETENSORS.value
             return Suffix.PT.value
 
         @staticmethod
@@ -1,8 +1,13 @@
+import random
+import threading
 from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union, cast
+from queue import Full, Queue
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple, Union, cast
 
+import pyarrow as pa
 import pyarrow.dataset as ds
+import pyarrow.parquet as pq
 
 from opsml.data.interfaces.custom_data.base import (
     Dataset,
@@ -11,10 +16,26 @@ from opsml.data.interfaces.custom_data.base import (
 )
 from opsml.helpers.logging import ArtifactLogger
 from opsml.storage import client
+from opsml.types import StorageClientProtocol, Suffix
 
 logger = ArtifactLogger.get_logger()
 local_fs = client.LocalFileSystem(auto_mkdir=True)
 
+try:
+    from torch.utils.data import IterableDataset, get_worker_info
+
+    _StreamBase: Any = IterableDataset
+
+except ModuleNotFoundError:
+    _StreamBase = object
+
+    def get_worker_info() -> Any:
+        return None
+
+
+# number of rows read from a shard at a time when records are streamed one by one
+_READ_BATCH_SIZE = 100
+
 
 class PyarrowDatasetReader:
     def __init__(
@@ -121,3 +142,164 @@ class PyarrowDatasetReader:
 
         for record_batch in self.arrow_dataset.to_batches(batch_size=self.batch_size):
             self._write_batch_to_file(record_batch.to_pylist())
+
+
+class PyarrowDatasetStream(_StreamBase):  # type: ignore[misc] # pylint: disable=abstract-method
+    def __init__(
+        self,
+        dataset: Dataset,
+        path: Path,
+        split: Optional[str] = None,
+        batch_size: Optional[int] = None,
+        shuffle: bool = False,
+        seed: int = 0,
+        prefetch: int = 2,
+        rank: int = 0,
+        world_size: int = 1,
+        storage_client: Optional[StorageClientProtocol] = None,
+    ):
+        """Iterates over the records of a saved `Dataset` straight from its parquet shards, without
+        writing records back to individual files. When torch is installed this is a
+        `torch.utils.data.IterableDataset`, and shards are divided between `DataLoader` workers
+
+        Args:
+            dataset:
+                `Dataset` object. Used to decode records
+            path:
+                Path the dataset was saved to
+            split:
+                Optional split to stream. If not provided, all splits are streamed
+            batch_size:
+                Optional batch size. If provided, lists of `batch_size` records are yielded instead of single records
+            shuffle:
+                Whether to shuffle the order of shards. Shards are shuffled with the same seed in every worker,
+                so each shard is still read exactly once per epoch. Use `set_epoch` to change the order per epoch
+            seed:
+                Seed used to shuffle shards
+            prefetch:
+                Number of record batches to read ahead in a background thread. 0 disables prefetching
+            rank:
+                Rank of this process when training across multiple processes
+            world_size:
+                Number of processes training across. Shards are divided between processes and workers
+            storage_client:
+                Optional storage client to read shards from. Defaults to the local file system
+        """
+        self.dataset = dataset
+        self.path = path
+        self.batch_size = batch_size
+        self.shuffle = shuffle
+        self.seed = seed
+        self.epoch = 0
+        self.prefetch = prefetch
+        self.rank = rank
+        self.world_size = world_size
+        self.storage_client = storage_client
+
+        if split is not None:
+            self.path = self.path / split
+
+    def set_epoch(self, epoch: int) -> None:
+        """Sets the epoch used to shuffle shards
+
+        Args:
+            epoch:
+                Epoch number
+        """
+        self.epoch = epoch
+
+    @property
+    def shards(self) -> List[Path]:
+        """Parquet shards of the dataset in a stable order"""
+        if self.storage_client is None:
+            files = [Path(file_) for file_ in local_fs.find(str(self.path))]
+        else:
+            files = self.storage_client.find(self.path)
+
+        return sorted(file_ for file_ in files if file_.suffix == Suffix.PARQUET.value)
+
+    def _open(self, path: Path) -> BinaryIO:
+        if self.storage_client is None:
+            return cast(BinaryIO, local_fs.open(str(path), "rb"))
+        return self.storage_client.open(path, "rb")
+
+    def _worker_shards(self) -> List[Path]:
+        """Shards read by the current process and `DataLoader` worker"""
+        shards = self.shards
+
+        if self.shuffle:
+            random.Random(self.seed + self.epoch).shuffle(shards)
+
+        worker_id, num_workers = 0, 1
+        worker_info = get_worker_info()
+        if worker_info is not None:
+            worker_id, num_workers = worker_info.id, worker_info.num_workers
+
+        return shards[self.rank * num_workers + worker_id :: self.world_size * num_workers]
+
+    def _read_batches(self, shards: List[Path]) -> Iterator[pa.RecordBatch]:
+        for shard in shards:
+            with self._open(shard) as file_:
+                parquet_file = pq.ParquetFile(file_)
+                yield from parquet_file.iter_batches(batch_size=self.batch_size or _READ_BATCH_SIZE)
+
+    def _prefetch(self, batches: Iterator[pa.RecordBatch]) -> Iterator[pa.RecordBatch]:
+        """Reads batches in a background thread so reading and decoding the next batch overlaps with training"""
+        if self.prefetch < 1:
+            yield from batches
+            return
+
+        queue: Queue[Tuple[Optional[pa.RecordBatch], Optional[BaseException]]] = Queue(maxsize=self.prefetch)
+        stop = threading.Event()
+
+        def put(item: Tuple[Optional[pa.RecordBatch], Optional[BaseException]]) -> bool:
+            while not stop.is_set():
+                try:
+                    queue.put(item, timeout=0.1)
+                    return True
+                except Full:
+                    continue
+            return False
+
+        def produce() -> None:
+            try:
+                for batch in batches:
+                    if not put((batch, None)):
+                        return
+                put((None, None))
+            except BaseException as exc:  # pylint: disable=broad-except
+                put((None, exc))
+
+        thread = threading.Thread(target=produce, daemon=True)
+        thread.start()
+
+        try:
+            while True:
+                batch, exc = queue.get()
+                if exc is not None:
+                    raise exc
+                if batch is None:
+                    return
+                yield batch
+        finally:
+            stop.set()
+            thread.join()
+
+    def __iter__(self) -> Iterator[Any]:
+        records: List[Dict[str, Any]] = []
+
+        for batch in self._prefetch(self._read_batches(self._worker_shards())):
+            for record in batch.to_pylist():
+                record = self.dataset.decode_record(record)
+
+                if self.batch_size is None:
+                    yield record
+                    continue
+
+                records.append(record)
+                if len(records) == self.batch_size:
+                    yield records
+                    records = []
+
+        if records:
+            yield records
@@ -208,6 +208,28 @@ class Dataset(BaseModel):
         """
         raise NotImplementedError
 
+    def stream_data(self, path: Path, **kwargs: Any) -> Any:
+        """Returns an iterable over the records of the saved dataset that reads straight from its
+        parquet shards
+
+        Args:
+            path:
+                Path the dataset was saved to
+
+            kwargs:
+                Keyword arguments to pass to the stream. See `PyarrowDatasetStream`
+        """
+        raise NotImplementedError
+
+    def decode_record(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """Decodes a streamed arrow record. Base implementation returns the record as is
+
+        Args:
+            record:
+                Arrow record
+        """
+        return record
+
     @property
     def arrow_schema(self) -> pa.Schema:
         """Returns schema for ImageDataset records"""
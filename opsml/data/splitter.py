@@ -2,12 +2,15 @@
 # Copyright (c) Shipt, Inc.
 # This source code is licensed under the MIT license found in the
 # LICENSE file in the root directory of this source tree.
+import operator
 from dataclasses import dataclass
-from typing import Any, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union, cast
 
+import numpy as np
 import pandas as pd
 import polars as pl
 import pyarrow as pa
+import pyarrow.compute as pc
 from numpy.typing import NDArray
 from pydantic import BaseModel, ConfigDict, field_validator
 
@@ -52,258 +55,329 @@ class DataSplit(BaseModel):
         return value
 
 
-class DataSplitterBase:
-    def __init__(
-        self,
-        split: DataSplit,
-        dependent_vars: List[Union[int, str]],
-    ):
-        self.split = split
+_COLUMN_OPERATORS: Dict[Optional[str], Callable[[Any, Any], Any]] = {
+    None: operator.eq,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le,
+}
+
+# pyarrow compute functions of column split inequalities
+_ARROW_COLUMN_FUNCTIONS: Dict[Optional[str], str] = {
+    None: "equal",
+    ">": "greater",
+    ">=": "greater_equal",
+    "<": "less",
+    "<=": "less_equal",
+}
+
+
+class SplitEngineBase:
+    def __init__(self, data: Any, dependent_vars: List[Union[int, str]]):
+        """Splits data by many `DataSplit`s at once. Row splits are returned as zero-copy slices
+        and index splits are taken once each. Column splits are resolved to a single split label
+        vector, so the data is gathered once and each split is a zero-copy slice of the gathered data.
+
+        Args:
+            data:
+                Data to split
+            dependent_vars:
+                List of dependent variables
+        """
+        self.data = data
         self.dependent_vars = dependent_vars
 
     @property
-    def column_name(self) -> str:
-        if self.split.column_name is not None:
-            return self.split.column_name
-
-        raise ValueError("Column name was not provided")
-
-    @property
-    def column_value(self) -> Any:
-        if self.split.column_value is not None:
-            return self.split.column_value
-
-        raise ValueError("Column value was not provided")
-
-    @property
-    def indices(self) -> List[int]:
-        if self.split.indices is not None:
-            return self.split.indices
-        raise ValueError("List of indices was not provided")
-
-    @property
-    def start(self) -> int:
-        if self.split.start is not None:
-            return self.split.start
-        raise ValueError("Start index was not provided")
-
-    @property
-    def stop(self) -> int:
-        if self.split.stop is not None:
-            return self.split.stop
-        raise ValueError("Stop index was not provided")
-
-    def get_x_cols(self, columns: List[str], dependent_vars: List[Union[str, int]]) -> List[str]:
-        for var in dependent_vars:
-            if isinstance(var, str):
-                columns.remove(var)
-
-        return columns
+    def num_rows(self) -> int:
+        return len(self.data)
 
-    def create_split(self, data: Any) -> Tuple[str, Data]:
+    def column_mask(self, split: DataSplit) -> NDArray[np.bool_]:
+        """Returns a boolean mask of the rows matching a column split"""
         raise NotImplementedError
 
-    @staticmethod
-    def validate(data_type: str, split: DataSplit) -> bool:
+    def take(self, data: Any, indices: Union[List[int], NDArray[np.int64]]) -> Any:
         raise NotImplementedError
 
+    def slice(self, data: Any, start: int, stop: int) -> Any:
+        raise NotImplementedError
 
-class PolarsColumnSplitter(DataSplitterBase):
-    """Column splitter for Polars dataframe"""
-
-    def create_split(self, data: pl.DataFrame) -> Tuple[str, Data]:
-        if self.split.inequality is None:
-            data = data.filter(pl.col(self.column_name) == self.column_value)
-
-        elif self.split.inequality == ">":
-            data = data.filter(pl.col(self.column_name) > self.column_value)
-
-        elif self.split.inequality == ">=":
-            data = data.filter(pl.col(self.column_name) >= self.column_value)
-
-        elif self.split.inequality == "<":
-            data = data.filter(pl.col(self.column_name) < self.column_value)
-
-        else:
-            data = data.filter(pl.col(self.column_name) <= self.column_value)
-
-        if bool(self.dependent_vars):
-            x_cols = self.get_x_cols(columns=data.columns, dependent_vars=self.dependent_vars)
-
-            return self.split.label, Data(
-                X=data.select(x_cols),
-                y=data.select(self.dependent_vars),
+    def to_data(self, data: Any) -> Data:
+        return Data(X=data)
+
+    def take_data(self, data: Any, indices: Union[List[int], NDArray[np.int64]]) -> Data:
+        """Takes rows and separates dependent variables"""
+        return self.to_data(self.take(data, indices))
+
+    def _split_columns(self, splits: List[DataSplit]) -> Dict[str, Data]:
+        # int8/int16 labels are sorted with a linear time radix sort
+        label_type = np.int8 if len(splits) < 127 else np.int16 if len(splits) < 32_767 else np.int32
+        labels = np.full(self.num_rows, -1, dtype=label_type)
+
+        counts = np.zeros(len(splits), dtype=np.int64)
+        for idx, split in enumerate(splits):
+            mask = self.column_mask(split)
+            counts[idx] = np.count_nonzero(mask)
+            labels[mask] = idx
+
+        selected = np.flatnonzero(labels >= 0)
+
+        # a row matching more than one split is only labeled once, so overlapping splits are filtered individually
+        if len(selected) != counts.sum():
+            return {split.label: self.take_data(self.data, np.flatnonzero(self.column_mask(split))) for split in splits}
+
+        # stable sort keeps rows in their original order within each split
+        order = selected[np.argsort(labels[selected], kind="stable")]
+        stops = np.cumsum(counts)
+        starts = stops - counts
+
+        # splits over sorted data (e.g. time based splits) are contiguous row ranges and are sliced without copying
+        nonempty = counts > 0
+        first, last = np.zeros_like(counts), np.full_like(counts, -1)
+        first[nonempty] = order[starts[nonempty]]
+        last[nonempty] = order[stops[nonempty] - 1]
+        contiguous = last - first + 1 == counts
+
+        data_holder: Dict[str, Data] = {}
+        for idx in np.flatnonzero(contiguous):
+            data_holder[splits[idx].label] = self.to_data(
+                self.slice(self.data, int(first[idx]), int(first[idx] + counts[idx])),
             )
 
-        return self.split.label, Data(X=data)
+        remaining = np.flatnonzero(~contiguous)
+        if remaining.size == 0:
+            return data_holder
+
+        # remaining splits are gathered at once and sliced
+        gathered = self.take_data(self.data, np.concatenate([order[starts[idx] : stops[idx]] for idx in remaining]))
+        offset = 0
+        for idx in remaining:
+            start, offset = offset, offset + int(counts[idx])
+            data_holder[splits[idx].label] = Data(
+                X=self.slice(gathered.X, start, offset),
+                y=self.slice(gathered.y, start, offset) if gathered.y is not None else None,
+            )
 
-    @staticmethod
-    def validate(data_type: str, split: DataSplit) -> bool:
-        return data_type == AllowedDataType.POLARS and split.column_name is not None
+        return data_holder
 
+    def split(self, splits: List[DataSplit]) -> Dict[str, Data]:
+        """Splits data
 
-class PolarsIndexSplitter(DataSplitterBase):
-    """Split Polars DataFrame by rows index"""
+        Args:
+            splits:
+                List of `DataSplit`
 
-    def create_split(self, data: pl.DataFrame) -> Tuple[str, Data]:
-        # slice
-        data = data[self.indices]
+        Returns:
+            Dictionary of split label and `Data`
+        """
+        data_holder: Dict[str, Data] = {}
+        column_splits: List[DataSplit] = []
 
-        if bool(self.dependent_vars):
-            x_cols = self.get_x_cols(columns=data.columns, dependent_vars=self.dependent_vars)
+        for split in splits:
+            if split.column_name is not None:
+                column_splits.append(split)
 
-            return self.split.label, Data(
-                X=data.select(x_cols),
-                y=data.select(self.dependent_vars),
-            )
+            elif split.indices is not None:
+                data_holder[split.label] = self.take_data(self.data, np.asarray(split.indices, dtype=np.int64))
 
-        return self.split.label, Data(X=data)
+            elif split.start is not None:
+                start, stop, _ = slice(split.start, split.stop).indices(self.num_rows)
+                data_holder[split.label] = self.to_data(self.slice(self.data, start, max(start, stop)))
 
-    @staticmethod
-    def validate(data_type: str, split: DataSplit) -> bool:
-        return data_type == AllowedDataType.POLARS and split.indices is not None
+            else:
+                raise ValueError(f"Data split {split.label} requires a column name, indices or a start row")
 
+        if column_splits:
+            data_holder.update(self._split_columns(column_splits))
 
-class PolarsRowsSplitter(DataSplitterBase):
-    """Split Polars DataFrame by rows slice"""
+        return {split.label: data_holder[split.label] for split in splits}
 
-    def create_split(self, data: pl.DataFrame) -> Tuple[str, Data]:
-        # slice
-        data = data[self.start : self.stop]
+    @staticmethod
+    def validate(data_type: str) -> bool:
+        raise NotImplementedError
 
-        if bool(self.dependent_vars):
-            x_cols = self.get_x_cols(columns=data.columns, dependent_vars=self.dependent_vars)
 
-            return self.split.label, Data(
-                X=data.select(x_cols),
-                y=data.select(self.dependent_vars),
-            )
+class PandasSplitEngine(SplitEngineBase):
+    def __init__(self, data: pd.DataFrame, dependent_vars: List[Union[int, str]]):
+        super().__init__(data, dependent_vars)
 
-        return self.split.label, Data(X=data)
+        # resolve columns once instead of per split
+        is_dependent = data.columns.isin(dependent_vars)
+        self.x_cols = data.columns[~is_dependent]
+        self.y_cols = data.columns[is_dependent]
 
-    @staticmethod
-    def validate(data_type: str, split: DataSplit) -> bool:
-        return data_type == AllowedDataType.POLARS and split.start is not None
+    def column_mask(self, split: DataSplit) -> NDArray[np.bool_]:
+        compare = _COLUMN_OPERATORS.get(split.inequality, _COLUMN_OPERATORS["<="])
+        mask: NDArray[np.bool_] = compare(self.data[split.column_name], split.column_value).to_numpy(
+            dtype=bool,
+            na_value=False,
+        )
+        return mask
 
+    def take(self, data: pd.DataFrame, indices: Union[List[int], NDArray[np.int64]]) -> pd.DataFrame:
+        return data.iloc[indices]
 
-class PandasIndexSplitter(DataSplitterBase):
-    def create_split(self, data: pd.DataFrame) -> Tuple[str, Data]:
-        data = data.iloc[self.indices]
+    def slice(self, data: pd.DataFrame, start: int, stop: int) -> pd.DataFrame:
+        return data.iloc[start:stop]
 
+    def to_data(self, data: pd.DataFrame) -> Data:
         if bool(self.dependent_vars):
-            x = data[data.columns[~data.columns.isin(self.dependent_vars)]]
-            y = data[data.columns[data.columns.isin(self.dependent_vars)]]
-
-            return self.split.label, Data(X=x, y=y)
+            return Data(X=data[self.x_cols], y=data[self.y_cols])
+        return Data(X=data)
 
-        return self.split.label, Data(X=data)
-
-    @staticmethod
-    def validate(data_type: str, split: DataSplit) -> bool:
-        return data_type == AllowedDataType.PANDAS and split.indices is not None
+    def take_data(self, data: pd.DataFrame, indices: Union[List[int], NDArray[np.int64]]) -> Data:
+        if not data.columns.is_unique:
+            return super().take_data(data, indices)
 
-
-class PandasRowSplitter(DataSplitterBase):
-    def create_split(self, data: pd.DataFrame) -> Tuple[str, Data]:
-        # slice
-        data = data[self.start : self.stop]
+        # take each column once instead of taking all columns and copying x and y out of the result
+        index = data.index[indices]
+        x = self._take_columns(data, self.x_cols, indices, index)
 
         if bool(self.dependent_vars):
-            x = data[data.columns[~data.columns.isin(self.dependent_vars)]]
-            y = data[data.columns[data.columns.isin(self.dependent_vars)]]
-
-            return self.split.label, Data(X=x, y=y)
-
-        return self.split.label, Data(X=data)
+            return Data(X=x, y=self._take_columns(data, self.y_cols, indices, index))
+        return Data(X=x)
 
     @staticmethod
-    def validate(data_type: str, split: DataSplit) -> bool:
-        return data_type == AllowedDataType.PANDAS and split.start is not None
+    def _take_columns(
+        data: pd.DataFrame,
+        columns: pd.Index,
+        indices: Union[List[int], NDArray[np.int64]],
+        index: pd.Index,
+    ) -> pd.DataFrame:
+        return pd.DataFrame(
+            {column: data[column].array.take(indices) for column in columns},
+            index=index,
+            copy=False,
+        )
 
+    @staticmethod
+    def validate(data_type: str) -> bool:
+        return data_type == AllowedDataType.PANDAS
 
-class PandasColumnSplitter(DataSplitterBase):
-    def create_split(self, data: pd.DataFrame) -> Tuple[str, Data]:
-        if self.split.inequality is None:
-            data = data[data[self.column_name] == self.column_value]
 
-        elif self.split.inequality == ">":
-            data = data[data[self.column_name] > self.column_value]
+class PolarsSplitEngine(SplitEngineBase):
+    def __init__(self, data: pl.DataFrame, dependent_vars: List[Union[int, str]]):
+        if isinstance(data, pl.LazyFrame):
+            raise ValueError("Polars LazyFrames must be collected before splitting")
+        super().__init__(data, dependent_vars)
 
-        elif self.split.inequality == ">=":
-            data = data[data[self.column_name] >= self.column_value]
+    def column_mask(self, split: DataSplit) -> NDArray[np.bool_]:
+        compare = _COLUMN_OPERATORS.get(split.inequality, _COLUMN_OPERATORS["<="])
+        mask: NDArray[np.bool_] = (
+            compare(self.data.get_column(str(split.column_name)), split.column_value).fill_null(False).to_numpy()
+        )
+        return mask
 
-        elif self.split.inequality == "<":
-            data = data[data[self.column_name] < self.column_value]
+    def take(self, data: pl.DataFrame, indices: Union[List[int], NDArray[np.int64]]) -> pl.DataFrame:
+        return data[indices]
 
-        else:
-            data = data[data[self.column_name] <= self.column_value]
+    def slice(self, data: pl.DataFrame, start: int, stop: int) -> pl.DataFrame:
+        return data.slice(start, stop - start)
 
+    def to_data(self, data: pl.DataFrame) -> Data:
         if bool(self.dependent_vars):
-            return self.split.label, Data(
-                X=data[data.columns[~data.columns.isin(self.dependent_vars)]],
-                y=data[data.columns[data.columns.isin(self.dependent_vars)]],
-            )
-
-        data_split = Data(X=data)
-        return self.split.label, data_split
+            x_cols = [column for column in data.columns if column not in self.dependent_vars]
+            return Data(X=data.select(x_cols), y=data.select(self.dependent_vars))
+        return Data(X=data)
 
     @staticmethod
-    def validate(data_type: str, split: DataSplit) -> bool:
-        return data_type == AllowedDataType.PANDAS and split.column_name is not None
+    def validate(data_type: str) -> bool:
+        return data_type == AllowedDataType.POLARS
 
 
-class PyArrowIndexSplitter(DataSplitterBase):
-    def create_split(self, data: pa.Table) -> Tuple[str, Data]:
-        return self.split.label, Data(X=data.take(self.indices))
+class PyArrowSplitEngine(SplitEngineBase):
+    @property
+    def num_rows(self) -> int:
+        return int(self.data.num_rows)
 
-    @staticmethod
-    def validate(data_type: str, split: DataSplit) -> bool:
-        return data_type == AllowedDataType.PYARROW and split.indices is not None
+    def column_mask(self, split: DataSplit) -> NDArray[np.bool_]:
+        function = _ARROW_COLUMN_FUNCTIONS.get(split.inequality, _ARROW_COLUMN_FUNCTIONS["<="])
+        mask = pc.call_function(function, [self.data.column(split.column_name), pa.scalar(split.column_value)])
+        return np.asarray(mask.fill_null(False).to_numpy(), dtype=bool)
 
+    def take(self, data: pa.Table, indices: Union[List[int], NDArray[np.int64]]) -> pa.Table:
+        return data.take(indices)
 
-class NumpyIndexSplitter(DataSplitterBase):
-    def create_split(self, data: NDArray[Any]) -> Tuple[str, Data]:
-        return self.split.label, Data(X=data[self.indices])
+    def slice(self, data: pa.Table, start: int, stop: int) -> pa.Table:
+        return data.slice(start, stop - start)
 
     @staticmethod
-    def validate(data_type: str, split: DataSplit) -> bool:
-        return data_type == AllowedDataType.NUMPY and split.indices is not None
+    def validate(data_type: str) -> bool:
+        return data_type == AllowedDataType.PYARROW
 
 
-class NumpyRowSplitter(DataSplitterBase):
-    def create_split(self, data: NDArray[Any]) -> Tuple[str, Data]:
-        data_split = data[self.start : self.stop]
-        return self.split.label, Data(X=data_split)
+class NumpySplitEngine(SplitEngineBase):
+    def column_mask(self, split: DataSplit) -> NDArray[np.bool_]:
+        raise ValueError("Column splits are not supported for numpy arrays")
+
+    def take(self, data: NDArray[Any], indices: Union[List[int], NDArray[np.int64]]) -> NDArray[Any]:
+        # lazily loaded zarr arrays only read the chunks of the selected rows
+        if hasattr(data, "oindex"):
+            return cast(NDArray[Any], data.oindex[indices])
+        return data[indices]
+
+    def slice(self, data: NDArray[Any], start: int, stop: int) -> NDArray[Any]:
+        return data[start:stop]
 
     @staticmethod
-    def validate(data_type: str, split: DataSplit) -> bool:
-        return data_type == AllowedDataType.NUMPY and split.start is not None
+    def validate(data_type: str) -> bool:
+        return data_type == AllowedDataType.NUMPY
 
 
 class DataSplitter:
     @staticmethod
     def split(
         split: DataSplit,
-        data: Union[pd.DataFrame, NDArray[Any], pl.DataFrame],
+        data: Union[pd.DataFrame, NDArray[Any], pl.DataFrame, pa.Table],
         data_type: str,
         dependent_vars: List[Union[int, str]],
     ) -> Tuple[str, Data]:
-        data_splitter = next(
-            (
-                data_splitter
-                for data_splitter in DataSplitterBase.__subclasses__()
-                if data_splitter.validate(
-                    data_type=data_type,
-                    split=split,
-                )
-            ),
+        """Splits data by a single data split. See `split_all`
+
+        Args:
+            split:
+                `DataSplit`
+            data:
+                Data to split
+            data_type:
+                Data type of data
+            dependent_vars:
+                List of dependent variables
+
+        Returns:
+            Tuple of split label and `Data`
+        """
+        splits = DataSplitter.split_all(splits=[split], data=data, data_type=data_type, dependent_vars=dependent_vars)
+        return split.label, splits[split.label]
+
+    @staticmethod
+    def split_all(
+        splits: List[DataSplit],
+        data: Union[pd.DataFrame, NDArray[Any], pl.DataFrame, pa.Table],
+        data_type: str,
+        dependent_vars: List[Union[int, str]],
+    ) -> Dict[str, Data]:
+        """Splits data by all data splits at once. See `SplitEngineBase`
+
+        Args:
+            splits:
+                List of `DataSplit`
+            data:
+                Data to split
+            data_type:
+                Data type of data
+            dependent_vars:
+                List of dependent variables
+
+        Returns:
+            Dictionary of split label and `Data`
+        """
+        engine = next(
+            (engine for engine in SplitEngineBase.__subclasses__() if engine.validate(data_type=data_type)),
             None,
         )
 
-        if data_splitter is not None:
-            return data_splitter(
-                split=split,
-                dependent_vars=dependent_vars,
-            ).create_split(data=data)
+        if engine is not None:
+            return engine(data=data, dependent_vars=dependent_vars).split(splits=splits)
 
-        raise ValueError("Failed to find data supporter that supports provided logic")
+        raise ValueError(f"Failed to find data splitter that supports data type {data_type}")
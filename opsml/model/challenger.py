@@ -8,8 +8,9 @@ from pydantic import BaseModel, ConfigDict, ValidationInfo, field_validator
 from opsml.cards.model import ModelCard
 from opsml.cards.run import RunCard
 from opsml.helpers.logging import ArtifactLogger
+from opsml.helpers.utils import TypeChecker
 from opsml.registry.registry import CardRegistries
-from opsml.types import CardInfo, Metric
+from opsml.types import CardInfo, Metric, RunCardRegistry
 
 logger = ArtifactLogger.get_logger()
 
@@ -140,9 +141,43 @@ class ModelChallenger:
 
         return champion_record
 
+    def _get_runcard_metrics(self, runcard_uids: List[str], metric_name: str) -> Dict[str, Metric]:
+        """
+        Gets a metric for a list of RunCards
+
+        Args:
+            runcard_uids:
+                RunCard uids
+            metric_name:
+                Name of metric
+
+        Returns:
+            Dictionary of RunCard uid and metric
+        """
+        # metrics are stored in the metric table, so runcards only need to be loaded
+        # from storage for runs that have no metric records
+        registry = cast(RunCardRegistry, self._registries.run._registry)  # pylint: disable=protected-access
+        metric_key = TypeChecker.replace_spaces(metric_name)
+
+        unique_uids = list(dict.fromkeys(runcard_uids))
+
+        metrics: Dict[str, Metric] = {}
+        for record in registry.get_run_metrics(run_uids=unique_uids, name=[metric_key]):
+            # keep the first metric returned for each run
+            metrics.setdefault(record["run_uid"], Metric(**record))
+
+        missing_uids = [runcard_uid for runcard_uid in unique_uids if runcard_uid not in metrics]
+
+        if missing_uids:
+            for runcard in self._registries.run.load_cards(uids=missing_uids):
+                metric = cast(RunCard, runcard).get_metric(name=metric_name)
+                metrics[str(runcard.uid)] = metric[0] if isinstance(metric, list) else metric
+
+        return metrics
+
     def _get_runcard_metric(self, runcard_uid: str, metric_name: str) -> Metric:
         """
-        Loads a RunCard from uid
+        Gets a metric from a RunCard
 
         Args:
             runcard_uid:
@@ -151,13 +186,7 @@ class ModelChallenger:
                 Name of metric
 
         """
-        runcard = cast(RunCard, self._registries.run.load_card(uid=runcard_uid))
-        metric = runcard.get_metric(name=metric_name)
-
-        if isinstance(metric, list):
-            metric = metric[0]
-
-        return metric
+        return self._get_runcard_metrics(runcard_uids=[runcard_uid], metric_name=metric_name)[runcard_uid]
 
     def _battle(self, champion: CardInfo, champion_metric: Metric, lower_is_better: bool) -> BattleReport:
         """
@@ -223,26 +252,36 @@ class ModelChallenger:
         lower_is_better: bool,
     ) -> List[BattleReport]:
         """Loops through and creates a `BattleReport` for each champion"""
-        battle_reports = []
+        champion_cards = []
+
+        # champions referenced by uid are retrieved in a single query
+        champion_uids = [champion.uid for champion in champions if champion.uid is not None]
+        records = self._registries.model.list_cards(uids=champion_uids) if champion_uids else []
+        records_by_uid = {record["uid"]: record for record in records}
 
         for champion in champions:
-            champion_record = self._registries.model.list_cards(
-                info=champion,
-            )
+            if champion.uid is not None:
+                champion_record = [records_by_uid[champion.uid]] if champion.uid in records_by_uid else []
+            else:
+                champion_record = self._registries.model.list_cards(info=champion)
 
             if not bool(champion_record):
                 raise ValueError(f"Champion model does not exist. {champion}")
 
             champion_card = champion_record[0]
-            runcard_uid = champion_card.get("runcard_uid")
-            if runcard_uid is None:
+            if champion_card.get("runcard_uid") is None:
                 raise ValueError(f"No RunCard associated with champion: {champion}")
 
-            champion_metric = self._get_runcard_metric(
-                runcard_uid=runcard_uid,
-                metric_name=metric_name,
-            )
+            champion_cards.append(champion_card)
+
+        # champion metrics are retrieved together so runcards are only loaded once
+        champion_metrics = self._get_runcard_metrics(
+            runcard_uids=[card["runcard_uid"] for card in champion_cards],
+            metric_name=metric_name,
+        )
 
+        battle_reports = []
+        for champion, champion_card in zip(champions, champion_cards):
             # update name, repository and version in case of None
             champion.name = champion.name or champion_card.get("name")
             champion.repository = champion.repository or champion_card.get("repository")
@@ -251,7 +290,7 @@ class ModelChallenger:
             battle_reports.append(
                 self._battle(
                     champion=champion,
-                    champion_metric=champion_metric,
+                    champion_metric=champion_metrics[champion_card["runcard_uid"]],
                     lower_is_better=lower_is_better,
                 )
             )
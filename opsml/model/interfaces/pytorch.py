@@ -1,6 +1,7 @@
+import json
 import tempfile
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union, cast
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union, cast
 
 import joblib
 from pydantic import model_validator
@@ -27,6 +28,123 @@ try:
 
     ValidData = Union[torch.Tensor, Dict[str, torch.Tensor], List[torch.Tensor], Tuple[torch.Tensor]]
 
+    SAFETENSORS_WEIGHTS = "model.safetensors"
+    SAFETENSORS_INDEX = "model.safetensors.index.json"
+
+    def _shard_state_dict(
+        state_dict: Dict[str, torch.Tensor],
+        max_shard_size: Optional[int],
+    ) -> List[Dict[str, torch.Tensor]]:
+        """Greedily splits a state dict into shards of at most max_shard_size bytes.
+        A tensor larger than max_shard_size gets its own shard"""
+        shards: List[Dict[str, torch.Tensor]] = [{}]
+        shard_size = 0
+
+        for name, tensor in state_dict.items():
+            size = tensor.numel() * tensor.element_size()
+            if max_shard_size is not None and shard_size > 0 and shard_size + size > max_shard_size:
+                shards.append({})
+                shard_size = 0
+
+            shards[-1][name] = tensor
+            shard_size += size
+
+        return shards
+
+    def save_safetensors(
+        state_dict: Dict[str, torch.Tensor],
+        path: Path,
+        max_shard_size: Optional[int] = None,
+    ) -> None:
+        """Saves a state dict to a directory of safetensors files
+
+        Args:
+            state_dict:
+                Torch state dict
+            path:
+                Directory to save to. Contains a single `model.safetensors` file, or shards and a
+                `model.safetensors.index.json` mapping each tensor to its shard if max_shard_size is exceeded
+            max_shard_size:
+                Optional maximum shard size in bytes
+        """
+        from safetensors.torch import save_file
+
+        path.mkdir(parents=True, exist_ok=True)
+
+        # safetensors can't save tensors that share memory (e.g. tied weights), so shared tensors are copied
+        tensors: Dict[str, torch.Tensor] = {}
+        storages: Set[int] = set()
+        for name, tensor in state_dict.items():
+            tensor = tensor.detach().contiguous()
+            storage = tensor.untyped_storage().data_ptr()
+            if storage in storages:
+                tensor = tensor.clone()
+            storages.add(storage)
+            tensors[name] = tensor
+
+        shards = _shard_state_dict(tensors, max_shard_size)
+        if len(shards) == 1:
+            save_file(shards[0], path / SAFETENSORS_WEIGHTS, metadata={"format": "pt"})
+            return
+
+        weight_map: Dict[str, str] = {}
+        for idx, shard in enumerate(shards, start=1):
+            filename = f"model-{idx:05d}-of-{len(shards):05d}{Suffix.SAFETENSORS.value}"
+            save_file(shard, path / filename, metadata={"format": "pt"})
+            weight_map.update({name: filename for name in shard})
+
+        index = {
+            "metadata": {"total_size": sum(t.numel() * t.element_size() for t in tensors.values())},
+            "weight_map": weight_map,
+        }
+        (path / SAFETENSORS_INDEX).write_text(json.dumps(index, indent=2), encoding="utf-8")
+
+    def _get_weight_map(path: Path) -> Dict[str, str]:
+        """Returns a mapping of tensor name -> safetensors file in a directory saved with `save_safetensors`"""
+        index_path = path / SAFETENSORS_INDEX
+        if index_path.exists():
+            weight_map: Dict[str, str] = json.loads(index_path.read_text(encoding="utf-8"))["weight_map"]
+            return weight_map
+
+        from safetensors import safe_open
+
+        with safe_open(str(path / SAFETENSORS_WEIGHTS), framework="pt") as file_:
+            return {name: SAFETENSORS_WEIGHTS for name in file_.keys()}
+
+    def _read_safetensors(path: Path, weight_map: Dict[str, str]) -> Iterator[Tuple[str, torch.Tensor]]:
+        """Reads tensors one at a time from memory mapped safetensors files. Only files that
+        contain a tensor in weight_map are opened"""
+        from safetensors import safe_open
+
+        files: Dict[str, List[str]] = {}
+        for name, filename in weight_map.items():
+            files.setdefault(filename, []).append(name)
+
+        for filename, names in files.items():
+            with safe_open(str(path / filename), framework="pt", device="cpu") as file_:
+                for name in names:
+                    yield name, file_.get_tensor(name)
+
+    def load_safetensors(path: Path, names: Optional[List[str]] = None) -> Dict[str, torch.Tensor]:
+        """Loads tensors from a directory saved with `save_safetensors`
+
+        Args:
+            path:
+                Directory containing safetensors files
+            names:
+                Optional list of tensor names to load. Only these tensors (and only the shards that contain
+                them) are read. Defaults to all tensors
+        """
+        weight_map = _get_weight_map(path)
+
+        if names is not None:
+            missing = [name for name in names if name not in weight_map]
+            if missing:
+                raise ValueError(f"Tensors {missing} not found in {path}")
+            weight_map = {name: weight_map[name] for name in names}
+
+        return dict(_read_safetensors(path, weight_map))
+
     class TorchModel(ModelInterface):
         """Model interface for Pytorch models.
 
@@ -150,7 +268,10 @@ try:
             """
             assert self.model is not None, "No model found"
 
-            if self.save_args.as_state_dict:
+            if self.save_args.as_safetensors:
+                save_safetensors(self.model.state_dict(), path, self.save_args.max_shard_size)
+
+            elif self.save_args.as_state_dict:
                 torch.save(self.model.state_dict(), path)
             else:
                 torch.save(self.model, path)
@@ -166,7 +287,12 @@ try:
             """
             model_arch = kwargs.get(CommonKwargs.MODEL_ARCH.value)
 
-            if model_arch is not None:
+            if self.save_args.as_safetensors:
+                if model_arch is None:
+                    raise ValueError("model_arch is required to load a model saved as safetensors")
+                self._load_safetensors_model(model_arch, path)
+
+            elif model_arch is not None:
                 model_arch.load_state_dict(torch.load(path))
                 model_arch.eval()
                 self.model = model_arch
@@ -174,6 +300,42 @@ try:
             else:
                 self.model = torch.load(path)
 
+        def _load_safetensors_model(self, model_arch: torch.nn.Module, path: Path) -> None:
+            """Copies safetensors weights into a model architecture one tensor at a time, so peak memory
+            is the model plus the largest tensor rather than the model plus a full state dict"""
+            state_dict = model_arch.state_dict()
+            weight_map = _get_weight_map(path)
+
+            missing = [name for name in state_dict if name not in weight_map]
+            unexpected = [name for name in weight_map if name not in state_dict]
+            if missing or unexpected:
+                raise ValueError(
+                    f"Safetensors weights don't match model_arch. Missing: {missing}. Unexpected: {unexpected}"
+                )
+
+            with torch.no_grad():
+                for name, tensor in _read_safetensors(path, weight_map):
+                    state_dict[name].copy_(tensor)
+
+            model_arch.eval()
+            self.model = model_arch
+
+        @staticmethod
+        def load_tensors(path: Path, names: Optional[List[str]] = None) -> Dict[str, torch.Tensor]:
+            """Lazily loads tensors by name from a model saved as safetensors without loading the model
+
+            Args:
+                path:
+                    Path to saved model directory
+                names:
+                    Optional list of tensor names to load. Only the shards that contain them are read.
+                    Defaults to all tensors
+
+            Returns:
+                Dictionary of tensor name -> tensor
+            """
+            return load_safetensors(path, names)
+
         def save_onnx(self, path: Path) -> ModelReturn:
             """Saves an onnx model
 
@@ -249,6 +411,8 @@ try:
         @property
         def model_suffix(self) -> str:
             """Returns suffix for storage"""
+            if self.save_args.as_safetensors:
+                return Suffix.NONE.value
             return Suffix.PT.value
 
         @staticmethod
@@ -3,20 +3,25 @@
 # This source code is licensed under the MIT license found in the
 # LICENSE file in the root directory of this source tree.
 import textwrap
-from typing import Any, Dict, List, Optional, Type, Union
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Type, Union, cast
 
-from opsml.cards import ArtifactCard, CardInfo
+from opsml.cards import ArtifactCard, CardInfo, ModelCard
 from opsml.data import DataInterface
 from opsml.helpers.logging import ArtifactLogger
 from opsml.helpers.utils import clean_string
 from opsml.model import ModelInterface
 from opsml.registry.backend import _set_registry
 from opsml.registry.semver import VersionType
-from opsml.storage.card_loader import CardLoader
-from opsml.types import CommonKwargs, RegistryType
+from opsml.settings.config import config
+from opsml.storage.card_loader import PREFETCH_ARTIFACTS, CardLoader, ModelCardLoader
+from opsml.types import CommonKwargs, LineageDirection, RegistryType
 
 logger = ArtifactLogger.get_logger()
 
+# max number of uids in a single `uid IN (...)` query
+UID_BATCH_SIZE = 500
+
 
 class CardRegistry:
     def __init__(self, registry_type: Union[RegistryType, str]):
@@ -64,6 +69,9 @@ class CardRegistry:
         max_date: Optional[str] = None,
         limit: Optional[int] = None,
         ignore_release_candidates: bool = False,
+        match_all_tags: bool = True,
+        columns: Optional[List[str]] = None,
+        uids: Optional[List[str]] = None,
     ) -> List[Dict[str, Any]]:
         """Retrieves records from registry
 
@@ -87,6 +95,14 @@ class CardRegistry:
                 CardInfo object. If present, the info object takes precedence
             ignore_release_candidates:
                 If True, ignores release candidates
+            match_all_tags:
+                If True, cards must match all tags. If False, cards matching any tag are returned
+            columns:
+                Optional subset of record columns to return (e.g. ["name", "version", "uid"]).
+                Only these columns are queried, which is much cheaper than retrieving full records.
+                Version is always returned.
+            uids:
+                Optional list of card uids to retrieve in a single query
 
         Returns:
             pandas dataframe of records or list of dictionaries
@@ -105,7 +121,7 @@ class CardRegistry:
         if repository is not None:
             repository = repository.lower()
 
-        if all(not bool(var) for var in [name, repository, version, uid, tags]):
+        if all(not bool(var) for var in [name, repository, version, uid, tags, uids]):
             limit = limit or 25
 
         card_list = self._registry.list_cards(
@@ -117,6 +133,9 @@ class CardRegistry:
             limit=limit,
             tags=tags,
             ignore_release_candidates=ignore_release_candidates,
+            match_all_tags=match_all_tags,
+            columns=columns,
+            uids=uids,
         )
 
         return card_list
@@ -131,6 +150,7 @@ class CardRegistry:
         info: Optional[CardInfo] = None,
         ignore_release_candidates: bool = False,
         interface: Optional[Union[Type[ModelInterface], Type[DataInterface]]] = None,
+        lazy: bool = False,
     ) -> ArtifactCard:
         """Loads a specific card
 
@@ -154,6 +174,9 @@ class CardRegistry:
             interface:
                 Optional interface to use for loading card. This is required for when using
                 subclassed interfaces.
+            lazy:
+                If True, returns a card built from the registry record. The card is only loaded
+                from storage when a field that is not stored in the registry is accessed
 
         Returns
             ArtifactCard
@@ -178,10 +201,126 @@ class CardRegistry:
             limit=1,
         )
 
-        return CardLoader(
+        loader = CardLoader(
             card_args=records[0],
             registry_type=self.registry_type,
-        ).load_card(interface=interface)
+        )
+
+        if lazy:
+            return loader.load_lazy_card(interface=interface)
+        return loader.load_card(interface=interface)
+
+    def load_cards(
+        self,
+        uids: List[str],
+        interface: Optional[Union[Type[ModelInterface], Type[DataInterface]]] = None,
+        lazy: bool = False,
+        max_workers: int = 8,
+    ) -> List[ArtifactCard]:
+        """Loads multiple cards by uid. Records are retrieved with batched `uid IN (...)` queries
+        and cards are loaded from storage concurrently.
+
+        Args:
+            uids:
+                List of card uids to load
+            interface:
+                Optional interface to use for loading cards. This is required for when using
+                subclassed interfaces.
+            lazy:
+                If True, returns cards built from registry records. See `load_card`
+            max_workers:
+                Number of threads used to load cards
+
+        Returns:
+            List of ArtifactCards in the same order as uids
+        """
+        unique_uids = list(dict.fromkeys(uids))
+
+        records: Dict[str, Dict[str, Any]] = {}
+        for idx in range(0, len(unique_uids), UID_BATCH_SIZE):
+            for record in self._registry.list_cards(uids=unique_uids[idx : idx + UID_BATCH_SIZE]):
+                records[record["uid"]] = record
+
+        missing_uids = [uid for uid in unique_uids if uid not in records]
+        if missing_uids:
+            raise ValueError(f"Cards not found in {self.table_name}: {missing_uids}")
+
+        def _load_card(uid: str) -> ArtifactCard:
+            loader = CardLoader(card_args=records[uid], registry_type=self.registry_type)
+
+            if lazy:
+                return loader.load_lazy_card(interface=interface)
+            return loader.load_card(interface=interface)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            cards = dict(zip(unique_uids, executor.map(_load_card, unique_uids)))
+
+        return [cards[uid] for uid in uids]
+
+    def prefetch(
+        self,
+        infos: List[CardInfo],
+        artifacts: Sequence[str] = ("onnx", "preprocessor"),
+        create_sessions: bool = False,
+        max_workers: int = 4,
+    ) -> List[Future[ModelCard]]:
+        """Loads ModelCards and downloads their artifacts in the background. Artifacts are downloaded
+        to the local artifact cache (`opsml_artifact_cache_dir`), so later loads of the same cards
+        read from local disk.
+
+        Args:
+            infos:
+                List of CardInfo for the model cards to prefetch
+            artifacts:
+                Artifacts to download. Any of "model", "onnx", "preprocessor", "sample_data"
+            create_sessions:
+                If True, artifacts are also loaded into each card's interface. This creates the
+                onnx runtime session when "onnx" is requested. The preprocessor is loaded together
+                with the onnx model or model
+            max_workers:
+                Number of cards to prefetch concurrently
+
+        Returns:
+            List of futures that resolve to the prefetched ModelCards, in the same order as infos
+
+        Example:
+            futures = model_registry.prefetch(infos=[CardInfo(name="model", repository="mlops")])
+            modelcard = futures[0].result()
+        """
+        if self.registry_type != RegistryType.MODEL:
+            raise ValueError("Prefetching is only supported for the model registry")
+
+        unsupported = [artifact for artifact in artifacts if artifact not in PREFETCH_ARTIFACTS]
+        if unsupported:
+            raise ValueError(f"Unsupported artifacts {unsupported}. Expected any of {PREFETCH_ARTIFACTS}")
+
+        if not create_sessions and config.opsml_artifact_cache_dir is None:
+            raise ValueError("opsml_artifact_cache_dir must be set to prefetch artifacts without creating sessions")
+
+        def _prefetch(info: CardInfo) -> ModelCard:
+            card = cast(ModelCard, self.load_card(info=info, repository=info.repository))
+
+            if config.opsml_artifact_cache_dir is not None:
+                ModelCardLoader(card).prefetch(artifacts)
+
+            if create_sessions:
+                load_preprocessor = "preprocessor" in artifacts
+
+                if "onnx" in artifacts:
+                    card.load_onnx_model(load_preprocessor=load_preprocessor)
+
+                if "model" in artifacts or "sample_data" in artifacts:
+                    card.load_model(load_preprocessor=load_preprocessor)
+
+            return card
+
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        futures = [executor.submit(_prefetch, info) for info in infos]
+
+        # workers keep running in the background until all cards are prefetched
+        executor.shutdown(wait=False)
+
+        return futures
 
     def register_card(
         self,
@@ -249,7 +388,7 @@ class CardRegistry:
         Returns:
             Dictionary of column, values pairs
         """
-        results = self._registry.list_cards(uid=uid)[0]
+        results = self._registry.list_cards(uid=uid, columns=columns)[0]
         return {col: results[col] for col in columns}
 
     def delete_card(self, card: ArtifactCard) -> None:
@@ -262,6 +401,89 @@ class CardRegistry:
         """
         return self._registry.delete_card(card)
 
+    def lineage(
+        self,
+        uid: str,
+        direction: Union[LineageDirection, str] = LineageDirection.DOWNSTREAM,
+        depth: int = 10,
+    ) -> List[Dict[str, Any]]:
+        """
+        Retrieves the lineage of a card across all registries with a single recursive query
+
+        Args:
+            uid:
+                Uid of the card
+            direction:
+                "downstream" returns cards derived from the card (e.g. models trained on a DataCard).
+                "upstream" returns cards the card was derived from.
+            depth:
+                Max number of edges to walk
+
+        Returns:
+            List of lineage edges. Each edge contains parent_uid, parent_registry, child_uid,
+            child_registry and the depth at which the edge was reached.
+
+        Example:
+            edges = data_registry.lineage(uid=datacard.uid, direction="downstream")
+            impacted = {edge["child_uid"] for edge in edges}
+        """
+        return self._registry.lineage(uid=uid, direction=LineageDirection(direction), depth=depth)
+
+    def watch(
+        self,
+        name: Optional[str] = None,
+        repository: Optional[str] = None,
+        since: Optional[int] = None,
+        timeout: float = 30,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Watches the registry for card changes (registered, updated, deleted). Changes are retrieved
+        via long-polling, so new changes are typically yielded within a second of being recorded.
+        The iterator never ends on its own.
+
+        Args:
+            name:
+                Optional card name to watch
+            repository:
+                Optional repository to watch
+            since:
+                Cursor to start watching from. Each change contains a "cursor" that can be used
+                to resume watching. If not provided, the latest cursor is retrieved when watch is called,
+                so only changes made after calling watch are returned.
+            timeout:
+                Max seconds for each long-poll request to wait for changes
+
+        Returns:
+            Iterator of card change dictionaries
+
+        Example:
+            for change in model_registry.watch(name="my-model"):
+                if change["action"] == "registered":
+                    deploy(change["uid"])
+        """
+        if since is None:
+            since = self._registry.get_card_changes()["cursor"]
+
+        return self._iter_changes(cursor=since, name=name, repository=repository, timeout=timeout)
+
+    def _iter_changes(
+        self,
+        cursor: int,
+        name: Optional[str],
+        repository: Optional[str],
+        timeout: float,
+    ) -> Iterator[Dict[str, Any]]:
+        """Long-polls the registry for card changes after a cursor"""
+        while True:
+            result = self._registry.get_card_changes(
+                since=cursor,
+                name=name,
+                repository=repository,
+                timeout=timeout,
+            )
+            yield from result["changes"]
+            cursor = result["cursor"]
+
 
 class CardRegistries:
     def __init__(self) -> None:
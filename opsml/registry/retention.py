@@ -0,0 +1,348 @@
+# pylint: disable=protected-access
+# Copyright (c) Shipt, Inc.
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, cast
+
+from pydantic import BaseModel
+from semver import VersionInfo
+
+from opsml.helpers.logging import ArtifactLogger
+from opsml.registry.registry import CardRegistries, CardRegistry
+from opsml.registry.semver import SemVerUtils
+from opsml.settings.config import config
+from opsml.storage import client
+from opsml.storage.client import ApiStorageClient, StorageClient
+from opsml.types import RegistryTableNames, RegistryType
+
+logger = ArtifactLogger.get_logger()
+
+
+class RetentionPolicy(BaseModel):
+    """Rules used to select card versions for deletion. Rules are applied per card name and repository.
+
+    Args:
+        keep_last:
+            Keep the N most recent versions (by SemVer) of each card. Older versions are deleted.
+        max_release_candidate_age_days:
+            Delete release candidates older than this many days, regardless of `keep_last`
+        name:
+            Only apply the policy to cards with this name
+        repository:
+            Only apply the policy to cards in this repository
+        protect_audited:
+            Never delete cards that are referenced by an AuditCard
+        protect_registered_models:
+            Never delete ModelCards that have been registered to the model registry path by the ModelRegistrar
+    """
+
+    keep_last: Optional[int] = None
+    max_release_candidate_age_days: Optional[float] = None
+    name: Optional[str] = None
+    repository: Optional[str] = None
+    protect_audited: bool = True
+    protect_registered_models: bool = True
+
+
+class RetentionReport(BaseModel):
+    dry_run: bool
+    cards: List[Dict[str, Any]] = []
+    protected: List[Dict[str, Any]] = []
+    orphans: List[str] = []
+    deleted: List[str] = []
+    failed: Dict[str, str] = {}
+
+
+class _RateLimiter:
+    def __init__(self, rate: Optional[float] = None):
+        """Limits the number of calls per second across threads
+
+        Args:
+            rate:
+                Max calls per second. If None, calls are not limited
+        """
+        self._interval = 1 / rate if rate else 0.0
+        self._next_call = time.monotonic()
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        if not self._interval:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            wait_time = self._next_call - now
+            self._next_call = max(now, self._next_call) + self._interval
+
+        if wait_time > 0:
+            time.sleep(wait_time)
+
+
+def _card_uri(table_name: str, record: Dict[str, Any]) -> Path:
+    return Path(config.storage_root, table_name, record["repository"], record["name"], f"v{record['version']}")
+
+
+class RetentionManager:
+    def __init__(
+        self,
+        registries: Optional[CardRegistries] = None,
+        storage_client: Optional[StorageClient] = None,
+        max_workers: int = 8,
+        max_deletes_per_second: Optional[float] = None,
+    ):
+        """Applies retention policies to registries and removes orphaned card artifacts from storage.
+
+        Args:
+            registries:
+                Card registries to apply policies to. Defaults to a new set of registries
+            storage_client:
+                Storage client used to scan and delete artifacts. Defaults to the global storage client
+            max_workers:
+                Number of threads used to delete cards and artifacts
+            max_deletes_per_second:
+                Optional limit on the number of deletes issued per second
+
+        Example:
+            manager = RetentionManager(max_deletes_per_second=10)
+            report = manager.apply(RegistryType.MODEL, RetentionPolicy(keep_last=5), dry_run=True)
+        """
+        self.registries = registries or CardRegistries()
+        self.storage_client = storage_client or client.storage_client
+        self.max_workers = max_workers
+        self._rate_limiter = _RateLimiter(rate=max_deletes_per_second)
+
+    def _get_registry(self, registry_type: RegistryType) -> CardRegistry:
+        return cast(CardRegistry, getattr(self.registries, registry_type.value))
+
+    def _audited_cards(self) -> Tuple[Set[Tuple[str, str, str]], Set[str]]:
+        """Returns the (card_type, name, version) of all cards referenced by AuditCards and the audit uids"""
+        audits = self.registries.audit._registry.list_cards(columns=["uid", "datacards", "modelcards", "runcards"])
+
+        audited = set()
+        for audit in audits:
+            for cards in (audit["datacards"], audit["modelcards"], audit["runcards"]):
+                for card in cards or []:
+                    audited.add((card["card_type"], card["name"], card["version"]))
+
+        return audited, {audit["uid"] for audit in audits}
+
+    def _registered_models(self) -> Set[Tuple[str, str, str]]:
+        """Returns the (repository, name, version) of all models registered by the ModelRegistrar"""
+        registry_root = Path(config.storage_root, config.opsml_registry_path)
+
+        try:
+            files = self.storage_client.find(registry_root)
+        except OSError:
+            return set()
+
+        # registered paths are {storage_root}/{registry_path}/{repository}/{name}/v{version}/...
+        registered = set()
+        for file in files:
+            if config.opsml_registry_path not in file.parts:
+                continue
+
+            idx = file.parts.index(config.opsml_registry_path)
+            parts = file.parts[idx + 1 : idx + 4]
+            if len(parts) == 3:
+                registered.add((parts[0], parts[1], parts[2][1:]))
+
+        return registered
+
+    def select_cards(
+        self,
+        registry_type: RegistryType,
+        policy: RetentionPolicy,
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Selects the cards of a registry to delete based on a retention policy
+
+        Args:
+            registry_type:
+                Registry to apply the policy to
+            policy:
+                Retention policy
+
+        Returns:
+            Tuple of cards to delete and cards that matched the policy but are protected
+        """
+        registry = self._get_registry(registry_type)
+        columns = ["uid", "name", "repository", "version", "timestamp"]
+        if registry_type in [RegistryType.DATA, RegistryType.MODEL]:
+            columns.append("auditcard_uid")
+
+        # query the underlying registry to avoid the default list limit
+        records = registry._registry.list_cards(name=policy.name, repository=policy.repository, columns=columns)
+
+        rc_cutoff = None
+        if policy.max_release_candidate_age_days is not None:
+            rc_cutoff = (time.time() - policy.max_release_candidate_age_days * 86_400) * 1_000_000
+
+        def _card_key(record: Dict[str, Any]) -> Tuple[str, str]:
+            return record["repository"], record["name"]
+
+        selected = []
+        for _, group in groupby(sorted(records, key=_card_key), key=_card_key):
+            versions = sorted(group, key=lambda record: VersionInfo.parse(record["version"]), reverse=True)
+
+            for idx, record in enumerate(versions):
+                expired = policy.keep_last is not None and idx >= policy.keep_last
+                stale_rc = (
+                    rc_cutoff is not None
+                    and SemVerUtils.is_release_candidate(record["version"])
+                    and (record["timestamp"] or 0) < rc_cutoff
+                )
+                if expired or stale_rc:
+                    selected.append(record)
+
+        if not selected:
+            return [], []
+
+        # AuditCards reference cards by name and version
+        audited: Set[Tuple[str, str]] = set()
+        audit_uids: Set[str] = set()
+        if policy.protect_audited:
+            audited_cards, audit_uids = self._audited_cards()
+            audited = {
+                (name, version) for card_type, name, version in audited_cards if card_type == registry_type.value
+            }
+
+        registered: Set[Tuple[str, str, str]] = set()
+        if policy.protect_registered_models and registry_type == RegistryType.MODEL:
+            registered = self._registered_models()
+
+        to_delete, protected = [], []
+        for record in selected:
+            if (
+                record.get("auditcard_uid") in audit_uids
+                or (record["name"], record["version"]) in audited
+                or (record["repository"], record["name"], record["version"]) in registered
+            ):
+                protected.append(record)
+            else:
+                to_delete.append(record)
+
+        return to_delete, protected
+
+    def find_orphans(self, registry_type: RegistryType) -> List[Path]:
+        """Finds card artifact directories in storage that have no matching registry record. These are
+        typically left behind by failed registrations where artifacts were saved but the record was never written.
+
+        Note:
+            Artifacts are saved before the registry record is written, so a registration that is in progress
+            while scanning will show up as an orphan. Avoid scanning while cards are actively being registered.
+
+        Args:
+            registry_type:
+                Registry to scan
+
+        Returns:
+            List of orphaned card directories
+        """
+        if isinstance(self.storage_client, ApiStorageClient):
+            raise ValueError("Orphan scanning requires direct storage access and is not supported in client mode")
+
+        table_name = RegistryTableNames.from_str(registry_type.value).value
+        registry_root = Path(config.storage_root, table_name)
+
+        records = self._get_registry(registry_type)._registry.list_cards(columns=["name", "repository"])
+        expected = {(record["repository"], record["name"], f"v{record['version']}") for record in records}
+
+        if not self.storage_client.exists(registry_root):
+            return []
+
+        orphans = []
+        for repository_path in self.storage_client.ls(registry_root):
+            for name_path in self.storage_client.ls(repository_path):
+                for version_path in self.storage_client.ls(name_path):
+                    if (repository_path.name, name_path.name, version_path.name) not in expected:
+                        orphans.append(version_path)
+
+        return orphans
+
+    def _run_deletes(self, tasks: Dict[str, Callable[[], None]], report: RetentionReport) -> None:
+        """Runs delete tasks concurrently, respecting the rate limit
+
+        Args:
+            tasks:
+                Mapping of task id to delete function
+            report:
+                Report to record results to
+        """
+
+        def _run(task_id: str) -> None:
+            self._rate_limiter.wait()
+            try:
+                tasks[task_id]()
+                report.deleted.append(task_id)
+            except Exception as error:  # pylint: disable=broad-except
+                logger.error("Failed to delete {}: {}", task_id, error)
+                report.failed[task_id] = str(error)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            list(executor.map(_run, tasks))
+
+    def _delete_card(self, registry: CardRegistry, record: Dict[str, Any]) -> None:
+        # delete card record before storage artifacts (there will be loading issues if objects are deleted but not the record)
+        registry._registry.delete_card_record(card={key: record[key] for key in ["uid", "name", "version"]})
+
+        try:
+            self.storage_client.rm(_card_uri(registry._registry.table_name, record))
+        except FileNotFoundError:
+            pass
+
+    def apply(
+        self,
+        registry_type: RegistryType,
+        policy: Optional[RetentionPolicy] = None,
+        include_orphans: bool = False,
+        dry_run: bool = True,
+    ) -> RetentionReport:
+        """Applies a retention policy to a registry and optionally removes orphaned artifacts
+
+        Args:
+            registry_type:
+                Registry to apply the policy to
+            policy:
+                Optional retention policy
+            include_orphans:
+                Whether to also remove orphaned card artifacts from storage
+            dry_run:
+                If True, nothing is deleted and the report lists what would be deleted
+
+        Returns:
+            `RetentionReport`
+        """
+        report = RetentionReport(dry_run=dry_run)
+        registry = self._get_registry(registry_type)
+        tasks: Dict[str, Callable[[], None]] = {}
+
+        if policy is not None:
+            report.cards, report.protected = self.select_cards(registry_type=registry_type, policy=policy)
+
+            for record in report.cards:
+                tasks[record["uid"]] = lambda record=record: self._delete_card(registry, record)  # type: ignore
+
+        if include_orphans:
+            orphans = self.find_orphans(registry_type=registry_type)
+            report.orphans = [orphan.as_posix() for orphan in orphans]
+
+            for orphan in orphans:
+                tasks[orphan.as_posix()] = lambda orphan=orphan: self.storage_client.rm(orphan)  # type: ignore
+
+        logger.info(
+            "Retention for {}: {} cards, {} orphans, {} protected (dry_run={})",
+            registry_type.value,
+            len(report.cards),
+            len(report.orphans),
+            len(report.protected),
+            dry_run,
+        )
+
+        if not dry_run:
+            self._run_deletes(tasks=tasks, report=report)
+
+        return report
@@ -17,7 +17,7 @@ from opsml.registry.sql.base.registry_base import SQLRegistryBase
 from opsml.registry.sql.base.utils import log_card_change
 from opsml.storage.api import RequestType, api_routes
 from opsml.storage.client import ApiStorageClient, StorageClient
-from opsml.types import RegistryType
+from opsml.types import LineageDirection, RegistryType
 
 logger = ArtifactLogger.get_logger()
 
@@ -138,6 +138,9 @@ class ClientRegistry(SQLRegistryBase):
         limit: Optional[int] = None,
         ignore_release_candidates: bool = False,
         query_terms: Optional[Dict[str, Any]] = None,
+        match_all_tags: bool = True,
+        columns: Optional[List[str]] = None,
+        uids: Optional[List[str]] = None,
     ) -> pd.DataFrame:
         """
         Retrieves records from registry
@@ -161,6 +164,12 @@ class ClientRegistry(SQLRegistryBase):
                 If True, release candidates will be ignored
             query_terms:
                 Dictionary of query terms to filter by
+            match_all_tags:
+                If True, cards must match all tags. If False, cards matching any tag are returned
+            columns:
+                Optional subset of columns to return. Version is always returned.
+            uids:
+                Optional list of card uids to return
 
         Returns:
             Dictionary of card records
@@ -179,6 +188,9 @@ class ClientRegistry(SQLRegistryBase):
                 "registry_type": self.registry_type.value,
                 "ignore_release_candidates": ignore_release_candidates,
                 "query_terms": query_terms,
+                "match_all_tags": match_all_tags,
+                "columns": columns,
+                "uids": uids,
             },
         )
 
@@ -229,6 +241,54 @@ class ClientRegistry(SQLRegistryBase):
             return card, "deleted"
         raise CardDeleteError("Failed to delete card")
 
+    def get_card_changes(
+        self,
+        since: Optional[int] = None,
+        name: Optional[str] = None,
+        repository: Optional[str] = None,
+        timeout: float = 0,
+    ) -> Dict[str, Any]:
+        """Retrieves card changes recorded after a cursor. The server holds the request
+        for up to `timeout` seconds if there are no changes (long-poll).
+
+        Args:
+            since:
+                Cursor to retrieve changes after. If None, the cursor of the latest change is returned
+            name:
+                Optional card name to filter by
+            repository:
+                Optional repository to filter by
+            timeout:
+                Max seconds for the server to wait for changes
+
+        Returns:
+            Dictionary containing the cursor to use for the next request and a list of changes
+        """
+        params: Dict[str, Any] = {"registry_type": self.registry_type.value, "timeout": timeout}
+
+        for key, value in {"since": since, "name": name, "repository": repository}.items():
+            if value is not None:
+                params[key] = value
+
+        return self._session.request(
+            route=api_routes.CARD_CHANGES,
+            request_type=RequestType.GET,
+            params=params,
+        )
+
+    def lineage(self, uid: str, direction: LineageDirection, depth: int) -> List[Dict[str, Any]]:
+        data = self._session.request(
+            route=api_routes.LINEAGE,
+            request_type=RequestType.GET,
+            params={
+                "uid": uid,
+                "direction": direction.value,
+                "depth": depth,
+            },
+        )
+
+        return cast(List[Dict[str, Any]], data["edges"])
+
 
 class ClientDataCardRegistry(ClientRegistry):
     @property
@@ -362,6 +422,28 @@ class ClientRunCardRegistry(ClientRegistry):
         metric = data.get("metric")
         return cast(Optional[List[Dict[str, Any]]], metric)
 
+    def get_run_metrics(self, run_uids: List[str], name: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """Get metrics for multiple runs. By default, all metrics are returned.
+        If name is provided, only metrics with that name are returned.
+
+        Args:
+            run_uids:
+                Run uids
+            name:
+                Names of the metrics
+
+        Returns:
+            List of run metrics
+        """
+        body: Dict[str, Any] = {"run_uids": run_uids}
+
+        if name is not None:
+            body["name"] = name
+
+        data = self._session.request(route=api_routes.RUN_METRICS, request_type=RequestType.POST, json=body)
+
+        return cast(List[Dict[str, Any]], data.get("metric") or [])
+
     @staticmethod
     def validate(registry_name: str) -> bool:
         return registry_name.lower() == RegistryType.RUN.value
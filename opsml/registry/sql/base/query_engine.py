@@ -1,17 +1,33 @@
 # mypy: disable-error-code="call-overload"
+# pylint: disable=too-many-lines
 
 # Copyright (c) Shipt, Inc.
 # This source code is licensed under the MIT license found in the
 # LICENSE file in the root directory of this source tree.
 import datetime
+import time
 from contextlib import contextmanager
 from enum import Enum
-from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Union, cast
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
 
-from sqlalchemy import Integer
+from sqlalchemy import Integer, and_
 from sqlalchemy import cast as sql_cast
+from sqlalchemy import delete
 from sqlalchemy import func as sqa_func
-from sqlalchemy import insert, select, text
+from sqlalchemy import insert
+from sqlalchemy import inspect as sqa_inspect
+from sqlalchemy import literal, select, text
 from sqlalchemy.engine import Engine, Row
 from sqlalchemy.orm.session import Session
 from sqlalchemy.sql import FromClause, Select, distinct, or_
@@ -20,18 +36,39 @@ from sqlalchemy.sql.expression import ColumnElement
 from opsml.helpers.logging import ArtifactLogger
 from opsml.registry.semver import get_version_to_search
 from opsml.registry.sql.base.sql_schema import (
+    CardChangeSchema,
+    CardLineageSchema,
     CardSQLTable,
+    CardTagSchema,
     MetricSchema,
     ProjectSchema,
     SQLTableGetter,
 )
-from opsml.types import RegistryType
+from opsml.types import CommonKwargs, LineageDirection, RegistryTableNames, RegistryType
 
 logger = ArtifactLogger.get_logger()
 
 SqlTableType = Optional[Iterable[Union[ColumnElement[Any], FromClause, int]]]
 YEAR_MONTH_DATE = "%Y-%m-%d"
 
+# Card fields referencing other cards. Maps field -> (registry of the referenced card, is the referenced card upstream)
+LINEAGE_FIELDS: Dict[str, Tuple[str, bool]] = {
+    "datacard_uid": (RegistryTableNames.DATA.value, True),
+    "runcard_uid": (RegistryTableNames.RUN.value, True),
+    "pipelinecard_uid": (RegistryTableNames.PIPELINE.value, True),
+    "auditcard_uid": (RegistryTableNames.AUDIT.value, False),
+    "datacard_uids": (RegistryTableNames.DATA.value, False),
+    "modelcard_uids": (RegistryTableNames.MODEL.value, False),
+    "runcard_uids": (RegistryTableNames.RUN.value, False),
+}
+
+# seconds to wait for a change with a lower cursor to commit before a gap in the change log is skipped.
+# Cursors are assigned at insert and changes commit in any order, so a gap can be an in-flight transaction
+CHANGE_GAP_TIMEOUT = 10
+
+# card uid reference values that don't point to a card
+LINEAGE_PLACEHOLDER_UIDS = {CommonKwargs.UNDEFINED.value, "None"}
+
 
 class SqlDialect(str, Enum):
     SQLITE = "sqlite"
@@ -215,6 +252,9 @@ class QueryEngine:
         tags: Optional[Dict[str, str]] = None,
         limit: Optional[int] = None,
         query_terms: Optional[Dict[str, Any]] = None,
+        match_all_tags: bool = True,
+        columns: Optional[List[str]] = None,
+        uids: Optional[List[str]] = None,
     ) -> Select[Any]:
         """
         Creates a sql query based on table, uid, name, repository and version
@@ -238,12 +278,21 @@ class QueryEngine:
                 Optional limit of records to return
             query_terms:
                 Optional query terms to search
+            match_all_tags:
+                If True, cards must match all tags. If False, cards matching any tag are returned
+            columns:
+                Optional subset of columns to select. If not provided, full records are selected
+            uids:
+                Optional list of card uids to select
 
         Returns
             Sqlalchemy Select statement
         """
 
-        query = cast(Select[Any], select(table))
+        if columns is not None:
+            query = select(*self._get_table_columns(table=table, columns=columns))
+        else:
+            query = cast(Select[Any], select(table))
         query = DialectHelper.get_dialect_logic(query=query, table=table, dialect=self.dialect)
 
         if bool(uid):
@@ -251,6 +300,9 @@ class QueryEngine:
 
         filters = []
 
+        if uids is not None:
+            filters.append(table.uid.in_(uids))  # type: ignore
+
         for field, value in zip(["name", "repository"], [name, repository]):
             if value is not None:
                 filters.append(getattr(table, field) == value)
@@ -263,9 +315,9 @@ class QueryEngine:
             max_date_ts = self._get_epoch_time_to_search(max_date=max_date)
             filters.append(getattr(table, "timestamp") <= max_date_ts)
 
-        if tags is not None:
-            for key, value in tags.items():
-                filters.append(table.tags[key].as_string() == value)  # type: ignore
+        if tags:
+            uid_query = self._card_uids_from_tags_query(table=table, tags=tags, match_all_tags=match_all_tags)
+            filters.append(table.uid.in_(uid_query))  # type: ignore
 
         if query_terms is not None:
             for field, value in query_terms.items():
@@ -281,6 +333,62 @@ class QueryEngine:
 
         return query
 
+    def _get_table_columns(self, table: CardSQLTable, columns: List[str]) -> List[Any]:
+        """Validates and returns the table columns to select. Version is always selected
+        as records are sorted and filtered by SemVer.
+
+        Args:
+            table:
+                Registry table to query
+            columns:
+                Column names to select
+
+        Returns:
+            List of table columns
+        """
+        mapper = sqa_inspect(table)
+        assert mapper is not None, f"{table.__tablename__} is not a mapped table"
+        table_columns = mapper.column_attrs.keys()
+        invalid_columns = [col for col in columns if col not in table_columns]
+
+        if invalid_columns:
+            raise ValueError(f"Invalid columns for {table.__tablename__}: {invalid_columns}")
+
+        return [getattr(table, col) for col in dict.fromkeys([*columns, "version"])]
+
+    def _card_uids_from_tags_query(
+        self,
+        table: CardSQLTable,
+        tags: Dict[str, str],
+        match_all_tags: bool = True,
+    ) -> Select[Any]:
+        """Creates a query that returns the uids of cards in a registry matching the provided tags.
+        Searches the indexed card tag table rather than the json tags column of the registry table.
+
+        Args:
+            table:
+                Registry table to query
+            tags:
+                Dictionary of key, value tags to search for
+            match_all_tags:
+                If True, cards must match all tags (AND). If False, cards can match any tag (OR)
+
+        Returns:
+            Sqlalchemy Select statement
+        """
+        tag_filters = [and_(CardTagSchema.key == key, CardTagSchema.value == str(value)) for key, value in tags.items()]
+        query = select(CardTagSchema.card_uid).filter(
+            CardTagSchema.registry_name == table.__tablename__,
+            or_(*tag_filters),
+        )
+
+        if match_all_tags:
+            # (card_uid, key) is unique, so a card matches all tags when every key is found
+            tag_count = sqa_func.count(CardTagSchema.key)  # pylint: disable=not-callable
+            return query.group_by(CardTagSchema.card_uid).having(tag_count == len(tags))
+
+        return query.distinct()
+
     def _parse_records(self, records: Sequence[Row[Any]]) -> List[Dict[str, Any]]:
         """
         Helper for parsing sql results
@@ -300,6 +408,24 @@ class QueryEngine:
 
         return record_list
 
+    def _parse_column_records(self, records: Sequence[Row[Any]], columns: List[str]) -> List[Dict[str, Any]]:
+        """
+        Helper for parsing sql results from a column selection
+
+        Args:
+            records:
+                Returned rows from sql query
+            columns:
+                Selected column names
+
+        Returns:
+            List of dictionaries
+        """
+        column_names = list(dict.fromkeys([*columns, "version"]))
+
+        # rows also contain the version split columns used for sorting
+        return [dict(zip(column_names, row)) for row in records]
+
     def get_records_from_table(
         self,
         table: CardSQLTable,
@@ -311,6 +437,9 @@ class QueryEngine:
         tags: Optional[Dict[str, str]] = None,
         limit: Optional[int] = None,
         query_terms: Optional[Dict[str, Any]] = None,
+        match_all_tags: bool = True,
+        columns: Optional[List[str]] = None,
+        uids: Optional[List[str]] = None,
     ) -> List[Dict[str, Any]]:
         query = self._records_from_table_query(
             table=table,
@@ -322,11 +451,17 @@ class QueryEngine:
             tags=tags,
             limit=limit,
             query_terms=query_terms,
+            match_all_tags=match_all_tags,
+            columns=columns,
+            uids=uids,
         )
 
         with self.session() as sess:
             results = sess.execute(query).all()
 
+        if columns is not None:
+            return self._parse_column_records(results, columns)
+
         return self._parse_records(results)
 
     def _get_epoch_time_to_search(self, max_date: str) -> int:
@@ -378,8 +513,142 @@ class QueryEngine:
 
         with self.session() as sess:
             sess.add(sql_record)
+            sess.flush()  # uid may be set by the table default
+
+            if card.get("tags"):
+                self._insert_card_tags(sess=sess, table=table, uid=sql_record.uid, tags=card["tags"])
+
+            self._insert_card_lineage(sess=sess, table=table, uid=sql_record.uid, card=card)
+            self._insert_card_change(sess=sess, table=table, card=card, action="registered")
             sess.commit()
 
+    def _insert_card_tags(self, sess: Session, table: CardSQLTable, uid: str, tags: Dict[str, Any]) -> None:
+        """Inserts tag records for a card into the card tag table
+
+        Args:
+            sess:
+                Active session. Caller is responsible for committing
+            table:
+                Registry table the card belongs to
+            uid:
+                Card uid
+            tags:
+                Card tags
+        """
+        if not tags:
+            return
+
+        tag_records = [
+            {"card_uid": uid, "registry_name": table.__tablename__, "key": key, "value": str(value)}
+            for key, value in tags.items()
+        ]
+        sess.execute(insert(CardTagSchema), tag_records)
+
+    def _delete_card_tags(self, sess: Session, uid: str) -> None:
+        """Deletes all tag records for a card
+
+        Args:
+            sess:
+                Active session. Caller is responsible for committing
+            uid:
+                Card uid
+        """
+        sess.execute(delete(CardTagSchema).where(CardTagSchema.card_uid == uid))
+
+    def _get_lineage_edges(self, table: CardSQLTable, uid: str, card: Dict[str, Any]) -> List[Dict[str, str]]:
+        """Derives lineage edges from the card uid references of a card record. Placeholder
+        references (e.g. "undefined") don't point to a card and are skipped
+
+        Args:
+            table:
+                Registry table the card belongs to
+            uid:
+                Card uid
+            card:
+                Card record
+
+        Returns:
+            List of edge records
+        """
+        edges: Dict[Tuple[str, str, str], Dict[str, str]] = {}
+        for field, (registry, is_upstream) in LINEAGE_FIELDS.items():
+            value = card.get(field)
+            if not value:
+                continue
+
+            for ref_uid in value if isinstance(value, list) else [value]:
+                if not ref_uid or ref_uid in LINEAGE_PLACEHOLDER_UIDS:
+                    continue
+
+                if is_upstream:
+                    edge = (ref_uid, registry, uid, table.__tablename__)
+                else:
+                    edge = (uid, table.__tablename__, ref_uid, registry)
+
+                edges[(edge[0], edge[2], field)] = {
+                    **dict(zip(["parent_uid", "parent_registry", "child_uid", "child_registry"], edge)),
+                    "source_uid": uid,
+                    "source_field": field,
+                }
+
+        return list(edges.values())
+
+    def _insert_card_lineage(self, sess: Session, table: CardSQLTable, uid: str, card: Dict[str, Any]) -> None:
+        """Inserts the lineage edges derived from a card
+
+        Args:
+            sess:
+                Active session. Caller is responsible for committing
+            table:
+                Registry table the card belongs to
+            uid:
+                Card uid
+            card:
+                Card record
+        """
+        edges = self._get_lineage_edges(table=table, uid=uid, card=card)
+        if edges:
+            sess.execute(insert(CardLineageSchema), edges)
+
+    def _delete_card_lineage(self, sess: Session, uid: str) -> None:
+        """Deletes all lineage edges connected to a card
+
+        Args:
+            sess:
+                Active session. Caller is responsible for committing
+            uid:
+                Card uid
+        """
+        sess.execute(
+            delete(CardLineageSchema).where(
+                or_(CardLineageSchema.parent_uid == uid, CardLineageSchema.child_uid == uid)
+            )
+        )
+
+    def _delete_card_lineage_edges(self, sess: Session, uid: str, card: Dict[str, Any]) -> None:
+        """Deletes the lineage edges a card contributed through the uid reference fields present
+        in a card record so they can be re-derived when the card is updated. Edges contributed by
+        other cards are kept
+
+        Args:
+            sess:
+                Active session. Caller is responsible for committing
+            uid:
+                Card uid
+            card:
+                Card record
+        """
+        fields = [field for field in LINEAGE_FIELDS if field in card]
+        if not fields:
+            return
+
+        sess.execute(
+            delete(CardLineageSchema).where(
+                CardLineageSchema.source_uid == uid,
+                CardLineageSchema.source_field.in_(fields),
+            )
+        )
+
     def update_card_record(
         self,
         table: CardSQLTable,
@@ -390,6 +659,14 @@ class QueryEngine:
         with self.session() as sess:
             query = sess.query(table).filter(table.uid == record_uid)
             query.update(card)
+
+            if "tags" in card:
+                self._delete_card_tags(sess=sess, uid=record_uid)
+                self._insert_card_tags(sess=sess, table=table, uid=record_uid, tags=card["tags"])
+
+            self._delete_card_lineage_edges(sess=sess, uid=record_uid, card=card)
+            self._insert_card_lineage(sess=sess, table=table, uid=record_uid, card=card)
+            self._insert_card_change(sess=sess, table=table, card=card, action="updated")
             sess.commit()
 
     def get_unique_repositories(self, table: CardSQLTable) -> Sequence[str]:
@@ -436,8 +713,211 @@ class QueryEngine:
         with self.session() as sess:
             query = sess.query(table).filter(table.uid == record_uid)
             query.delete()
+            self._delete_card_tags(sess=sess, uid=record_uid)
+            self._delete_card_lineage(sess=sess, uid=record_uid)
+            self._insert_card_change(sess=sess, table=table, card=card, action="deleted")
             sess.commit()
 
+    def _insert_card_change(self, sess: Session, table: CardSQLTable, card: Dict[str, Any], action: str) -> None:
+        """Appends a card change to the change log
+
+        Args:
+            sess:
+                Active session. Caller is responsible for committing
+            table:
+                Registry table the card belongs to
+            card:
+                Card record that changed
+            action:
+                Change action (registered, updated, deleted)
+        """
+        change = CardChangeSchema(
+            registry_name=table.__tablename__,
+            uid=card.get("uid"),
+            name=card.get("name"),
+            repository=card.get("repository"),
+            version=card.get("version"),
+            action=action,
+            timestamp=int(round(time.time() * 1_000_000)),
+        )
+        sess.add(change)
+
+    def get_latest_change_cursor(self) -> int:
+        """Returns the cursor of the most recent card change or 0 if no changes have been recorded"""
+        query = select(sqa_func.max(CardChangeSchema.idx))
+
+        with self.session() as sess:
+            return cast(int, sess.scalar(query) or 0)
+
+    def _get_change_horizon(self, sess: Session, since: int, limit: int) -> int:
+        """Returns the highest cursor after `since` up to which all changes are visible. The horizon stops
+        before a missing cursor unless the change recorded after it is older than CHANGE_GAP_TIMEOUT, since
+        the missing change may belong to a transaction that hasn't committed yet
+
+        Args:
+            sess:
+                Active session
+            since:
+                Cursor to start from
+            limit:
+                Max number of changes to advance over
+
+        Returns:
+            Change horizon
+        """
+        query = (
+            select(CardChangeSchema.idx, CardChangeSchema.timestamp)
+            .filter(CardChangeSchema.idx > since)
+            .order_by(CardChangeSchema.idx.asc())
+            .limit(limit)
+        )
+        settled = int(round((time.time() - CHANGE_GAP_TIMEOUT) * 1_000_000))
+
+        horizon = since
+        for idx, timestamp in sess.execute(query).all():
+            if idx != horizon + 1 and (timestamp or 0) > settled:
+                break
+            horizon = idx
+
+        return horizon
+
+    def get_card_changes(
+        self,
+        table: CardSQLTable,
+        since: int,
+        name: Optional[str] = None,
+        repository: Optional[str] = None,
+        limit: int = 100,
+    ) -> Dict[str, Any]:
+        """Returns card changes recorded after a given cursor, oldest first, along with the cursor to
+        use for the next request.
+
+        Each change is returned at most once. Changes are only returned once every change with a lower
+        cursor is visible, or the gap is older than CHANGE_GAP_TIMEOUT seconds (rolled back transactions
+        leave permanent gaps). A change whose transaction commits more than CHANGE_GAP_TIMEOUT seconds after
+        it was recorded (or is recorded by a server with a skewed clock) can be missed.
+
+        Args:
+            table:
+                Registry table to retrieve changes for
+            since:
+                Cursor to retrieve changes after
+            name:
+                Optional card name to filter by
+            repository:
+                Optional repository to filter by
+            limit:
+                Max number of changes (across all registries) to scan
+
+        Returns:
+            Dictionary containing the next cursor and the list of card changes
+        """
+        with self.session() as sess:
+            horizon = self._get_change_horizon(sess=sess, since=since, limit=limit)
+
+            query = select(CardChangeSchema).filter(
+                CardChangeSchema.registry_name == table.__tablename__,
+                CardChangeSchema.idx > since,
+                CardChangeSchema.idx <= horizon,
+            )
+
+            if name is not None:
+                query = query.filter(CardChangeSchema.name == name)
+
+            if repository is not None:
+                query = query.filter(CardChangeSchema.repository == repository)
+
+            changes = sess.scalars(query.order_by(CardChangeSchema.idx.asc())).all()
+
+        return {
+            "cursor": horizon,
+            "changes": [
+                {
+                    "cursor": change.idx,
+                    "registry": change.registry_name,
+                    "uid": change.uid,
+                    "name": change.name,
+                    "repository": change.repository,
+                    "version": change.version,
+                    "action": change.action,
+                    "timestamp": change.timestamp,
+                }
+                for change in changes
+            ],
+        }
+
+    def _lineage_query(self, uid: str, direction: LineageDirection, depth: int) -> Select[Any]:
+        """Creates a recursive CTE query that walks lineage edges from a card
+
+        Args:
+            uid:
+                Card uid to start from
+            direction:
+                Direction to walk
+            depth:
+                Max number of edges to walk
+
+        Returns:
+            Sqlalchemy Select statement
+        """
+        edge = CardLineageSchema
+        if direction == LineageDirection.DOWNSTREAM:
+            start_col, next_col = edge.parent_uid, edge.child_uid
+        else:
+            start_col, next_col = edge.child_uid, edge.parent_uid
+
+        edge_cols = [edge.parent_uid, edge.parent_registry, edge.child_uid, edge.child_registry]
+
+        lineage = (
+            select(*edge_cols, next_col.label("next_uid"), literal(1).label("depth"))
+            .filter(start_col == uid)
+            .cte("lineage", recursive=True)
+        )
+        lineage = lineage.union(
+            select(*edge_cols, next_col, lineage.c.depth + 1)
+            .join(lineage, start_col == lineage.c.next_uid)
+            .filter(lineage.c.depth < depth)
+        )
+
+        return (
+            select(
+                lineage.c.parent_uid,
+                lineage.c.parent_registry,
+                lineage.c.child_uid,
+                lineage.c.child_registry,
+                sqa_func.min(lineage.c.depth).label("depth"),
+            )
+            .group_by(
+                lineage.c.parent_uid,
+                lineage.c.parent_registry,
+                lineage.c.child_uid,
+                lineage.c.child_registry,
+            )
+            .order_by(text("depth"), lineage.c.parent_uid, lineage.c.child_uid)
+        )
+
+    def get_lineage(self, uid: str, direction: LineageDirection, depth: int) -> List[Dict[str, Any]]:
+        """Retrieves all lineage edges reachable from a card within a given depth in a single query
+
+        Args:
+            uid:
+                Card uid to start from
+            direction:
+                Direction to walk. Upstream returns the cards the card was derived from,
+                downstream returns the cards derived from the card.
+            depth:
+                Max number of edges to walk
+
+        Returns:
+            List of edges with the depth at which each edge was first reached
+        """
+        query = self._lineage_query(uid=uid, direction=direction, depth=depth)
+
+        with self.session() as sess:
+            results = sess.execute(query).all()
+
+        return [row._asdict() for row in results]
+
 
 class ProjectQueryEngine(QueryEngine):
     def get_max_project_id(self) -> int:
@@ -535,6 +1015,29 @@ class RunQueryEngine(QueryEngine):
 
         return self._parse_records(results)
 
+    def get_run_metrics(self, run_uids: List[str], name: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """Get metrics for multiple runs in a single query. By default, all metrics are returned.
+        If name is provided, only metrics with that name are returned.
+
+        Args:
+            run_uids:
+                Run uids
+            name:
+                Names of the metrics
+
+        Returns:
+            List of run metrics
+        """
+        query = select(MetricSchema).filter(MetricSchema.run_uid.in_(run_uids))
+
+        if name is not None:
+            query = query.filter(MetricSchema.name.in_(name))
+
+        with self.session() as sess:
+            results = sess.execute(query).all()
+
+        return self._parse_records(results)
+
 
 def get_query_engine(db_engine: Engine, registry_type: RegistryType) -> Union[QueryEngine, ProjectQueryEngine]:
     """Get query engine based on registry type
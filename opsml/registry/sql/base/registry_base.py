@@ -13,7 +13,7 @@ from opsml.registry.records import SaveRecord, registry_name_record_map
 from opsml.registry.semver import CardVersion, SemVerUtils, VersionType
 from opsml.storage.card_saver import save_card_artifacts
 from opsml.storage.client import StorageClient
-from opsml.types import RegistryTableNames, RegistryType
+from opsml.types import LineageDirection, RegistryTableNames, RegistryType
 from opsml.types.extra import CommonKwargs
 
 logger = ArtifactLogger.get_logger()
@@ -79,6 +79,18 @@ class SQLRegistryBase:
     def delete_card_record(self, card: Dict[str, Any]) -> Tuple[Dict[str, Any], str]:
         raise NotImplementedError
 
+    def get_card_changes(
+        self,
+        since: Optional[int] = None,
+        name: Optional[str] = None,
+        repository: Optional[str] = None,
+        timeout: float = 0,
+    ) -> Dict[str, Any]:
+        raise NotImplementedError
+
+    def lineage(self, uid: str, direction: LineageDirection, depth: int) -> List[Dict[str, Any]]:
+        raise NotImplementedError
+
     @staticmethod
     def validate(registry_name: str) -> bool:
         raise NotImplementedError
@@ -274,6 +286,9 @@ class SQLRegistryBase:
         limit: Optional[int] = None,
         ignore_release_candidates: bool = False,
         query_terms: Optional[Dict[str, Any]] = None,
+        match_all_tags: bool = True,
+        columns: Optional[List[str]] = None,
+        uids: Optional[List[str]] = None,
     ) -> List[Dict[str, Any]]:
         raise NotImplementedError
 
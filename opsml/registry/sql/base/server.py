@@ -3,6 +3,7 @@
 # LICENSE file in the root directory of this source tree.
 
 import textwrap
+import time
 from typing import Any, Dict, List, Optional, Sequence, Tuple, cast
 
 from opsml.cards import ArtifactCard, ModelCard
@@ -24,14 +25,17 @@ from opsml.registry.sql.base.query_engine import (
 )
 from opsml.registry.sql.base.registry_base import SQLRegistryBase
 from opsml.registry.sql.base.sql_schema import SQLTableGetter
-from opsml.registry.sql.base.utils import log_card_change
+from opsml.registry.sql.base.utils import card_change_notifier, log_card_change
 from opsml.registry.sql.connectors.connector import DefaultConnector
 from opsml.settings.config import config
 from opsml.storage.client import StorageClient
-from opsml.types import RegistryTableNames, RegistryType
+from opsml.types import LineageDirection, RegistryTableNames, RegistryType
 
 logger = ArtifactLogger.get_logger()
 
+# max seconds between change log queries while waiting on changes
+CHANGE_POLL_INTERVAL = 1.0
+
 
 class ServerRegistry(SQLRegistryBase):
     """A registry that retrieves data from a database."""
@@ -167,6 +171,9 @@ class ServerRegistry(SQLRegistryBase):
         limit: Optional[int] = None,
         ignore_release_candidates: bool = False,
         query_terms: Optional[Dict[str, Any]] = None,
+        match_all_tags: bool = True,
+        columns: Optional[List[str]] = None,
+        uids: Optional[List[str]] = None,
     ) -> List[Dict[str, Any]]:
         """
         Retrieves records from registry
@@ -191,6 +198,12 @@ class ServerRegistry(SQLRegistryBase):
                 If True, will ignore release candidates when searching for versions
             query_terms:
                 Dictionary of query terms to filter by
+            match_all_tags:
+                If True, cards must match all tags. If False, cards matching any tag are returned
+            columns:
+                Optional subset of columns to return. Version is always returned.
+            uids:
+                Optional list of card uids to return
 
 
         Returns:
@@ -210,6 +223,9 @@ class ServerRegistry(SQLRegistryBase):
             tags=tags,
             limit=limit,
             query_terms=query_terms,
+            match_all_tags=match_all_tags,
+            columns=columns,
+            uids=uids,
         )
 
         if cleaned_name is not None:
@@ -240,6 +256,70 @@ class ServerRegistry(SQLRegistryBase):
         self.engine.delete_card_record(table=self._table, card=card)
         return card, "deleted"
 
+    def get_card_changes(
+        self,
+        since: Optional[int] = None,
+        name: Optional[str] = None,
+        repository: Optional[str] = None,
+        timeout: float = 0,
+    ) -> Dict[str, Any]:
+        """Retrieves card changes recorded after a cursor. If there are no changes, waits up to
+        `timeout` seconds for new changes (long-poll). The change log is queried once per wake-up,
+        which happens when a change is recorded by this process or every CHANGE_POLL_INTERVAL seconds.
+        The returned cursor is held back at gaps left by uncommitted transactions (see
+        `QueryEngine.get_card_changes` for the delivery guarantee).
+
+        Args:
+            since:
+                Cursor to retrieve changes after. If None, no changes are returned and the cursor
+                of the latest change is returned so callers can start watching from now.
+            name:
+                Optional card name to filter by
+            repository:
+                Optional repository to filter by
+            timeout:
+                Max seconds to wait for changes
+
+        Returns:
+            Dictionary containing the cursor to use for the next request and a list of changes
+        """
+        if since is None:
+            return {"cursor": self.engine.get_latest_change_cursor(), "changes": []}
+
+        cleaned_name = clean_string(name)
+        cleaned_repository = clean_string(repository)
+        deadline = time.monotonic() + timeout
+
+        while True:
+            result = self.engine.get_card_changes(
+                table=self._table,
+                since=since,
+                name=cleaned_name,
+                repository=cleaned_repository,
+            )
+            remaining = deadline - time.monotonic()
+
+            if result["changes"] or remaining <= 0:
+                return result
+
+            card_change_notifier.wait(timeout=min(remaining, CHANGE_POLL_INTERVAL))
+
+    def lineage(self, uid: str, direction: LineageDirection, depth: int) -> List[Dict[str, Any]]:
+        """Retrieves the lineage edges of a card via a recursive query
+
+        Args:
+            uid:
+                Card uid
+            direction:
+                Lineage direction
+            depth:
+                Max number of edges to walk
+
+        Returns:
+            List of lineage edges
+        """
+        return self.engine.get_lineage(uid=uid, direction=direction, depth=depth)
+
 
 class ServerDataCardRegistry(ServerRegistry):
     @property
@@ -346,6 +426,22 @@ class ServerRunCardRegistry(ServerRegistry):
 
         return self.engine.get_metric(run_uid=run_uid, name=name, names_only=names_only)
 
+    def get_run_metrics(self, run_uids: List[str], name: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """Get metrics for multiple run cards
+
+        Args:
+            run_uids:
+                run card uids
+            name:
+                List of names of metrics to retrieve
+
+        Returns:
+            metrics
+        """
+        assert isinstance(self.engine, RunQueryEngine)
+
+        return self.engine.get_run_metrics(run_uids=run_uids, name=name)
+
     def insert_metric(self, metric: List[Dict[str, Any]]) -> None:
         """Insert metric into run card
 
@@ -7,7 +7,7 @@ import uuid
 from datetime import date
 from typing import List, cast
 
-from sqlalchemy import BigInteger, Boolean, Column, Float, Integer, String
+from sqlalchemy import BigInteger, Boolean, Column, Float, Index, Integer, String, Text
 from sqlalchemy.dialects.postgresql import JSON
 from sqlalchemy.orm import declarative_base, declarative_mixin, validates
 
@@ -157,11 +157,89 @@ class MetricSchema(Base):
         return f"<SqlTable: {self.__tablename__}>"
 
 
+class CardTagSchema(Base):
+    """Normalized card tags. Each row is a single key/value tag belonging to a card in a given registry.
+    Kept in sync with the `tags` column of the registry tables so tag lookups can use an index
+    instead of parsing json"""
+
+    __tablename__ = RegistryTableNames.TAGS.value
+
+    card_uid = Column("card_uid", String(64), primary_key=True)
+    registry_name = Column("registry", String(64), nullable=False)
+    key = Column("key", String(128), primary_key=True)
+    value = Column("value", Text)
+
+    __table_args__ = (
+        # mysql can only index a prefix of text columns
+        Index(
+            "idx_card_tags_registry_key_value",
+            "registry",
+            "key",
+            "value",
+            "card_uid",
+            mysql_length={"value": 191},
+        ),
+        Index("idx_card_tags_card_uid", "card_uid"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<SqlTable: {self.__tablename__}>"
+
+
+class CardChangeSchema(Base):
+    """Append-only log of card changes (register, update, delete) across registries.
+    The autoincrementing idx is used as a cursor by watchers. Ids are assigned at insert rather than
+    commit, so watchers hold their cursor back at gaps until the gap is CHANGE_GAP_TIMEOUT seconds old"""
+
+    __tablename__ = RegistryTableNames.CHANGES.value
+
+    idx = Column(Integer, primary_key=True, autoincrement=True)
+    registry_name = Column("registry", String(64), nullable=False)
+    uid = Column("uid", String(64), nullable=False)
+    name = Column("name", String(128))
+    repository = Column("repository", String(128))
+    version = Column("version", String(64))
+    action = Column("action", String(16), nullable=False)
+    timestamp = Column("timestamp", BigInteger)
+
+    __table_args__ = (Index("idx_card_changes_registry_idx", "registry", "idx"),)
+
+    def __repr__(self) -> str:
+        return f"<SqlTable: {self.__tablename__}>"
+
+
+class CardLineageSchema(Base):
+    """Lineage edges between cards. Each row links an upstream (parent) card to a downstream (child) card.
+    Edges are derived from the card uid references (datacard_uid, runcard_uid, modelcard_uids, etc.)
+    when a card is registered or updated. Each edge records the card and field it was derived from, so
+    an edge referenced by both cards is kept until neither card references the other"""
+
+    __tablename__ = RegistryTableNames.LINEAGE.value
+
+    parent_uid = Column("parent_uid", String(64), primary_key=True)
+    child_uid = Column("child_uid", String(64), primary_key=True)
+    source_uid = Column("source_uid", String(64), primary_key=True)
+    source_field = Column("source_field", String(64), primary_key=True)
+    parent_registry = Column("parent_registry", String(64), nullable=False)
+    child_registry = Column("child_registry", String(64), nullable=False)
+
+    __table_args__ = (
+        Index("idx_card_lineage_child_parent", "child_uid", "parent_uid"),
+        Index("idx_card_lineage_source", "source_uid"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<SqlTable: {self.__tablename__}>"
+
+
 AVAILABLE_TABLES: List[CardSQLTable] = []
 for schema in Base.__subclasses__():
     if schema.__tablename__ not in [
         RegistryTableNames.BASE.value,
         RegistryTableNames.METRICS.value,
+        RegistryTableNames.TAGS.value,
+        RegistryTableNames.CHANGES.value,
+        RegistryTableNames.LINEAGE.value,
     ]:
         AVAILABLE_TABLES.append(cast(CardSQLTable, schema))
 
@@ -1,19 +1,73 @@
+import asyncio
+import threading
+from contextlib import suppress
 from functools import wraps
-from typing import Any, Callable
+from typing import Any, Callable, Set, Tuple
 
 from opsml.helpers.logging import ArtifactLogger
+from opsml.storage.card_cache import card_cache
 
 logger = ArtifactLogger.get_logger()
 
 
+class CardChangeNotifier:
+    """Wakes up threads and coroutines waiting on card changes made by this process. Changes made
+    by other processes are picked up by waiters when their wait interval expires"""
+
+    def __init__(self) -> None:
+        self._condition = threading.Condition()
+        self._async_waiters: Set[Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = set()
+
+    def notify(self) -> None:
+        with self._condition:
+            self._condition.notify_all()
+            async_waiters = list(self._async_waiters)
+
+        # notify is called from worker threads, so events are set on the loop that owns them
+        for loop, event in async_waiters:
+            with suppress(RuntimeError):  # loop closed
+                loop.call_soon_threadsafe(event.set)
+
+    def wait(self, timeout: float) -> None:
+        with self._condition:
+            self._condition.wait(timeout=timeout)
+
+    async def async_wait(self, timeout: float) -> None:
+        """Waits for a card change without blocking a thread
+
+        Args:
+            timeout:
+                Max seconds to wait
+        """
+        waiter = (asyncio.get_running_loop(), asyncio.Event())
+
+        with self._condition:
+            self._async_waiters.add(waiter)
+
+        try:
+            await asyncio.wait_for(waiter[1].wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            with self._condition:
+                self._async_waiters.discard(waiter)
+
+
+card_change_notifier = CardChangeNotifier()
+
+
 def log_card_change(func: Callable[..., Any]) -> Callable[..., Any]:
-    """Decorator for logging card changes"""
+    """Decorator for logging card changes. The card is removed from the loaded card cache and
+    watchers in this process are woken up. Registries with direct database access write the change
+    to the registry change log in the same transaction as the card record"""
 
     @wraps(func)
     def wrapper(self, *args, **kwargs) -> None:  # type: ignore[no-untyped-def]
         card, state = func(self, *args, **kwargs)
+        card_cache.invalidate(card.get("uid"))
         name = str(card.get("name"))
         version = str(card.get("version"))
         logger.info("{}: {}, version:{} {}", self.table_name, name, version, state)  # pylint: disable=protected-access
+        card_change_notifier.notify()
 
     return wrapper
@@ -0,0 +1,96 @@
+"""add normalized card tags table and backfill from registry tag columns
+
+Revision ID: 1b6a2f4c8d3e
+Revises:
+Create Date: 2024-03-04 10:12:41.208366
+
+"""
+from typing import Any, Dict, List
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "1b6a2f4c8d3e"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+TAG_TABLE = "OPSML_CARD_TAGS"
+TAGGED_REGISTRIES = [
+    "OPSML_DATA_REGISTRY",
+    "OPSML_MODEL_REGISTRY",
+    "OPSML_RUN_REGISTRY",
+    "OPSML_PIPELINE_REGISTRY",
+    "OPSML_AUDIT_REGISTRY",
+]
+BATCH_SIZE = 1_000
+
+
+def _create_tag_table(inspector: Any) -> None:
+    if TAG_TABLE in inspector.get_table_names():
+        return
+
+    op.create_table(
+        TAG_TABLE,
+        sa.Column("card_uid", sa.String(64), primary_key=True),
+        sa.Column("registry", sa.String(64), nullable=False),
+        sa.Column("key", sa.String(128), primary_key=True),
+        sa.Column("value", sa.Text),
+    )
+    op.create_index(
+        "idx_card_tags_registry_key_value",
+        TAG_TABLE,
+        ["registry", "key", "value", "card_uid"],
+        mysql_length={"value": 191},
+    )
+    op.create_index("idx_card_tags_card_uid", TAG_TABLE, ["card_uid"])
+
+
+def _backfill_registry(connection: Any, tag_table: sa.Table, registry: str) -> None:
+    registry_table = sa.table(registry, sa.column("uid", sa.String), sa.column("tags", sa.JSON))
+
+    # skip cards that already have tags recorded (tables created by the app are kept in sync)
+    tagged_uids = sa.select(tag_table.c.card_uid).where(tag_table.c.registry == registry)
+    query = sa.select(registry_table.c.uid, registry_table.c.tags).where(registry_table.c.uid.not_in(tagged_uids))
+
+    batch: List[Dict[str, Any]] = []
+    for uid, tags in connection.execute(query):
+        if not tags:
+            continue
+
+        batch.extend(
+            {"card_uid": uid, "registry": registry, "key": key, "value": str(value)} for key, value in tags.items()
+        )
+
+        if len(batch) >= BATCH_SIZE:
+            connection.execute(sa.insert(tag_table), batch)
+            batch = []
+
+    if batch:
+        connection.execute(sa.insert(tag_table), batch)
+
+
+def upgrade() -> None:
+    connection = op.get_bind()
+    inspector = sa.inspect(connection)
+    _create_tag_table(inspector)
+
+    tag_table = sa.table(
+        TAG_TABLE,
+        sa.column("card_uid", sa.String),
+        sa.column("registry", sa.String),
+        sa.column("key", sa.String),
+        sa.column("value", sa.String),
+    )
+
+    existing_tables = inspector.get_table_names()
+    for registry in TAGGED_REGISTRIES:
+        if registry in existing_tables:
+            _backfill_registry(connection, tag_table, registry)
+
+
+def downgrade() -> None:
+    op.drop_index("idx_card_tags_card_uid", table_name=TAG_TABLE)
+    op.drop_index("idx_card_tags_registry_key_value", table_name=TAG_TABLE)
+    op.drop_table(TAG_TABLE)
@@ -0,0 +1,41 @@
+"""add card change log table
+
+Revision ID: 5c9e0d7a3f21
+Revises: 1b6a2f4c8d3e
+Create Date: 2024-03-06 14:37:12.518204
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "5c9e0d7a3f21"
+down_revision = "1b6a2f4c8d3e"
+branch_labels = None
+depends_on = None
+
+CHANGE_TABLE = "OPSML_CARD_CHANGES"
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    if CHANGE_TABLE in inspector.get_table_names():
+        return
+
+    op.create_table(
+        CHANGE_TABLE,
+        sa.Column("idx", sa.Integer, primary_key=True, autoincrement=True),
+        sa.Column("registry", sa.String(64), nullable=False),
+        sa.Column("uid", sa.String(64), nullable=False),
+        sa.Column("name", sa.String(128)),
+        sa.Column("repository", sa.String(128)),
+        sa.Column("version", sa.String(64)),
+        sa.Column("action", sa.String(16), nullable=False),
+        sa.Column("timestamp", sa.BigInteger),
+    )
+    op.create_index("idx_card_changes_registry_idx", CHANGE_TABLE, ["registry", "idx"])
+
+
+def downgrade() -> None:
+    op.drop_index("idx_card_changes_registry_idx", table_name=CHANGE_TABLE)
+    op.drop_table(CHANGE_TABLE)
@@ -0,0 +1,147 @@
+"""add card lineage edge table and backfill from card uid references
+
+Revision ID: 8f4a6b2e1d90
+Revises: 5c9e0d7a3f21
+Create Date: 2024-03-08 09:48:27.103725
+
+"""
+from typing import Any, Dict, List, Set, Tuple
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "8f4a6b2e1d90"
+down_revision = "5c9e0d7a3f21"
+branch_labels = None
+depends_on = None
+
+LINEAGE_TABLE = "OPSML_CARD_LINEAGE"
+LINKED_REGISTRIES = [
+    "OPSML_DATA_REGISTRY",
+    "OPSML_MODEL_REGISTRY",
+    "OPSML_RUN_REGISTRY",
+    "OPSML_PIPELINE_REGISTRY",
+]
+
+# field -> (registry of the referenced card, is the referenced card upstream)
+LINEAGE_FIELDS = {
+    "datacard_uid": ("OPSML_DATA_REGISTRY", True),
+    "runcard_uid": ("OPSML_RUN_REGISTRY", True),
+    "pipelinecard_uid": ("OPSML_PIPELINE_REGISTRY", True),
+    "auditcard_uid": ("OPSML_AUDIT_REGISTRY", False),
+    "datacard_uids": ("OPSML_DATA_REGISTRY", False),
+    "modelcard_uids": ("OPSML_MODEL_REGISTRY", False),
+    "runcard_uids": ("OPSML_RUN_REGISTRY", False),
+}
+# card uid reference values that don't point to a card
+PLACEHOLDER_UIDS = {"undefined", "None"}
+BATCH_SIZE = 1_000
+
+
+def _create_lineage_table(inspector: Any) -> None:
+    if LINEAGE_TABLE in inspector.get_table_names():
+        return
+
+    op.create_table(
+        LINEAGE_TABLE,
+        sa.Column("parent_uid", sa.String(64), primary_key=True),
+        sa.Column("child_uid", sa.String(64), primary_key=True),
+        sa.Column("source_uid", sa.String(64), primary_key=True),
+        sa.Column("source_field", sa.String(64), primary_key=True),
+        sa.Column("parent_registry", sa.String(64), nullable=False),
+        sa.Column("child_registry", sa.String(64), nullable=False),
+    )
+    op.create_index("idx_card_lineage_child_parent", LINEAGE_TABLE, ["child_uid", "parent_uid"])
+    op.create_index("idx_card_lineage_source", LINEAGE_TABLE, ["source_uid"])
+
+
+def _backfill_registry(
+    connection: Any,
+    lineage_table: sa.Table,
+    registry: str,
+    fields: List[str],
+    existing: Set[Tuple[str, str, str, str]],
+) -> None:
+    registry_table = sa.table(
+        registry,
+        sa.column("uid", sa.String),
+        *[sa.column(field, sa.JSON if field.endswith("_uids") else sa.String) for field in fields],
+    )
+
+    batch: List[Dict[str, Any]] = []
+    for row in connection.execute(sa.select(registry_table)).mappings():
+        for field in fields:
+            value = row[field]
+            if not value:
+                continue
+
+            ref_registry, is_upstream = LINEAGE_FIELDS[field]
+            for ref_uid in value if isinstance(value, list) else [value]:
+                if not ref_uid or ref_uid in PLACEHOLDER_UIDS:
+                    continue
+
+                if is_upstream:
+                    edge = (ref_uid, ref_registry, row["uid"], registry)
+                else:
+                    edge = (row["uid"], registry, ref_uid, ref_registry)
+
+                key = (edge[0], edge[2], row["uid"], field)
+                if key in existing:
+                    continue
+
+                existing.add(key)
+                batch.append(
+                    {
+                        **dict(zip(["parent_uid", "parent_registry", "child_uid", "child_registry"], edge)),
+                        "source_uid": row["uid"],
+                        "source_field": field,
+                    }
+                )
+
+        if len(batch) >= BATCH_SIZE:
+            connection.execute(sa.insert(lineage_table), batch)
+            batch = []
+
+    if batch:
+        connection.execute(sa.insert(lineage_table), batch)
+
+
+def upgrade() -> None:
+    connection = op.get_bind()
+    inspector = sa.inspect(connection)
+    _create_lineage_table(inspector)
+
+    lineage_table = sa.table(
+        LINEAGE_TABLE,
+        sa.column("parent_uid", sa.String),
+        sa.column("child_uid", sa.String),
+        sa.column("source_uid", sa.String),
+        sa.column("source_field", sa.String),
+        sa.column("parent_registry", sa.String),
+        sa.column("child_registry", sa.String),
+    )
+
+    # skip edges already recorded (tables created by the app are kept in sync)
+    query = sa.select(
+        lineage_table.c.parent_uid,
+        lineage_table.c.child_uid,
+        lineage_table.c.source_uid,
+        lineage_table.c.source_field,
+    )
+    existing = {tuple(row) for row in connection.execute(query)}
+
+    existing_tables = inspector.get_table_names()
+    for registry in LINKED_REGISTRIES:
+        if registry not in existing_tables:
+            continue
+
+        columns = {column["name"] for column in inspector.get_columns(registry)}
+        fields = [field for field in LINEAGE_FIELDS if field in columns]
+        _backfill_registry(connection, lineage_table, registry, fields, existing)
+
+
+def downgrade() -> None:
+    op.drop_index("idx_card_lineage_source", table_name=LINEAGE_TABLE)
+    op.drop_index("idx_card_lineage_child_parent", table_name=LINEAGE_TABLE)
+    op.drop_table(LINEAGE_TABLE)
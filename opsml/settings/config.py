@@ -25,6 +25,20 @@ class OpsmlConfig(BaseSettings):
     download_chunk_size: int = 31457280  # 30MB
     upload_chunk_size: int = 31457280  # 30MB
 
+    # max number of loaded cards kept in memory (0 disables the cache)
+    opsml_card_cache_size: int = 128
+
+    # local directory where downloaded card artifacts are cached by card uid (disabled if not set)
+    opsml_artifact_cache_dir: Optional[str] = None
+
+    # gcs / s3 transfer settings
+    opsml_storage_max_concurrency: Optional[int] = None  # concurrent file transfers for directory get / put
+    opsml_storage_chunk_size: Optional[int] = None  # multipart upload chunk size
+    opsml_storage_block_size: Optional[int] = None  # read block size
+    opsml_storage_cache_type: Optional[str] = None  # local read cache ("blockcache" or "filecache")
+    opsml_storage_cache_dir: Optional[str] = None
+    opsml_storage_cache_max_bytes: int = 10 * 1024**3  # 10GB
+
     # API client username / password
     opsml_username: Optional[str] = None
     opsml_password: Optional[str] = None
@@ -1,6 +1,7 @@
 # Copyright (c) Shipt, Inc.
 # This source code is licensed under the MIT license found in the
 # LICENSE file in the root directory of this source tree.
+import io
 import json as py_json
 import logging
 from enum import Enum
@@ -8,7 +9,7 @@ from pathlib import Path
 from typing import Any, Dict, Optional, cast
 
 import httpx
-from tenacity import retry, stop_after_attempt
+from tenacity import retry, retry_if_not_exception_type, stop_after_attempt
 
 # httpx outputs a lot of logs
 logging.getLogger("httpx").propagate = False
@@ -35,12 +36,15 @@ class ApiRoutes:
     CREATE_CARD = "cards/create"
     UPDATE_CARD = "cards/update"
     DELETE_CARD = "cards/delete"
+    CARD_CHANGES = "cards/changes"
+    LINEAGE = "cards/lineage"
     DATA_PROFILE = "data/profile"
     COMPARE_DATA = "data/compare"
     REGISTER_MODEL = "models/register"
     MODEL_METADATA = "models/metadata"
     PROJECT_ID = "projects/id"
     METRICS = "metrics"
+    RUN_METRICS = "metrics/runs"
     DOWNLOAD_FILE = "files/download"
     DELETE_FILE = "files/delete"
     LIST_FILES = "files/list"
@@ -169,3 +173,46 @@ class ApiClient:
               {response_result.get("detail")}
             """
         )
+
+    @retry(reraise=True, stop=stop_after_attempt(3), retry=retry_if_not_exception_type(FileNotFoundError))
+    def stream_download_bytes_request(self, route: str, read_path: Path, chunk_size: Optional[int] = None) -> bytes:
+        """Streams a file from the server into memory
+
+        Args:
+            route:
+                Download route
+            read_path:
+                Path of file to read
+            chunk_size:
+                Chunk size to stream
+
+        Returns:
+            File contents
+        """
+        url = f"{self._base_url}/{route}"
+        buffer = io.BytesIO()
+
+        try:
+            with self.client.stream(method="GET", url=url, params={"path": read_path.as_posix()}) as response:
+                for data in response.iter_bytes(chunk_size=chunk_size):
+                    buffer.write(data)
+        except (httpx.StreamError, httpx.RemoteProtocolError) as error:
+            raise ValueError(f"Failed to stream {read_path} from Url: {route}. {error}") from error
+
+        if response.status_code == 200:
+            return buffer.getvalue()
+
+        if response.status_code == 404:
+            raise FileNotFoundError(f"File not found: {read_path}")
+
+        # error responses are not always json (e.g. from a proxy or an older server)
+        try:
+            detail = cast(Dict[str, Any], py_json.loads(buffer.getvalue().decode("utf-8"))).get("detail")
+        except ValueError:
+            detail = buffer.getvalue().decode("utf-8", errors="replace")
+
+        raise ValueError(
+            f"""Failed to make server call for get request Url: {route}. Status code: {response.status_code}.
+              {detail}
+            """
+        )
@@ -0,0 +1,115 @@
+# Copyright (c) Shipt, Inc.
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+import threading
+from collections import OrderedDict
+from typing import Any, Optional, Tuple, TypeVar
+
+from pydantic import BaseModel
+
+from opsml.settings.config import config
+
+CardT = TypeVar("CardT", bound=BaseModel)
+CacheKey = Tuple[str, Any]
+
+
+class CardCacheStats(BaseModel):
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    size: int = 0
+    max_size: int = 0
+
+
+class CardCache:
+    def __init__(self, max_size: int = 128):
+        """Bounded LRU cache of loaded cards (and objects loaded alongside them, like model metadata)
+        keyed by card uid. Registered card versions are only changed through `update_card` and
+        `delete_card`, which invalidate all entries for the card.
+
+        Note:
+            Each process keeps its own cache. Updates made by other processes are not seen until
+            the entry is evicted or invalidated in this process.
+
+        Args:
+            max_size:
+                Max number of cards to keep. A size of 0 disables the cache
+        """
+        self.max_size = max_size
+        self._cards: "OrderedDict[CacheKey, BaseModel]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = CardCacheStats(max_size=max_size)
+
+    def get(self, uid: Optional[str], kind: Any = None) -> Optional[BaseModel]:
+        """Gets a copy of a cached card
+
+        Args:
+            uid:
+                Card uid
+            kind:
+                Kind of cached object. Defaults to the card itself. Cards loaded with a
+                specific interface use the interface type
+
+        Returns:
+            Copy of the cached card or None
+        """
+        if uid is None or not self.max_size:
+            return None
+
+        with self._lock:
+            card = self._cards.get((uid, kind))
+
+            if card is None:
+                self._stats.misses += 1
+                return None
+
+            self._cards.move_to_end((uid, kind))
+            self._stats.hits += 1
+
+        # callers get their own copy so changes (e.g. loading a model) never leak into the cache
+        return card.model_copy(deep=True)
+
+    def put(self, uid: Optional[str], card: CardT, kind: Any = None) -> CardT:
+        """Adds a copy of a card to the cache
+
+        Args:
+            uid:
+                Card uid
+            card:
+                Loaded card
+            kind:
+                Kind of cached object. Defaults to the card itself. Cards loaded with a
+                specific interface use the interface type
+
+        Returns:
+            The card passed in
+        """
+        if uid is None or not self.max_size:
+            return card
+
+        with self._lock:
+            self._cards[(uid, kind)] = card.model_copy(deep=True)
+            self._cards.move_to_end((uid, kind))
+
+            while len(self._cards) > self.max_size:
+                self._cards.popitem(last=False)
+                self._stats.evictions += 1
+
+        return card
+
+    def invalidate(self, uid: Optional[str]) -> None:
+        """Removes all cached entries for a card uid"""
+        with self._lock:
+            for key in [key for key in self._cards if key[0] == uid]:
+                del self._cards[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cards.clear()
+
+    def stats(self) -> CardCacheStats:
+        with self._lock:
+            return self._stats.model_copy(update={"size": len(self._cards)})
+
+
+card_cache = CardCache(max_size=config.opsml_card_cache_size)
@@ -0,0 +1,73 @@
+# Copyright (c) Shipt, Inc.
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+import io
+from pathlib import Path
+from typing import Any, Dict
+
+import joblib
+from pydantic_core import PydanticSerializationError, from_json, to_json
+
+from opsml.helpers.logging import ArtifactLogger
+from opsml.types import SaveName, Suffix
+
+logger = ArtifactLogger.get_logger()
+
+# bump when the structure of the envelope changes
+CARD_SCHEMA_VERSION = 1
+
+
+def write_card_envelope(card: Dict[str, Any], path: Path) -> Path:
+    """Writes a dumped card to a json envelope with a schema version. Cards with values that
+    can't be serialized to json are written with joblib.
+
+    Args:
+        card:
+            Dumped card. Artifacts (models, data, etc.) are expected to be excluded
+        path:
+            Directory to write the card to
+
+    Returns:
+        Path to the written card
+    """
+    save_path = Path(path, SaveName.CARD.value).with_suffix(Suffix.JSON.value)
+
+    try:
+        envelope = to_json({"schema_version": CARD_SCHEMA_VERSION, "card": card})
+    except PydanticSerializationError as error:
+        logger.warning("Card could not be serialized to json, falling back to joblib. {}", error)
+        save_path = save_path.with_suffix(Suffix.JOBLIB.value)
+        joblib.dump(card, save_path)
+        return save_path
+
+    save_path.write_bytes(envelope)
+    return save_path
+
+
+def read_card_envelope(data: bytes, suffix: str = Suffix.JSON.value) -> Dict[str, Any]:
+    """Reads a dumped card from a json envelope or a joblib file (cards saved before envelopes
+    or cards that could not be serialized to json)
+
+    Args:
+        data:
+            Contents of the card file
+        suffix:
+            Suffix of the card file
+
+    Returns:
+        Dumped card
+    """
+    if suffix == Suffix.JOBLIB.value:
+        card: Dict[str, Any] = joblib.load(io.BytesIO(data))
+        return card
+
+    envelope = from_json(data)
+    schema_version = envelope.get("schema_version")
+
+    if schema_version is None or schema_version > CARD_SCHEMA_VERSION:
+        raise ValueError(
+            f"Unsupported card schema version {schema_version}. "
+            f"This version of opsml supports up to version {CARD_SCHEMA_VERSION}."
+        )
+
+    return dict(envelope["card"])
@@ -2,16 +2,28 @@
 # This source code is licensed under the MIT license found in the
 # LICENSE file in the root directory of this source tree.
 
-import json
+import shutil
 import tempfile
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import contextmanager
 from functools import cached_property
 from pathlib import Path
-from typing import Any, Dict, Iterator, Optional, Type, Union, cast
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 from venv import logger
 
-import joblib
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
 from opsml.cards import (
     ArtifactCard,
@@ -29,9 +41,24 @@ from opsml.model.interfaces.base import ModelInterface
 from opsml.model.interfaces.huggingface import HuggingFaceModel
 from opsml.settings.config import config
 from opsml.storage import client
-from opsml.types import CardType, RegistryTableNames, RegistryType, SaveName, Suffix
+from opsml.storage.card_cache import card_cache
+from opsml.storage.card_envelope import read_card_envelope
+from opsml.types import (
+    ArtifactManifest,
+    CardType,
+    RegistryTableNames,
+    RegistryType,
+    SaveName,
+    Suffix,
+)
 from opsml.types.model import ModelMetadata, OnnxModel
 
+# threads used to download the artifacts of a card concurrently
+_MAX_FETCH_WORKERS = 4
+
+# artifacts that can be downloaded ahead of loading with `ModelCardLoader.prefetch`
+PREFETCH_ARTIFACTS = ("model", "onnx", "preprocessor", "sample_data")
+
 table_name_card_map = {
     RegistryType.DATA.value: DataCard,
     RegistryType.MODEL.value: ModelCard,
@@ -130,6 +157,8 @@ class CardLoader:
         self.card_args = card_args
         self.registry_type = registry_type
         self.storage_client = client.storage_client
+        self._exists: Dict[Path, bool] = {}
+        self._fetched: Set[Path] = set()
 
     @cached_property
     def card(self) -> ArtifactCard:
@@ -145,6 +174,63 @@ class CardLoader:
 
         return args.uri
 
+    @cached_property
+    def artifact_manifest(self) -> Optional[ArtifactManifest]:
+        """Manifest of card artifacts written at save time. Downloaded once and used to plan
+        all other downloads. Returns None for cards saved before manifests were written"""
+        rpath = Path(self.card.uri, SaveName.ARTIFACT_MANIFEST.value).with_suffix(Suffix.JSON.value)
+        manifest = self._read_optional_bytes(rpath)
+
+        if manifest is None:
+            return None
+
+        return ArtifactManifest.model_validate_json(manifest)
+
+    def _manifest_files(self, rpath: Path) -> Optional[List[Path]]:
+        """Lists remote files saved under rpath using the artifact manifest
+
+        Args:
+            rpath:
+                Remote path of artifact
+
+        Returns:
+            List of remote files or None if the card has no manifest or rpath is outside the card uri
+        """
+        # cards are loaded from card args before the card (and its manifest) is available
+        if self._card is None or self.artifact_manifest is None:
+            return None
+
+        try:
+            relative_path = rpath.relative_to(self.card.uri).as_posix()
+        except ValueError:
+            return None
+
+        return [Path(self.card.uri, file) for file in self.artifact_manifest.list_files(relative_path)]
+
+    def _artifact_exists(self, rpath: Path) -> bool:
+        """Checks if an artifact exists. Uses the artifact manifest when available to avoid a storage call
+
+        Args:
+            rpath:
+                Remote path of artifact
+        """
+        if rpath not in self._exists:
+            files = self._manifest_files(rpath)
+            self._exists[rpath] = self.storage_client.exists(rpath) if files is None else bool(files)
+
+        return self._exists[rpath]
+
+    def _get(self, rpath: Path, lpath: Path) -> None:
+        """Copies file(s) from rpath to lpath. Remote files are taken from the artifact manifest when available
+
+        Args:
+            rpath:
+                Remote path
+            lpath:
+                Local path
+        """
+        self.storage_client.get(rpath, lpath, files=self._manifest_files(rpath))
+
     def download(
         self,
         lpath: Path,
@@ -166,10 +252,99 @@ class CardLoader:
         """
 
         load_lpath = Path(lpath, object_path).with_suffix(suffix)
+
+        # already downloaded by a fetch plan
+        if load_lpath in self._fetched:
+            return load_lpath
+
         load_rpath = Path(rpath, object_path).with_suffix(suffix)
-        self.storage_client.get(load_rpath, load_lpath)
+
+        cache_path = self._cache_path(load_rpath)
+        if cache_path is not None:
+            return self._get_cached(load_rpath, cache_path)
+
+        self._get(load_rpath, load_lpath)
         return load_lpath
 
+    def _cache_path(self, rpath: Path) -> Optional[Path]:
+        """Path of an artifact in the local artifact cache. Card artifacts do not change after
+        registration, so cached artifacts are keyed by card uid
+
+        Args:
+            rpath:
+                Remote path of artifact
+
+        Returns:
+            Cache path or None if the artifact cache is disabled or rpath is outside the card uri
+        """
+        if config.opsml_artifact_cache_dir is None or self._card is None:
+            return None
+
+        try:
+            relative_path = rpath.relative_to(self.card.uri)
+        except ValueError:
+            return None
+
+        return Path(config.opsml_artifact_cache_dir, str(self.card.uid), relative_path)
+
+    def _get_cached(self, rpath: Path, cache_path: Path) -> Path:
+        """Downloads an artifact to the local artifact cache if it is not already cached
+
+        Args:
+            rpath:
+                Remote path of artifact
+            cache_path:
+                Path of artifact in the cache
+
+        Returns:
+            Cache path
+        """
+        if cache_path.exists():
+            return cache_path
+
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # download to a staging dir so concurrent loaders never see a partially written artifact
+        staging_dir = Path(tempfile.mkdtemp(prefix=".staging-", dir=cache_path.parent))
+        try:
+            staging_path = staging_dir / cache_path.name
+            self._get(rpath, staging_path)
+
+            if staging_path.exists():
+                try:
+                    staging_path.rename(cache_path)
+                except OSError:
+                    # cached by another loader in the meantime
+                    pass
+        finally:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+
+        return cache_path
+
+    @contextmanager
+    def _fetch(self, lpath: Path, rpath: Path, artifacts: List[Tuple[str, str]]) -> Iterator[None]:
+        """Downloads a set of artifacts concurrently. Artifacts are loaded within the context
+        in dependency order and `download` returns the prefetched paths.
+
+        Args:
+            lpath:
+                Local path to save files
+            rpath:
+                Remote path to load files
+            artifacts:
+                List of (object_path, suffix) to download
+        """
+        artifacts = list(dict.fromkeys(artifacts))
+
+        try:
+            if len(artifacts) > 1:
+                with ThreadPoolExecutor(min(_MAX_FETCH_WORKERS, len(artifacts))) as executor:
+                    futures = [executor.submit(self.download, lpath, rpath, *artifact) for artifact in artifacts]
+                    self._fetched.update(future.result() for future in futures)
+            yield
+        finally:
+            self._fetched.clear()
+
     @contextmanager
     def _load_object(
         self,
@@ -195,16 +370,71 @@ class CardLoader:
             rpath = rpath or self.card.uri
             yield self.download(lpath, rpath, object_path, suffix)
 
+    def _read_bytes(self, rpath: Path) -> bytes:
+        """Reads a small artifact into memory without downloading it to a temporary directory.
+        Raises FileNotFoundError if the artifact does not exist
+
+        Args:
+            rpath:
+                Remote path of artifact
+        """
+        files = self._manifest_files(rpath)
+        if files is not None and not files:
+            raise FileNotFoundError(f"No artifact found at {rpath}")
+
+        return self.storage_client.read_bytes(rpath)
+
+    def _read_optional_bytes(self, rpath: Path) -> Optional[bytes]:
+        """Reads an artifact that may not exist, such as files written by newer opsml versions.
+        Older servers can answer requests for missing files with a server error or a broken stream
+        instead of a 404, so any failed read is treated as a missing artifact
+
+        Args:
+            rpath:
+                Remote path of artifact
+
+        Returns:
+            Artifact bytes or None if the artifact could not be read
+        """
+        try:
+            return self.storage_client.read_bytes(rpath)
+        except (FileNotFoundError, ValueError) as error:
+            logger.debug("Could not read optional artifact {}: {}", rpath, error)
+            return None
+
+    def _load_card_envelope(self, rpath: Path) -> Dict[str, Any]:
+        """Loads a dumped card from its json envelope. Falls back to joblib for cards
+        saved before envelopes were written
+
+        Args:
+            rpath:
+                Remote path of card
+        """
+        json_path = Path(rpath, SaveName.CARD.value).with_suffix(Suffix.JSON.value)
+        card_bytes = self._read_optional_bytes(json_path)
+        if card_bytes is not None:
+            return read_card_envelope(card_bytes, Suffix.JSON.value)
+
+        try:
+            joblib_path = Path(rpath, SaveName.CARD.value).with_suffix(Suffix.JOBLIB.value)
+            return read_card_envelope(self._read_bytes(joblib_path), Suffix.JOBLIB.value)
+        except FileNotFoundError as error:
+            raise FileNotFoundError(f"No card found at {rpath}") from error
+
     def load_card(self, interface: Optional[Union[Type[DataInterface], Type[ModelInterface]]] = None) -> ArtifactCard:
         """Loads an ArtifactCard from card arguments
 
         Returns:
             Loaded ArtifactCard
         """
-        rpath = self.get_rpath_from_args()
+        assert self.card_args is not None
+        uid = self.card_args.get("uid")
 
-        with self._load_object(SaveName.CARD.value, Suffix.JOBLIB.value, rpath) as lpath:
-            loaded_card: Dict[str, Any] = joblib.load(lpath)
+        cached_card = card_cache.get(uid, interface)
+        if cached_card is not None:
+            return cast(ArtifactCard, cached_card)
+
+        loaded_card = self._load_card_envelope(self.get_rpath_from_args())
 
         # load interface logic
         if self.registry_type in (RegistryType.MODEL, RegistryType.DATA):
@@ -219,91 +449,94 @@ class CardLoader:
 
             loaded_card["interface"] = loaded_interface
 
-        return cast(ArtifactCard, table_name_card_map[self.registry_type](**loaded_card))
+        card = cast(ArtifactCard, table_name_card_map[self.registry_type](**loaded_card))
+        return card_cache.put(uid, card, interface)
+
+    def load_lazy_card(
+        self,
+        interface: Optional[Union[Type[DataInterface], Type[ModelInterface]]] = None,
+    ) -> ArtifactCard:
+        """Creates a lazy card from the registry record in card args. The card is only loaded
+        from storage when a field that is not part of the registry record is accessed
+
+        Returns:
+            `LazyCard` that behaves like the ArtifactCard of the registry
+        """
+        return cast(ArtifactCard, LazyCard(loader=self, interface=interface))
 
     @staticmethod
     def validate(card_type: str) -> bool:
         raise NotImplementedError
 
 
-class DataCardLoader(CardLoader):
-    """DataCard loader. Methods are meant to be called individually"""
-
+class LazyCard:
     def __init__(
         self,
-        card: Optional[DataCard] = None,
-        card_args: Optional[Dict[str, Any]] = None,
+        loader: CardLoader,
+        interface: Optional[Union[Type[DataInterface], Type[ModelInterface]]] = None,
     ):
-        super().__init__(RegistryType.DATA, card, card_args)
-        self._card = card
-
-    @cached_property
-    def card(self) -> DataCard:
-        assert isinstance(self._card, DataCard)
-        return self._card
-
-    @cached_property
-    def data_suffix(self) -> str:
-        assert isinstance(self.card.interface, DataInterface)
-        return self.card.interface.data_suffix
-
-    def _load_interface_data(self) -> None:
-        assert isinstance(self.card.interface, DataInterface)
+        """Proxy for an ArtifactCard built from its registry record. Fields stored in the registry
+        record are returned without touching storage. Accessing any other field or method loads
+        the full card once and forwards to it.
 
-        if self.card.interface.data is not None:
-            logger.info("Data already loaded")
-            return
-
-        with self._load_object(SaveName.DATA.value, self.data_suffix) as lpath:
-            self.card.interface.load_data(lpath)
-
-        return
-
-    def _load_dataset_data(self, **kwargs: Union[str, int]) -> None:
-        assert isinstance(self.card.interface, Dataset)
-
-        split = kwargs.get("split")
-
-        load_path = SaveName.DATA.value
-
-        if split is not None:
-            load_path = f"{load_path}/{split}"
-
-        with self._load_object(load_path, Suffix.NONE.value) as lpath:
-            print(lpath)
-            self.card.interface.load_data(lpath, **kwargs)
+        Args:
+            loader:
+                CardLoader with the registry record as card args
+            interface:
+                Optional interface to use when loading the card
+        """
+        assert loader.card_args is not None
+        card_type = table_name_card_map[loader.registry_type]
+
+        object.__setattr__(self, "_loader", loader)
+        object.__setattr__(self, "_interface", interface)
+        object.__setattr__(self, "_card_type", card_type)
+        object.__setattr__(self, "_card", None)
+        object.__setattr__(
+            self,
+            "_record",
+            {key: value for key, value in loader.card_args.items() if key in card_type.model_fields},
+        )
 
-    def load_data(self, **kwargs: Union[str, int]) -> None:
-        """Saves a data via data interface"""
+    @property  # type: ignore[misc]
+    def __class__(self) -> Type[ArtifactCard]:  # type: ignore[override]
+        # allows isinstance checks against the card type
+        return cast(Type[ArtifactCard], self._card_type)
 
-        if isinstance(self.card.interface, Dataset):
-            return self._load_dataset_data(**kwargs)
-        return self._load_interface_data()
+    @property
+    def is_loaded(self) -> bool:
+        return self._card is not None
 
-    def load_data_profile(self) -> None:
-        """Saves a data profile"""
+    def load(self) -> ArtifactCard:
+        """Loads the full card from storage"""
+        if self._card is None:
+            object.__setattr__(self, "_card", self._loader.load_card(interface=self._interface))
+        return cast(ArtifactCard, self._card)
 
-        if isinstance(self.card.interface, Dataset):
-            return
+    def _get_record_value(self, name: str) -> Any:
+        field = self._card_type.model_fields[name]
+        value: Any = TypeAdapter(field.annotation).validate_python(self._record[name])
 
-        if self.card.interface.data_profile is not None:
-            logger.info("Data profile already loaded")
-            return
+        # cache the validated value
+        self._record[name] = value
+        return value
 
-        # check exists
-        rpath = Path(self.card.uri, SaveName.DATA_PROFILE.value).with_suffix(Suffix.JOBLIB.value)
-        if not self.storage_client.exists(rpath):
-            return
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__") or self._card is not None or name not in self._record:
+            return getattr(self.load(), name)
 
-        # load data profile
-        with self._load_object(SaveName.DATA_PROFILE.value, Suffix.JOBLIB.value) as lpath:
-            self.card.interface.load_data_profile(lpath)
+        try:
+            return self._get_record_value(name)
+        except ValidationError:
+            return getattr(self.load(), name)
 
-        return
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self.load(), name, value)
 
-    @staticmethod
-    def validate(card_type: str) -> bool:
-        return CardType.DATACARD.value in card_type
+    def __repr__(self) -> str:
+        if self._card is not None:
+            return repr(self._card)
+        return f"LazyCard({self._card_type.__name__}, {self._record.get('uid')})"
 
 
 class ModelCardLoader(CardLoader):
@@ -337,6 +570,61 @@ class ModelCardLoader(CardLoader):
             return Suffix.ONNX.value
         return ""
 
+    def _preprocessor_artifacts(self) -> List[Tuple[str, str]]:
+        """Preprocessor artifacts that `load_preprocessor` will download"""
+        if isinstance(self.card.interface, HuggingFaceModel):
+            if self.card.interface.tokenizer is None:
+                if self._artifact_exists(Path(self.card.uri, SaveName.TOKENIZER.value)):
+                    return [(SaveName.TOKENIZER.value, "")]
+
+            if self.card.interface.feature_extractor is None:
+                if self._artifact_exists(Path(self.card.uri, SaveName.FEATURE_EXTRACTOR.value)):
+                    return [(SaveName.FEATURE_EXTRACTOR.value, "")]
+
+            return []
+
+        if getattr(self.card.interface, "preprocessor", True) is not None:
+            return []
+
+        load_rpath = Path(self.card.uri, SaveName.PREPROCESSOR.value).with_suffix(self.preprocessor_suffix)
+        if not self._artifact_exists(load_rpath):
+            return []
+
+        return [(SaveName.PREPROCESSOR.value, self.preprocessor_suffix)]
+
+    def _sample_data_artifacts(self) -> List[Tuple[str, str]]:
+        """Sample data artifacts that `_load_sample_data` will download"""
+        if self.card.interface.sample_data is not None:
+            return []
+
+        suffix = self.card.interface.data_suffix
+        if not self._artifact_exists(Path(self.card.uri, SaveName.SAMPLE_MODEL_DATA.value).with_suffix(suffix)):
+            return []
+
+        return [(SaveName.SAMPLE_MODEL_DATA.value, suffix)]
+
+    def _onnx_artifacts(self, **kwargs: Any) -> List[Tuple[str, str]]:
+        """Onnx artifacts that `_load_onnx_model` will download"""
+        if self.card.interface.onnx_model is not None:
+            return []
+
+        if isinstance(self.card.interface, HuggingFaceModel):
+            load_quantized = kwargs.get("load_quantized", False)
+            save_name = SaveName.QUANTIZED_MODEL.value if load_quantized else SaveName.ONNX_MODEL.value
+
+            if not self._artifact_exists(Path(self.card.uri, save_name)):
+                return []
+
+            artifacts = [(save_name, "")]
+            if self.card.interface.is_pipeline:
+                artifacts.extend(self._preprocessor_artifacts())
+            return artifacts
+
+        if not self._artifact_exists(Path(self.card.uri, SaveName.ONNX_MODEL.value).with_suffix(self.onnx_suffix)):
+            return []
+
+        return [(SaveName.ONNX_MODEL.value, self.onnx_suffix)]
+
     def _load_sample_data(self, lpath: Path, rpath: Path) -> None:
         """Load sample data for model interface. Sample data is always saved via joblib
 
@@ -351,7 +639,7 @@ class ModelCardLoader(CardLoader):
             return None
 
         load_rpath = Path(self.card.uri, SaveName.SAMPLE_MODEL_DATA.value).with_suffix(self.card.interface.data_suffix)
-        if not self.storage_client.exists(load_rpath):
+        if not self._artifact_exists(load_rpath):
             return None
 
         lpath = self.download(lpath, rpath, SaveName.SAMPLE_MODEL_DATA.value, self.card.interface.data_suffix)
@@ -372,14 +660,14 @@ class ModelCardLoader(CardLoader):
         if self.card.interface.tokenizer is None:
             load_rpath = Path(self.card.uri, SaveName.TOKENIZER.value)
 
-            if self.storage_client.exists(load_rpath):
+            if self._artifact_exists(load_rpath):
                 lpath = self.download(lpath, rpath, SaveName.TOKENIZER.value, "")
                 self.card.interface.load_tokenizer(lpath)
                 return
 
         if self.card.interface.feature_extractor is None:
             load_rpath = Path(self.card.uri, SaveName.FEATURE_EXTRACTOR.value)
-            if self.storage_client.exists(load_rpath):
+            if self._artifact_exists(load_rpath):
                 lpath = self.download(lpath, rpath, SaveName.FEATURE_EXTRACTOR.value, "")
                 self.card.interface.load_feature_extractor(lpath)
                 return
@@ -408,7 +696,7 @@ class ModelCardLoader(CardLoader):
             return
 
         load_rpath = Path(self.card.uri, SaveName.PREPROCESSOR.value).with_suffix(self.preprocessor_suffix)
-        if not self.storage_client.exists(load_rpath):
+        if not self._artifact_exists(load_rpath):
             return
 
         lpath = self.download(lpath, rpath, SaveName.PREPROCESSOR.value, self.preprocessor_suffix)
@@ -446,7 +734,7 @@ class ModelCardLoader(CardLoader):
         save_name = SaveName.QUANTIZED_MODEL.value if load_quantized else SaveName.ONNX_MODEL.value
 
         load_rpath = Path(rpath, save_name)
-        if not self.storage_client.exists(load_rpath):
+        if not self._artifact_exists(load_rpath):
             logger.info("No onnx model exists for {}", load_rpath.as_posix())
             return
 
@@ -477,7 +765,7 @@ class ModelCardLoader(CardLoader):
             return
 
         save_name = SaveName.ONNX_MODEL.value
-        if not self.storage_client.exists(Path(rpath, save_name).with_suffix(self.onnx_suffix)):
+        if not self._artifact_exists(Path(rpath, save_name).with_suffix(self.onnx_suffix)):
             logger.info("No onnx model exists for {}", save_name)
             return
 
@@ -489,15 +777,14 @@ class ModelCardLoader(CardLoader):
     def load_model_metadata(self) -> ModelMetadata:
         """Load model metadata to interface"""
 
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            lpath = Path(tmp_dir)
-            rpath = self.card.uri
-            load_path = self.download(lpath, rpath, SaveName.MODEL_METADATA.value, Suffix.JSON.value)
+        cached_metadata = card_cache.get(self.card.uid, ModelMetadata)
+        if cached_metadata is not None:
+            return cast(ModelMetadata, cached_metadata)
 
-            with load_path.open(encoding="utf-8") as json_file:
-                metadata = json.load(json_file)
+        rpath = Path(self.card.uri, SaveName.MODEL_METADATA.value).with_suffix(Suffix.JSON.value)
+        metadata = ModelMetadata.model_validate_json(self._read_bytes(rpath))
 
-        return ModelMetadata(**metadata)
+        return card_cache.put(self.card.uid, metadata, ModelMetadata)
 
     def load_onnx_model(self, **kwargs: Any) -> None:
         if self.card.interface.onnx_model is not None:
@@ -509,10 +796,15 @@ class ModelCardLoader(CardLoader):
             lpath = Path(tmp_dir)
             rpath = self.card.uri
 
+            artifacts = self._onnx_artifacts(**kwargs)
             if load_preprocessor:
-                self.load_preprocessor(lpath, rpath)
+                artifacts.extend(self._preprocessor_artifacts())
 
-            self._load_onnx_model(lpath, rpath, **kwargs)
+            with self._fetch(lpath, rpath, artifacts):
+                if load_preprocessor:
+                    self.load_preprocessor(lpath, rpath)
+
+                self._load_onnx_model(lpath, rpath, **kwargs)
 
         return None
 
@@ -529,10 +821,54 @@ class ModelCardLoader(CardLoader):
             lpath = Path(tmp_dir)
             rpath = self.card.uri
 
+            # the model is usually the largest artifact, so it is fetched first
+            artifacts = [(SaveName.TRAINED_MODEL.value, self.model_suffix), *self._sample_data_artifacts()]
             if load_preprocessor:
-                self.load_preprocessor(lpath, rpath)
-            self._load_sample_data(lpath, rpath)
-            self._load_model(lpath, rpath, **kwargs)
+                artifacts.extend(self._preprocessor_artifacts())
+
+            with self._fetch(lpath, rpath, artifacts):
+                if load_preprocessor:
+                    self.load_preprocessor(lpath, rpath)
+                self._load_sample_data(lpath, rpath)
+                self._load_model(lpath, rpath, **kwargs)
+
+        return None
+
+    def prefetch(self, artifacts: Sequence[str], **kwargs: Any) -> None:
+        """Downloads model artifacts to the local artifact cache without loading them.
+        Subsequent `load_*` calls for the same card read from the cache.
+
+        Args:
+            artifacts:
+                Artifacts to download. Any of "model", "onnx", "preprocessor", "sample_data"
+            kwargs:
+                load_quantized:
+                    Whether to download the quantized onnx model (HuggingFaceModel). Default is False
+        """
+        if config.opsml_artifact_cache_dir is None:
+            raise ValueError("opsml_artifact_cache_dir must be set to prefetch artifacts")
+
+        plan: List[Tuple[str, str]] = []
+        for artifact in artifacts:
+            if artifact == "model":
+                plan.append((SaveName.TRAINED_MODEL.value, self.model_suffix))
+            elif artifact == "onnx":
+                plan.extend(self._onnx_artifacts(**kwargs))
+            elif artifact == "preprocessor":
+                plan.extend(self._preprocessor_artifacts())
+            elif artifact == "sample_data":
+                plan.extend(self._sample_data_artifacts())
+            else:
+                raise ValueError(f"Unsupported artifact {artifact}. Expected one of {PREFETCH_ARTIFACTS}")
+
+        plan = list(dict.fromkeys(plan))
+        if not plan:
+            return None
+
+        lpath = Path(config.opsml_artifact_cache_dir)
+        with ThreadPoolExecutor(min(_MAX_FETCH_WORKERS, len(plan))) as executor:
+            for future in [executor.submit(self.download, lpath, self.card.uri, *artifact) for artifact in plan]:
+                future.result()
 
         return None
 
@@ -563,7 +899,7 @@ class ModelCardLoader(CardLoader):
 
         if _lpath.suffix == "":
             _lpath.mkdir(parents=True, exist_ok=True)
-        self.storage_client.get(rpath, _lpath)
+        self._get(rpath, _lpath)
 
     def _download_onnx_model(self, metadata: ModelMetadata, lpath: Path, quantize: bool = False) -> None:
         """Download onnx model
@@ -591,7 +927,7 @@ class ModelCardLoader(CardLoader):
         if _lpath.suffix == "":
             _lpath.mkdir(parents=True, exist_ok=True)
 
-        self.storage_client.get(rpath, _lpath)
+        self._get(rpath, _lpath)
 
     def _download_model(self, metadata: ModelMetadata, lpath: Path) -> None:
         """Download model
@@ -608,7 +944,7 @@ class ModelCardLoader(CardLoader):
         if _lpath.suffix == "":
             _lpath.mkdir(parents=True, exist_ok=True)
 
-        self.storage_client.get(rpath, _lpath)
+        self._get(rpath, _lpath)
 
     def download_model(self, lpath: Path, **kwargs: Any) -> None:
         """Download model and metadata
@@ -628,19 +964,26 @@ class ModelCardLoader(CardLoader):
         # load metadata
         metadata = self.load_model_metadata()
 
-        # download preprocessor
-        if load_preprocessor:
-            self._download_preprocessor(metadata, lpath)
+        with ThreadPoolExecutor(_MAX_FETCH_WORKERS) as executor:
+            # download metadata. `download` returns artifact cache paths, so the file is copied directly
+            metadata_path = Path(SaveName.MODEL_METADATA.value).with_suffix(Suffix.JSON.value)
+            futures: List[Future[Any]] = [executor.submit(self._get, rpath / metadata_path, lpath / metadata_path)]
 
-        if load_onnx:
-            self._download_onnx_model(metadata, lpath, kwargs.get("quantize", False))
+            # download preprocessor
+            if load_preprocessor:
+                futures.append(executor.submit(self._download_preprocessor, metadata, lpath))
 
-        else:
-            # download model
-            self._download_model(metadata, lpath)
+            if load_onnx:
+                futures.append(
+                    executor.submit(self._download_onnx_model, metadata, lpath, kwargs.get("quantize", False))
+                )
+
+            else:
+                # download model
+                futures.append(executor.submit(self._download_model, metadata, lpath))
 
-        # download metadata
-        self.download(lpath, rpath, SaveName.MODEL_METADATA.value, Suffix.JSON.value)
+            for future in futures:
+                future.result()
 
     @staticmethod
     def validate(card_type: str) -> bool:
@@ -2,11 +2,11 @@
 # This source code is licensed under the MIT license found in the
 # LICENSE file in the root directory of this source tree.
 import tempfile
+from concurrent.futures import Future, ThreadPoolExecutor
 from functools import cached_property
 from pathlib import Path
-from typing import Optional, cast
+from typing import List, Optional, Set, cast
 
-import joblib
 from pydantic import BaseModel
 
 from opsml.cards.audit import AuditCard
@@ -19,13 +19,18 @@ from opsml.cards.run import RunCard
 from opsml.data import DataInterface, Dataset
 from opsml.helpers.logging import ArtifactLogger
 from opsml.model.interfaces.huggingface import HuggingFaceModel
+from opsml.model.interfaces.pytorch import TorchModel
 from opsml.model.metadata_creator import _TrainedModelMetadataCreator
 from opsml.storage import client
-from opsml.types import CardType, ModelMetadata, SaveName, UriNames
+from opsml.storage.card_envelope import write_card_envelope
+from opsml.types import ArtifactManifest, CardType, ModelMetadata, SaveName, UriNames
 from opsml.types.extra import Suffix
 
 logger = ArtifactLogger.get_logger()
 
+# threads used to convert and upload model artifacts while other artifacts are being saved
+_MAX_SAVE_WORKERS = 4
+
 
 class CardUris(BaseModel):
     data_uri: Optional[Path] = None
@@ -91,6 +96,16 @@ class CardSaver:
     def card(self) -> ArtifactCard:
         return self.card
 
+    def _save_manifest(self) -> Path:
+        """Writes a manifest of all artifacts saved to lpath. Loaders use the manifest to plan
+        downloads without checking storage for each artifact"""
+        manifest = ArtifactManifest.from_path(self.lpath)
+
+        save_path = Path(self.lpath / SaveName.ARTIFACT_MANIFEST.value).with_suffix(Suffix.JSON.value)
+        save_path.write_text(manifest.model_dump_json(), "utf-8")
+
+        return save_path
+
     def save_artifacts(self) -> None:
         raise NotImplementedError
 
@@ -121,6 +136,9 @@ class DataCardSaver(CardSaver):
         save_path = (self.lpath / SaveName.DATA.value).with_suffix(self.card.interface.data_suffix)
         self.card.interface.save_data(save_path)
 
+        if self.card.interface.saved_splits:
+            self.card.interface.save_data_splits(self.lpath / SaveName.DATA_SPLITS.value)
+
         # set feature map on metadata
         self.card.metadata.feature_map = self.card.interface.feature_map
         return
@@ -156,9 +174,7 @@ class DataCardSaver(CardSaver):
 
         dumped_datacard = self.card.model_dump(exclude=exclude_attr)
 
-        save_path = Path(self.lpath / SaveName.CARD.value).with_suffix(Suffix.JOBLIB.value)
-
-        joblib.dump(dumped_datacard, save_path)
+        write_card_envelope(dumped_datacard, self.lpath)
 
     def save_artifacts(self) -> None:
         """Saves artifacts from a DataCard"""
@@ -181,6 +197,7 @@ class DataCardSaver(CardSaver):
             self._save_data()
             self._save_data_profile()
             self._save_datacard()
+            self._save_manifest()
             client.storage_client.put(self.lpath, self.rpath)
 
     @staticmethod
@@ -189,10 +206,36 @@ class DataCardSaver(CardSaver):
 
 
 class ModelCardSaver(CardSaver):
+    def __init__(self, card: ArtifactCard):
+        super().__init__(card=card)
+        self._uploaded: Set[Path] = set()
+        self._uploads: List[Future[None]] = []
+
     @cached_property
     def card(self) -> ModelCard:
         return cast(ModelCard, self._card)
 
+    def _upload(self, executor: ThreadPoolExecutor, path: Optional[Path]) -> None:
+        """Starts uploading a saved artifact (file or directory) in the background
+
+        Args:
+            executor:
+                Executor to run the upload in
+            path:
+                Local path of the artifact
+        """
+        if path is None or path in self._uploaded or not path.exists():
+            return
+
+        self._uploaded.add(path)
+        rpath = self.rpath / path.relative_to(self.lpath)
+        self._uploads.append(executor.submit(client.storage_client.put, path, rpath))
+
+    def _upload_remaining(self, executor: ThreadPoolExecutor) -> None:
+        """Uploads any saved artifacts not tracked by card uris (e.g. extra files written during conversion)"""
+        for path in self.lpath.iterdir():
+            self._upload(executor, path)
+
     def _save_model(self) -> None:
         """Saves a model via model interface"""
 
@@ -313,7 +356,7 @@ class ModelCardSaver(CardSaver):
         save_path = Path(self.lpath / SaveName.MODEL_METADATA.value).with_suffix(Suffix.JSON.value)
         save_path.write_text(model_metadata.model_dump_json(), "utf-8")
 
-    def _save_modelcard(self) -> None:
+    def _save_modelcard(self) -> Path:
         """Saves a modelcard to file system"""
 
         dumped_model = self.card.model_dump(
@@ -325,8 +368,7 @@ class ModelCardSaver(CardSaver):
             if dumped_model["interface"]["onnx_args"].get("config") is not None:
                 dumped_model["interface"]["onnx_args"].pop("config")
 
-        save_path = Path(self.lpath / SaveName.CARD.value).with_suffix(Suffix.JOBLIB.value)
-        joblib.dump(dumped_model, save_path)
+        return write_card_envelope(dumped_model, self.lpath)
 
     def save_artifacts(self) -> None:
         """Prepares and saves artifacts from a modelcard"""
@@ -337,18 +379,51 @@ class ModelCardSaver(CardSaver):
         self.card.metadata.interface_type = self.card.interface.__class__.__name__
         self.card.interface.modelcard_uid = str(self.card.uid)
 
-        with tempfile.TemporaryDirectory() as tmp_dir:
+        with tempfile.TemporaryDirectory() as tmp_dir, ThreadPoolExecutor(_MAX_SAVE_WORKERS) as executor:
             self.card_uris.lpath = Path(tmp_dir)
             self.card_uris.rpath = self.card.uri
 
+            # Each artifact is uploaded as soon as it is written
             self._save_model()
-            self._save_preprocessor()
-            self._save_onnx_model()
+            self._upload(executor, self.card_uris.trained_model_uri)
+
+            # onnx conversion is typically the slowest step, so it runs alongside the preprocessor and
+            # sample data saves. HuggingFace conversion reloads the saved artifacts from disk and torch
+            # export traces the same nn.Module, so both are converted sequentially
+            onnx_future: Optional[Future[None]] = None
+            if isinstance(self.card.interface, (HuggingFaceModel, TorchModel)):
+                self._save_preprocessor()
+                self._save_onnx_model()
+            else:
+                onnx_future = executor.submit(self._save_onnx_model)
+                self._save_preprocessor()
+
+            self._upload(executor, self.card_uris.preprocessor_uri)
+            self._upload(executor, self.card_uris.tokenizer_uri)
+            self._upload(executor, self.card_uris.feature_extractor_uri)
+
             self._save_sample_data()
-            self._save_modelcard()
+            self._upload(executor, self.card_uris.sample_data_uri)
+
+            if onnx_future is not None:
+                onnx_future.result()
+            self._upload(executor, self.card_uris.onnx_model_uri)
+            self._upload(executor, self.card_uris.quantized_model_uri)
+            self._upload_remaining(executor)
+
+            for upload in self._uploads:
+                upload.result()
+
+            # metadata and card are written last so a card is never visible before its artifacts
+            card_path = self._save_modelcard()
             self._save_metadata()
 
-            client.storage_client.put(self.lpath, self.rpath)
+            manifest_path = self._save_manifest()
+
+            metadata_path = Path(self.lpath / SaveName.MODEL_METADATA.value).with_suffix(Suffix.JSON.value)
+            client.storage_client.put(metadata_path, self.rpath / metadata_path.name)
+            client.storage_client.put(manifest_path, self.rpath / manifest_path.name)
+            client.storage_client.put(card_path, self.rpath / card_path.name)
 
     @staticmethod
     def validate(card_type: str) -> bool:
@@ -362,9 +437,7 @@ class AuditCardSaver(CardSaver):
 
     def _save_auditcard(self) -> None:
         """Save auditcard to file"""
-        dumped_audit = self.card.model_dump()
-        save_path = Path(self.lpath, SaveName.CARD.value).with_suffix(Suffix.JOBLIB.value)
-        joblib.dump(dumped_audit, save_path)
+        write_card_envelope(self.card.model_dump(), self.lpath)
 
     def save_artifacts(self) -> None:
         """Save auditcard artifacts"""
@@ -388,8 +461,7 @@ class RunCardSaver(CardSaver):
         """Saves a runcard"""
 
         dumped_run = self.card.model_dump(exclude={"metrics"})  # metrics are recorded to db
-        save_path = Path(self.lpath / SaveName.CARD.value).with_suffix(Suffix.JOBLIB.value)
-        joblib.dump(dumped_run, save_path)
+        write_card_envelope(dumped_run, self.lpath)
 
     def save_artifacts(self) -> None:
         """Saves a runcard's artifacts"""
@@ -411,9 +483,7 @@ class PipelineCardSaver(CardSaver):
 
     def _save_pipelinecard(self) -> None:
         """Saves a pipelinecard"""
-        dumped_audit = self.card.model_dump()
-        save_path = Path(self.lpath, SaveName.CARD.value).with_suffix(Suffix.JOBLIB.value)
-        joblib.dump(dumped_audit, save_path)
+        write_card_envelope(self.card.model_dump(), self.lpath)
 
     def save_artifacts(self) -> None:
         """Saves a pipelinecard's artifacts"""
@@ -435,9 +505,7 @@ class ProjectCardSaver(CardSaver):
 
     def _save_projectcard(self) -> None:
         """Saves a projectcard"""
-        dumped_audit = self.card.model_dump()
-        save_path = Path(self.lpath, SaveName.CARD.value).with_suffix(Suffix.JOBLIB.value)
-        joblib.dump(dumped_audit, save_path)
+        write_card_envelope(self.card.model_dump(), self.lpath)
 
     def save_artifacts(self) -> None:
         """Saves a projectcard's artifacts"""
@@ -6,10 +6,16 @@
 
 import datetime
 import io
+import os
+import shutil
+import tempfile
+import threading
 import warnings
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from functools import cached_property
 from pathlib import Path
-from typing import Any, BinaryIO, Iterator, List, Optional, Protocol, cast
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Protocol, cast
 
 from fsspec.implementations.local import LocalFileSystem
 
@@ -19,6 +25,7 @@ from opsml.storage.api import ApiClient, ApiRoutes, RequestType
 from opsml.types import (
     ApiStorageClientSettings,
     BotoClient,
+    CloudStorageClientSettings,
     GCSClient,
     GcsStorageClientSettings,
     S3StorageClientSettings,
@@ -33,6 +40,9 @@ warnings.filterwarnings("ignore", message="Hint: Inferred schema contains intege
 
 logger = ArtifactLogger.get_logger()
 
+# concurrent downloads through the read cache when max_concurrency is not set
+_MAX_CACHED_GET_WORKERS = 8
+
 
 class _FileSystemProtocol(Protocol):
     """
@@ -55,7 +65,7 @@ class _FileSystemProtocol(Protocol):
        str for paths.
     """
 
-    def get(self, lpath: str, rpath: str, recursive: bool) -> None:
+    def get(self, lpath: str, rpath: str, recursive: bool, **kwargs: Any) -> None:
         """Copies file(s) from remote path (rpath) to local path (lpath)"""
 
     def ls(self, path: str) -> List[str]:  # pylint:  disable=invalid-name
@@ -70,7 +80,7 @@ class _FileSystemProtocol(Protocol):
     def iterfile(self, path: str, chunk_size: int) -> Iterator[bytes]:
         """Open an iterator"""
 
-    def put(self, lpath: str, rpath: str, recursive: bool) -> None:
+    def put(self, lpath: str, rpath: str, recursive: bool, **kwargs: Any) -> None:
         """Copies file(s) from local path (lpath) to remote path (rpath)"""
 
     def copy(self, src: str, dest: str, recursive: bool) -> None:
@@ -82,6 +92,9 @@ class _FileSystemProtocol(Protocol):
     def exists(self, path: str) -> bool:
         """Determines if a file or directory exists"""
 
+    def get_mapper(self, root: str) -> Mapping[str, bytes]:
+        """Key-value mapping of the files under root"""
+
 
 class StorageClientBase(StorageClientProtocol):
     def __init__(
@@ -95,7 +108,18 @@ class StorageClientBase(StorageClientProtocol):
             self.client = client
         self.settings = settings
 
-    def get(self, rpath: Path, lpath: Path) -> None:
+    def get(self, rpath: Path, lpath: Path, files: Optional[List[Path]] = None) -> None:
+        """Copies file(s) from remote path (rpath) to local path (lpath)
+
+        Args:
+            rpath:
+                Remote path
+            lpath:
+                Local path
+            files:
+                Optional list of remote files under rpath. Only used by clients that would
+                otherwise need to list rpath before downloading
+        """
         # handle rpath
         if rpath.suffix:
             recursive = False
@@ -110,7 +134,11 @@ class StorageClientBase(StorageClientProtocol):
         else:
             abs_lpath = f"{str(lpath)}/"
 
-        self.client.get(rpath=abs_rpath, lpath=abs_lpath, recursive=recursive)
+        self.client.get(rpath=abs_rpath, lpath=abs_lpath, recursive=recursive, **self._transfer_kwargs())
+
+    def _transfer_kwargs(self, upload: bool = False) -> Dict[str, Any]:
+        """Extra kwargs passed to the file system when getting or putting files"""
+        return {}
 
     def ls(self, path: Path) -> List[Path]:
         return [Path(p) for p in self.client.ls(str(path))]
@@ -126,6 +154,26 @@ class StorageClientBase(StorageClientProtocol):
             while chunk := file_.read(chunk_size):
                 yield chunk
 
+    def read_bytes(self, path: Path) -> bytes:
+        """Reads a file into memory without writing it to a local path
+
+        Args:
+            path:
+                Path to file
+        """
+        with self.open(path, "rb") as file_:
+            return file_.read()
+
+    def get_mapper(self, path: Path) -> Mapping[str, bytes]:
+        """Key-value mapping of the files under a path. Values are read on access, so stores like zarr
+        only fetch the keys they need
+
+        Args:
+            path:
+                Root path of the mapping
+        """
+        return self.client.get_mapper(str(path))
+
     def iterbuffer(self, buffer: io.BytesIO, chunk_size: int) -> Iterator[bytes]:
         buffer.seek(0)
         while chunk := buffer.read(chunk_size):
@@ -135,9 +183,9 @@ class StorageClientBase(StorageClientProtocol):
         if lpath.is_dir():
             abs_lpath = f"{str(lpath)}/"  # pathlib strips trailing slashes
             abs_rpath = f"{str(rpath)}/"
-            self.client.put(abs_lpath, abs_rpath, True)
+            self.client.put(abs_lpath, abs_rpath, True, **self._transfer_kwargs(upload=True))
         else:
-            self.client.put(str(lpath), str(rpath), False)
+            self.client.put(str(lpath), str(rpath), False, **self._transfer_kwargs(upload=True))
 
     def copy(self, src: Path, dest: Path) -> None:
         self.client.copy(str(src), str(dest), recursive=True)
@@ -156,7 +204,149 @@ class StorageClientBase(StorageClientProtocol):
         return path.as_posix()
 
 
-class GCSFSStorageClient(StorageClientBase):
+def _disk_usage(entry: os.DirEntry[str]) -> int:
+    """Bytes allocated on disk for a file. Block caches write sparse files, so the allocated
+    blocks are used rather than the apparent file size"""
+    stat = entry.stat()
+    blocks: Optional[int] = getattr(stat, "st_blocks", None)  # not available on windows
+
+    return stat.st_size if blocks is None else blocks * 512
+
+
+class CloudStorageClientBase(StorageClientBase):
+    def __init__(
+        self,
+        settings: StorageSettings,
+        client: _FileSystemProtocol,
+    ):
+        """Base class for object store clients. Directories are transferred with fsspec's concurrent
+        batch APIs. Reads and downloads can optionally be served from a bounded local cache, so hot
+        objects (popular models, cards) are only downloaded from the bucket once.
+
+        Args:
+            settings:
+                Storage client settings
+            client:
+                fsspec file system of the object store
+        """
+        super().__init__(settings=settings, client=client)
+
+        assert isinstance(settings, CloudStorageClientSettings)
+        self._cache_lock = threading.Lock()
+        self._cache_mtime: Optional[int] = None
+        self.cache_client = self._get_cache_client(settings)
+
+    def _get_cache_client(self, settings: CloudStorageClientSettings) -> Optional[_FileSystemProtocol]:
+        if settings.cache_type is None:
+            return None
+
+        from fsspec.implementations.cached import (
+            CachingFileSystem,
+            WholeFileCacheFileSystem,
+        )
+
+        cache_fs = CachingFileSystem if settings.cache_type == "blockcache" else WholeFileCacheFileSystem
+        cache_dir = settings.cache_dir or tempfile.mkdtemp(prefix="opsml-storage-cache-")
+        Path(cache_dir).mkdir(parents=True, exist_ok=True)
+
+        logger.info("Caching {} reads in {}", settings.storage_system.value, cache_dir)
+
+        # check_files compares the cached file with the remote file, so overwritten objects are never served stale
+        return cast(
+            _FileSystemProtocol,
+            cache_fs(fs=self.client, cache_storage=cache_dir, check_files=True, expiry_time=False),
+        )
+
+    def _transfer_kwargs(self, upload: bool = False) -> Dict[str, Any]:
+        assert isinstance(self.settings, CloudStorageClientSettings)
+
+        kwargs: Dict[str, Any] = {}
+        if self.settings.max_concurrency is not None:
+            kwargs["batch_size"] = self.settings.max_concurrency
+
+        if upload and self.settings.chunk_size is not None:
+            kwargs["chunksize"] = self.settings.chunk_size
+
+        return kwargs
+
+    def get(self, rpath: Path, lpath: Path, files: Optional[List[Path]] = None) -> None:
+        """Copies file(s) from remote path (rpath) to local path (lpath). If the read cache is enabled,
+        files are copied from the cache so repeated downloads of an object only fetch it once
+
+        Args:
+            rpath:
+                Remote path
+            lpath:
+                Local path
+            files:
+                Optional list of remote files under rpath. If provided, rpath is not listed
+                before downloading
+        """
+        if self.cache_client is None:
+            super().get(rpath, lpath, files)
+            return
+
+        if rpath.suffix:
+            transfers = [(rpath, (lpath.parent if lpath.suffix else lpath) / rpath.name)]
+        else:
+            remote_files = files if files is not None else self.find(rpath)
+            transfers = [(Path(file), lpath / Path(file).relative_to(rpath)) for file in remote_files]
+
+        assert isinstance(self.settings, CloudStorageClientSettings)
+        with ThreadPoolExecutor(self.settings.max_concurrency or _MAX_CACHED_GET_WORKERS) as executor:
+            for future in [executor.submit(self._get_cached_file, *transfer) for transfer in transfers]:
+                future.result()
+
+        self._trim_cache()
+
+    def _get_cached_file(self, rpath: Path, lpath: Path) -> None:
+        """Copies a single remote file to a local path through the read cache"""
+        lpath.parent.mkdir(parents=True, exist_ok=True)
+
+        with self.cache_client.open(str(rpath), mode="rb") as remote_file:  # type: ignore[union-attr]
+            with lpath.open("wb") as local_file:
+                shutil.copyfileobj(remote_file, local_file)
+
+    def open(self, path: Path, mode: str, encoding: Optional[str] = None) -> BinaryIO:
+        if self.cache_client is None or "r" not in mode:
+            return super().open(path, mode, encoding)
+
+        file_ = self.cache_client.open(str(path), mode=mode, encoding=encoding)
+        self._trim_cache()
+
+        return file_
+
+    def _trim_cache(self) -> None:
+        """Removes the least recently used files from the read cache once it is over its size limit.
+        The cache is only scanned after files have been written to it, which is detected from the
+        modification time of the cache directory, so reads served from the cache don't scan it"""
+        assert isinstance(self.settings, CloudStorageClientSettings)
+
+        cache_dir = self.cache_client.storage[-1]  # type: ignore[union-attr]
+
+        with self._cache_lock:
+            if os.stat(cache_dir).st_mtime_ns == self._cache_mtime:
+                return
+
+            # "cache" holds fsspec's cache metadata. Cached files that are removed are downloaded again on the next read
+            files = [entry for entry in os.scandir(cache_dir) if entry.is_file() and entry.name != "cache"]
+            cache_size = sum(_disk_usage(entry) for entry in files)
+
+            if cache_size > self.settings.cache_max_bytes:
+                for entry in sorted(files, key=lambda entry: max(entry.stat().st_atime, entry.stat().st_mtime)):
+                    try:
+                        cache_size -= _disk_usage(entry)
+                        os.remove(entry.path)
+                    except FileNotFoundError:
+                        continue
+
+                    if cache_size <= self.settings.cache_max_bytes:
+                        break
+
+            self._cache_mtime = os.stat(cache_dir).st_mtime_ns
+
+
+class GCSFSStorageClient(CloudStorageClientBase):
     def __init__(
         self,
         settings: StorageSettings,
@@ -166,11 +356,12 @@ class GCSFSStorageClient(StorageClientBase):
         assert isinstance(settings, GcsStorageClientSettings)
         if settings.default_creds is None:
             logger.info("Using default GCP credentials")
-            client = gcsfs.GCSFileSystem()
+            client = gcsfs.GCSFileSystem(block_size=settings.block_size)
         else:
             client = gcsfs.GCSFileSystem(
                 project=settings.gcp_project,
                 token=settings.credentials,
+                block_size=settings.block_size,
             )
 
         super().__init__(
@@ -221,7 +412,7 @@ class GCSFSStorageClient(StorageClientBase):
             return None
 
 
-class S3StorageClient(StorageClientBase):
+class S3StorageClient(CloudStorageClientBase):
     def __init__(
         self,
         settings: StorageSettings,
@@ -229,7 +420,7 @@ class S3StorageClient(StorageClientBase):
         import s3fs
 
         assert isinstance(settings, S3StorageClientSettings)
-        client = s3fs.S3FileSystem()
+        client = s3fs.S3FileSystem(default_block_size=settings.block_size)
 
         super().__init__(
             settings=settings,
@@ -284,10 +475,20 @@ class ApiStorageClient(StorageClientBase):
             token=settings.opsml_prod_token,
         )
 
-    def get(self, rpath: Path, lpath: Path, recursive: bool = True) -> None:
-        """Copies file(s) from remote path (rpath) to local path (lpath)"""
+    def get(self, rpath: Path, lpath: Path, files: Optional[List[Path]] = None) -> None:
+        """Copies file(s) from remote path (rpath) to local path (lpath)
 
-        for file in self.find(rpath):
+        Args:
+            rpath:
+                Remote path
+            lpath:
+                Local path
+            files:
+                Optional list of remote files under rpath. If provided, rpath is not listed
+                before downloading
+        """
+
+        for file in files if files is not None else self.find(rpath):
             _rpath = Path(file)
 
             # for single files
@@ -343,7 +544,44 @@ class ApiStorageClient(StorageClientBase):
         raise NotImplementedError
 
     def open(self, path: Path, mode: str, encoding: Optional[str] = None) -> BinaryIO:
-        raise NotImplementedError
+        """Opens a remote file for reading. The file is read into memory, so this should only
+        be used for small files. Writing is not supported
+
+        Args:
+            path:
+                Path to file
+            mode:
+                Read mode
+            encoding:
+                Not used
+        """
+        if mode != "rb":
+            raise NotImplementedError("ApiStorageClient only supports opening files in 'rb' mode")
+
+        return cast(BinaryIO, io.BytesIO(self.read_bytes(path)))
+
+    def read_bytes(self, path: Path) -> bytes:
+        """Reads a file from the server into memory
+
+        Args:
+            path:
+                Path to file
+        """
+        return self.api_client.stream_download_bytes_request(
+            route=ApiRoutes.DOWNLOAD_FILE,
+            read_path=path,
+            chunk_size=config.download_chunk_size,
+        )
+
+    def get_mapper(self, path: Path) -> Mapping[str, bytes]:
+        """Read only key-value mapping of the files under a path on the server. Values are downloaded
+        on access
+
+        Args:
+            path:
+                Root path of the mapping
+        """
+        return ApiStorageMapper(self, path)
 
     def rm(self, path: Path) -> None:
         response = self.api_client.request(
@@ -371,16 +609,58 @@ class ApiStorageClient(StorageClientBase):
         return bool(response.get("exists", False))
 
 
-def _get_gcs_settings(storage_uri: str) -> GcsStorageClientSettings:
+class ApiStorageMapper(Mapping[str, bytes]):
+    def __init__(self, api_storage_client: ApiStorageClient, root: Path):
+        """Read only key-value mapping of the files under a path on the server
+
+        Args:
+            api_storage_client:
+                Api storage client
+            root:
+                Root path. Keys are paths relative to root
+        """
+        self.storage_client = api_storage_client
+        self.root = root
+
+    def __getitem__(self, key: str) -> bytes:
+        try:
+            return self.storage_client.read_bytes(self.root / key)
+        except FileNotFoundError as error:
+            raise KeyError(key) from error
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self.storage_client.exists(self.root / key)
+
+    def __iter__(self) -> Iterator[str]:
+        for path in self.storage_client.find(self.root):
+            yield path.relative_to(self.root).as_posix()
+
+    def __len__(self) -> int:
+        return len(self.storage_client.find(self.root))
+
+
+def _get_transfer_settings(cfg: OpsmlConfig) -> Dict[str, Any]:
+    return {
+        "max_concurrency": cfg.opsml_storage_max_concurrency,
+        "chunk_size": cfg.opsml_storage_chunk_size,
+        "block_size": cfg.opsml_storage_block_size,
+        "cache_type": cfg.opsml_storage_cache_type,
+        "cache_dir": cfg.opsml_storage_cache_dir,
+        "cache_max_bytes": cfg.opsml_storage_cache_max_bytes,
+    }
+
+
+def _get_gcs_settings(cfg: OpsmlConfig) -> GcsStorageClientSettings:
     from opsml.helpers.gcp_utils import GcpCredsSetter
 
     gcp_creds = GcpCredsSetter().get_creds()
 
     return GcsStorageClientSettings(
-        storage_uri=storage_uri,
+        storage_uri=cfg.opsml_storage_uri,
         gcp_project=gcp_creds.project,
         credentials=gcp_creds.creds,
         default_creds=gcp_creds.default_creds,
+        **_get_transfer_settings(cfg),
     )
 
 
@@ -396,9 +676,14 @@ def get_storage_client(cfg: OpsmlConfig) -> StorageClientBase:
             )
         )
     if cfg.storage_system == StorageSystem.GCS:
-        return GCSFSStorageClient(_get_gcs_settings(storage_uri=cfg.opsml_storage_uri))
+        return GCSFSStorageClient(_get_gcs_settings(cfg))
     if cfg.storage_system == StorageSystem.S3:
-        return S3StorageClient(S3StorageClientSettings(storage_uri=cfg.opsml_storage_uri))
+        return S3StorageClient(
+            S3StorageClientSettings(
+                storage_uri=cfg.opsml_storage_uri,
+                **_get_transfer_settings(cfg),
+            )
+        )
     return LocalStorageClient(StorageClientSettings(storage_uri=cfg.opsml_storage_uri))
 
 
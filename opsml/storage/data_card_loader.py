@@ -0,0 +1,239 @@
+# Copyright (c) Shipt, Inc.
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+from functools import cached_property
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from opsml.cards import DataCard
+from opsml.data.interfaces._base import DataInterface
+from opsml.data.interfaces.custom_data.base import Dataset
+from opsml.helpers.logging import ArtifactLogger
+from opsml.storage import client
+from opsml.storage.card_loader import CardLoader
+from opsml.types import AllowedDataType, CardType, RegistryType, SaveName, Suffix
+
+logger = ArtifactLogger.get_logger()
+
+# data types saved to parquet by their interfaces (supports column and filter pushdown)
+_PARQUET_DATA_TYPES = (AllowedDataType.PANDAS.value, AllowedDataType.POLARS.value, AllowedDataType.PYARROW.value)
+
+
+class DataCardLoader(CardLoader):
+    """DataCard loader. Methods are meant to be called individually"""
+
+    def __init__(
+        self,
+        card: Optional[DataCard] = None,
+        card_args: Optional[Dict[str, Any]] = None,
+    ):
+        super().__init__(RegistryType.DATA, card, card_args)
+        self._card = card
+
+    @cached_property
+    def card(self) -> DataCard:
+        assert isinstance(self._card, DataCard)
+        return self._card
+
+    @cached_property
+    def data_suffix(self) -> str:
+        assert isinstance(self.card.interface, DataInterface)
+        return self.card.interface.data_suffix
+
+    def _load_interface_data(
+        self,
+        columns: Optional[List[str]] = None,
+        filters: Optional[Any] = None,
+        split: Optional[str] = None,
+        lazy: bool = False,
+    ) -> None:
+        assert isinstance(self.card.interface, DataInterface)
+
+        if self.card.interface.data is not None:
+            logger.info("Data already loaded")
+            return
+
+        object_path = SaveName.DATA.value
+        if split is not None:
+            if split not in self.card.interface.saved_splits:
+                self._load_split_from_data(split, columns, filters, lazy)
+                return
+            object_path = f"{SaveName.DATA_SPLITS.value}/{split}"
+
+        if lazy:
+            self._scan_interface_data(object_path, columns, filters)
+            return
+
+        rpath = Path(self.card.uri, object_path).with_suffix(self.data_suffix)
+
+        # only cached artifacts outlive the load, so temporary downloads are not memory mapped
+        is_cached = self._cache_path(rpath) is not None
+
+        if columns is None and filters is None:
+            with self._load_object(object_path, self.data_suffix) as lpath:
+                self.card.interface.load_data(lpath, memory_map=is_cached)
+            return
+
+        if self.card.interface.data_type not in _PARQUET_DATA_TYPES:
+            raise ValueError(f"columns and filters are not supported for {self.card.interface.name()}")
+
+        # read directly from storage so only the selected columns and row groups are fetched.
+        # The api client can't do range reads and cached artifacts are already local
+        if not isinstance(self.storage_client, client.ApiStorageClient) and not is_cached:
+            self.card.interface.load_data(
+                rpath,
+                columns=columns,
+                filters=filters,
+                filesystem=self.storage_client.client,
+            )
+            return
+
+        with self._load_object(object_path, self.data_suffix) as lpath:
+            self.card.interface.load_data(lpath, columns=columns, filters=filters, memory_map=is_cached)
+
+        return
+
+    def _scan_interface_data(self, object_path: str, columns: Optional[List[str]], filters: Optional[Any]) -> None:
+        """Lazily loads data to a polars LazyFrame or a zarr array. Files are scanned from the artifact cache
+        or directly from storage, so they outlive the load"""
+        assert isinstance(self.card.interface, DataInterface)
+
+        rpath = Path(self.card.uri, object_path).with_suffix(self.data_suffix)
+
+        # zarr chunks are read through a mapping over the storage client, so slices only fetch the chunks they touch
+        if self.card.interface.data_type == AllowedDataType.NUMPY.value:
+            if columns is not None or filters is not None:
+                raise ValueError(f"columns and filters are not supported for {self.card.interface.name()}")
+
+            self.card.interface.load_data(rpath, lazy=True, store=self.storage_client.get_mapper(rpath))
+            return
+
+        if self.card.interface.data_type != AllowedDataType.POLARS.value:
+            raise ValueError(f"Lazy loading is not supported for {self.card.interface.name()}")
+
+        cache_path = self._cache_path(rpath)
+        if cache_path is not None:
+            lpath = self._get_cached(rpath, cache_path)
+            self.card.interface.load_data(lpath, columns=columns, filters=filters, lazy=True)
+            return
+
+        if isinstance(self.storage_client, client.ApiStorageClient):
+            raise ValueError(
+                "Lazy loading in client mode requires a local artifact cache to scan. Set OPSML_ARTIFACT_CACHE_DIR"
+            )
+
+        self.card.interface.load_data(
+            rpath,
+            columns=columns,
+            filters=filters,
+            filesystem=self.storage_client.client,
+            lazy=True,
+        )
+
+    def _load_split_from_data(
+        self,
+        split: str,
+        columns: Optional[List[str]],
+        filters: Optional[Any],
+        lazy: bool,
+    ) -> None:
+        """Loads the full data and keeps the rows of a split. Used for splits that were not saved individually"""
+        assert isinstance(self.card.interface, DataInterface)
+
+        if columns is not None or filters is not None or lazy:
+            raise ValueError(
+                f"columns, filters and lazy can't be combined with split {split} because it was not saved "
+                "individually. Use ParquetWriteOptions(save_splits=True) to save splits individually"
+            )
+
+        self._load_interface_data()
+        self.card.interface.data = self.card.interface.get_split_rows(split)
+
+    def _load_dataset_data(self, **kwargs: Union[str, int]) -> None:
+        assert isinstance(self.card.interface, Dataset)
+
+        split = kwargs.get("split")
+
+        load_path = SaveName.DATA.value
+
+        if split is not None:
+            load_path = f"{load_path}/{split}"
+
+        with self._load_object(load_path, Suffix.NONE.value) as lpath:
+            print(lpath)
+            self.card.interface.load_data(lpath, **kwargs)
+
+    def load_data(
+        self,
+        columns: Optional[List[str]] = None,
+        filters: Optional[Any] = None,
+        **kwargs: Union[str, int],
+    ) -> None:
+        """Loads data via data interface
+
+        Args:
+            columns:
+                Optional list of columns to load (parquet data only)
+            filters:
+                Optional row filters to apply while reading (parquet data only)
+            kwargs:
+                Kwargs passed to `Dataset` interfaces. `split` is also supported for `DataInterface`
+                subclasses and loads only the rows of a `DataSplit`. `lazy` loads `PolarsData` to a LazyFrame
+                and `NumpyData` to a zarr array
+        """
+
+        if isinstance(self.card.interface, Dataset):
+            if columns is not None or filters is not None:
+                raise ValueError("columns and filters are not supported for Dataset interfaces")
+            return self._load_dataset_data(**kwargs)
+
+        split = kwargs.get("split")
+        return self._load_interface_data(
+            columns=columns,
+            filters=filters,
+            split=str(split) if split is not None else None,
+            lazy=bool(kwargs.get("lazy", False)),
+        )
+
+    def stream_data(self, **kwargs: Any) -> Any:
+        """Returns an iterable over the records of a `Dataset` that reads its parquet shards
+        straight from storage
+
+        Args:
+            kwargs:
+                Kwargs passed to `Dataset.stream_data`
+        """
+        if not isinstance(self.card.interface, Dataset):
+            raise ValueError("Streaming is only supported for Dataset interfaces")
+
+        return self.card.interface.stream_data(
+            Path(self.card.uri, SaveName.DATA.value),
+            storage_client=self.storage_client,
+            **kwargs,
+        )
+
+    def load_data_profile(self) -> None:
+        """Saves a data profile"""
+
+        if isinstance(self.card.interface, Dataset):
+            return
+
+        if self.card.interface.data_profile is not None:
+            logger.info("Data profile already loaded")
+            return
+
+        # check exists
+        rpath = Path(self.card.uri, SaveName.DATA_PROFILE.value).with_suffix(Suffix.JOBLIB.value)
+        if not self._artifact_exists(rpath):
+            return
+
+        # load data profile
+        with self._load_object(SaveName.DATA_PROFILE.value, Suffix.JOBLIB.value) as lpath:
+            self.card.interface.load_data_profile(lpath)
+
+        return
+
+    @staticmethod
+    def validate(card_type: str) -> bool:
+        return CardType.DATACARD.value in card_type
@@ -17,7 +17,14 @@ from opsml.types.card import (
     RunCardArgs,
     RunGraph,
 )
-from opsml.types.data import AllowedDataType, AllowedTableTypes, DataCardMetadata
+from opsml.types.data import (
+    AllowedDataType,
+    AllowedTableTypes,
+    DataCardMetadata,
+    IpcWriteOptions,
+    ParquetWriteOptions,
+    ZarrWriteOptions,
+)
 from opsml.types.extra import (
     ArtifactClass,
     CommonKwargs,
@@ -59,10 +66,13 @@ from opsml.types.model import (
     ValidModelInput,
     ValidSavedSample,
 )
-from opsml.types.sql import RegistryTableNames, RunCardRegistry
+from opsml.types.sql import LineageDirection, RegistryTableNames, RunCardRegistry
 from opsml.types.storage import (
     ApiStorageClientSettings,
+    ArtifactFile,
+    ArtifactManifest,
     BotoClient,
+    CloudStorageClientSettings,
     FilePath,
     GCSClient,
     GcsStorageClientSettings,
@@ -76,6 +86,8 @@ from opsml.types.storage import (
 __all__ = [
     "NON_PIPELINE_CARDS",
     "Artifact",
+    "ArtifactFile",
+    "ArtifactManifest",
     "ArtifactUris",
     "AuditCardMetadata",
     "AuditSectionType",
@@ -91,6 +103,9 @@ __all__ = [
     "RegistryType",
     "RunCardArgs",
     "AllowedDataType",
+    "ParquetWriteOptions",
+    "IpcWriteOptions",
+    "ZarrWriteOptions",
     "AllowedTableTypes",
     "DataCardMetadata",
     "ArtifactClass",
@@ -129,6 +144,7 @@ __all__ = [
     "ValidModelInput",
     "ValidSavedSample",
     "ApiStorageClientSettings",
+    "CloudStorageClientSettings",
     "FilePath",
     "GcsStorageClientSettings",
     "S3StorageClientSettings",
@@ -138,6 +154,7 @@ __all__ = [
     "StorageSystem",
     "RegistryTableNames",
     "RunCardRegistry",
+    "LineageDirection",
     "GraphStyle",
     "BotoClient",
     "GCSClient",
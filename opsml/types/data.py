@@ -4,7 +4,7 @@
 # LICENSE file in the root directory of this source tree.
 
 from enum import Enum
-from typing import Dict, Optional, Union
+from typing import Dict, List, Literal, Optional, Tuple, Union
 
 from pydantic import BaseModel
 
@@ -43,6 +43,82 @@ class AllowedDataType(str, Enum):
     JOBLIB = "joblib"
 
 
+class ParquetWriteOptions(BaseModel):
+    """Options used when saving pandas, polars and arrow data to parquet
+
+    Args:
+        row_group_size:
+            Max number of rows per row group. Smaller row groups allow filtered reads to skip more data
+        compression:
+            Compression codec (snappy, zstd, gzip, brotli, lz4, none)
+        compression_level:
+            Optional compression level for codecs that support it
+        use_dictionary:
+            Whether to dictionary encode columns
+        write_statistics:
+            Whether to write column statistics. Statistics are used to skip row groups when filtering
+        partition_cols:
+            Optional columns to partition data by. Data is written as a hive partitioned directory
+        max_rows_per_file:
+            Optional max number of rows per file. Data is written as a directory of files
+        save_splits:
+            Whether to also write the rows of each `DataSplit` to their own parquet file (or directory) when saving.
+            Saved splits can be loaded on their own with `DataCard.load_data(split=...)`
+    """
+
+    row_group_size: Optional[int] = None
+    compression: str = "snappy"
+    compression_level: Optional[int] = None
+    use_dictionary: bool = True
+    write_statistics: bool = True
+    partition_cols: Optional[List[str]] = None
+    max_rows_per_file: Optional[int] = None
+    save_splits: bool = False
+
+    @property
+    def is_dataset(self) -> bool:
+        """Whether data is written as a multi-file dataset directory"""
+        return bool(self.partition_cols) or self.max_rows_per_file is not None
+
+
+class IpcWriteOptions(BaseModel):
+    """Options used when saving arrow data to Arrow IPC (Feather v2) instead of parquet
+
+    Args:
+        compression:
+            Optional compression codec (lz4, zstd). Uncompressed files in the artifact cache are memory mapped
+            at load time, so loading doesn't copy or decode data and the pages of a cached file are shared across
+            processes. Compressed files and files that aren't cached are read into memory
+        chunksize:
+            Optional max number of rows per record batch
+    """
+
+    compression: Optional[Literal["lz4", "zstd"]] = None
+    chunksize: Optional[int] = None
+
+
+class ZarrWriteOptions(BaseModel):
+    """Options used when saving numpy data to zarr
+
+    Args:
+        chunks:
+            Optional chunk shape. A None dimension is not chunked, e.g. (1024, None) chunks rows only.
+            Lazily loaded arrays only fetch the chunks a slice touches, so chunks should follow the
+            expected read pattern. Defaults to zarr's automatic chunking
+        compressor:
+            Blosc compressor (zstd, lz4, lz4hc, blosclz, zlib). None disables compression
+        compression_level:
+            Compression level (0-9)
+        shuffle:
+            Blosc shuffle filter (shuffle, bitshuffle, noshuffle)
+    """
+
+    chunks: Optional[Tuple[Optional[int], ...]] = None
+    compressor: Optional[Literal["zstd", "lz4", "lz4hc", "blosclz", "zlib"]] = "lz4"
+    compression_level: int = 5
+    shuffle: Literal["shuffle", "bitshuffle", "noshuffle"] = "shuffle"
+
+
 class DataCardMetadata(BaseModel):
 
     """Create a DataCard metadata
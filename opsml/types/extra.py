@@ -71,6 +71,7 @@ class SaveName(str, Enum):
     SAMPLE_MODEL_DATA = "sample-model-data"
     DATA_PROFILE = "data-profile"
     DATA = "data"
+    DATA_SPLITS = "data-splits"
     PROFILE = "profile"
     ARTIFACTS = "artifacts"
     QUANTIZED_MODEL = "quantized-model"
@@ -78,18 +79,21 @@ class SaveName(str, Enum):
     FEATURE_EXTRACTOR = "feature_extractor"
     METADATA = "metadata"
     GRAPHS = "graphs"
+    ARTIFACT_MANIFEST = "artifact-manifest"
 
 
 @unique
 class Suffix(str, Enum):
     ONNX = ".onnx"
     PARQUET = ".parquet"
+    ARROW = ".arrow"
     ZARR = ".zarr"
     JOBLIB = ".joblib"
     HTML = ".html"
     JSON = ".json"
     CKPT = ".ckpt"
     PT = ".pt"
+    SAFETENSORS = ".safetensors"
     TEXT = ".txt"
     CATBOOST = ".cbm"
     JSONL = ".jsonl"
@@ -170,9 +170,20 @@ class TorchSaveArgs(BaseModel):
         as_state_dict:
             Indicates to save the torch model in state_dict format. If True, the model
             architecture will need to be provided at load time.
+        as_safetensors:
+            Indicates to save the model weights in safetensors format. The model architecture
+            will need to be provided at load time. Weights are memory mapped at load time and
+            copied into the model one tensor at a time, and can be read lazily by name with
+            `TorchModel.load_tensors`.
+        max_shard_size:
+            Optional maximum shard size in bytes when saving as safetensors. Weights larger than
+            this are split across multiple files with a `model.safetensors.index.json` mapping
+            each tensor to its shard (same layout as HuggingFace checkpoints)
     """
 
     as_state_dict: bool = False
+    as_safetensors: bool = False
+    max_shard_size: Optional[int] = None
 
 
 class TorchOnnxArgs(BaseModel):
@@ -16,6 +16,9 @@ class RegistryTableNames(str, Enum):
     AUDIT = "OPSML_AUDIT_REGISTRY"
     BASE = "OPSML_BASE_REGISTRY"
     METRICS = "OPSML_RUN_METRICS"
+    TAGS = "OPSML_CARD_TAGS"
+    CHANGES = "OPSML_CARD_CHANGES"
+    LINEAGE = "OPSML_CARD_LINEAGE"
 
     @staticmethod
     def from_str(name: str) -> "RegistryTableNames":
@@ -35,6 +38,11 @@ class RegistryTableNames(str, Enum):
         raise NotImplementedError()
 
 
+class LineageDirection(str, Enum):
+    UPSTREAM = "upstream"
+    DOWNSTREAM = "downstream"
+
+
 class RunCardRegistry(Protocol):
     def insert_metric(self, metric: List[Dict[str, Any]]) -> None:
         ...
@@ -46,3 +54,6 @@ class RunCardRegistry(Protocol):
         names_only: bool = False,
     ) -> Optional[List[Dict[str, Any]]]:
         ...
+
+    def get_run_metrics(self, run_uids: List[str], name: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        ...
@@ -4,10 +4,22 @@
 from __future__ import annotations
 
 import datetime
+import hashlib
 import os
 from enum import Enum, unique
 from pathlib import Path
-from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Protocol, Union
+from typing import (
+    Any,
+    BinaryIO,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Protocol,
+    Union,
+)
 
 from pydantic import BaseModel, ConfigDict
 
@@ -27,14 +39,41 @@ class StorageClientSettings(BaseModel):
     storage_uri: str = os.getcwd()
 
 
-class GcsStorageClientSettings(StorageClientSettings):
+class CloudStorageClientSettings(StorageClientSettings):
+    """Transfer settings shared by object store clients (gcs, s3)
+
+    Args:
+        max_concurrency:
+            Max number of files transferred concurrently when getting or putting directories
+        chunk_size:
+            Chunk size (bytes) of multipart uploads
+        block_size:
+            Block size (bytes) used when reading files
+        cache_type:
+            Optional local cache for reads. "blockcache" caches the blocks that are read and
+            "filecache" caches whole files
+        cache_dir:
+            Local directory for the read cache. A temporary directory is used if not set
+        cache_max_bytes:
+            Max size of the read cache. Least recently used files are removed once the cache is full
+    """
+
+    max_concurrency: Optional[int] = None
+    chunk_size: Optional[int] = None
+    block_size: Optional[int] = None
+    cache_type: Optional[Literal["blockcache", "filecache"]] = None
+    cache_dir: Optional[str] = None
+    cache_max_bytes: int = 10 * 1024**3
+
+
+class GcsStorageClientSettings(CloudStorageClientSettings):
     storage_system: StorageSystem = StorageSystem.GCS
     credentials: Optional[Any] = None
     gcp_project: Optional[str] = None
     default_creds: bool = False
 
 
-class S3StorageClientSettings(StorageClientSettings):
+class S3StorageClientSettings(CloudStorageClientSettings):
     storage_system: StorageSystem = StorageSystem.S3
 
 
@@ -50,12 +89,71 @@ class ApiStorageClientSettings(StorageClientSettings):
 
 StorageSettings = Union[
     StorageClientSettings,
+    CloudStorageClientSettings,
     GcsStorageClientSettings,
     ApiStorageClientSettings,
     S3StorageClientSettings,
 ]
 
 
+class ArtifactFile(BaseModel):
+    size: int
+    sha256: str
+
+
+class ArtifactManifest(BaseModel):
+    """Lists every artifact saved for a card. Paths are relative to the card uri and use posix separators"""
+
+    files: Dict[str, ArtifactFile] = {}
+
+    @classmethod
+    def from_path(cls, path: Path, chunk_size: int = 1024 * 1024) -> ArtifactManifest:
+        """Creates a manifest from all files in a local directory
+
+        Args:
+            path:
+                Local directory containing card artifacts
+            chunk_size:
+                Number of bytes to read at a time when hashing files
+
+        Returns:
+            `ArtifactManifest`
+        """
+        files = {}
+        for file in sorted(path.rglob("*")):
+            if not file.is_file():
+                continue
+
+            sha256 = hashlib.sha256()
+            with file.open("rb") as artifact:
+                for chunk in iter(lambda: artifact.read(chunk_size), b""):  # pylint: disable=cell-var-from-loop
+                    sha256.update(chunk)
+
+            files[file.relative_to(path).as_posix()] = ArtifactFile(size=file.stat().st_size, sha256=sha256.hexdigest())
+
+        return cls(files=files)
+
+    def list_files(self, path: str) -> List[str]:
+        """Lists the files saved at a relative path. A file path returns itself, a directory returns
+        all files in the directory (recursive)
+
+        Args:
+            path:
+                Path relative to the card uri
+
+        Returns:
+            List of relative file paths
+        """
+        if path in self.files:
+            return [path]
+
+        prefix = f"{path.rstrip('/')}/"
+        return [file for file in self.files if file.startswith(prefix)]
+
+    def exists(self, path: str) -> bool:
+        return bool(self.list_files(path))
+
+
 class BotoClient(Protocol):
     def generate_presigned_url(
         self,
@@ -84,7 +182,7 @@ class GCSClient(Protocol):
 
 
 class StorageClientProtocol(Protocol):
-    def get(self, rpath: Path, lpath: Path) -> None:
+    def get(self, rpath: Path, lpath: Path, files: Optional[List[Path]] = None) -> None:
         """Copies file(s) from remote path (rpath) to local path (lpath)"""
 
     def ls(self, path: Path) -> List[Path]:  # pylint:  disable=invalid-name
@@ -99,6 +197,12 @@ class StorageClientProtocol(Protocol):
     def iterfile(self, path: Path, chunk_size: int) -> Iterator[bytes]:
         """Open an iterator"""
 
+    def read_bytes(self, path: Path) -> bytes:
+        """Reads a file into memory"""
+
+    def get_mapper(self, path: Path) -> Mapping[str, bytes]:
+        """Key-value mapping of the files under a path"""
+
     def put(self, lpath: Path, rpath: Path) -> None:
         """Copies file(s) from local path (lpath) to remote path (rpath)"""
 
@@ -6,6 +6,7 @@ from pathlib import Path
 from typing import Any, Dict, Tuple, cast
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pytest
 from requests.auth import HTTPBasicAuth
 from starlette.testclient import TestClient
@@ -20,14 +21,15 @@ from opsml.cards import (
     PipelineCard,
     RunCard,
 )
-from opsml.data import NumpyData, PandasData, TorchData
+from opsml.data import NumpyData, PandasData, PolarsData, TorchData
 from opsml.model import HuggingFaceModel, SklearnModel
 from opsml.projects.active_run import ActiveRun
 from opsml.registry import CardRegistries, CardRegistry
 from opsml.settings.config import config
 from opsml.storage import client
 from opsml.storage.api import ApiRoutes
-from opsml.types import Metric, SaveName
+from opsml.storage.card_envelope import read_card_envelope
+from opsml.types import Metric, ParquetWriteOptions, SaveName, ZarrWriteOptions
 from opsml.types.extra import Suffix
 from tests.conftest import TODAY_YMD
 
@@ -70,7 +72,7 @@ def test_register_data(
     registry.register_card(card=datacard)
 
     assert api_storage_client.exists(Path(datacard.uri, SaveName.DATA_PROFILE.value).with_suffix(".joblib"))
-    assert api_storage_client.exists(Path(datacard.uri, SaveName.CARD.value).with_suffix(".joblib"))
+    assert api_storage_client.exists(Path(datacard.uri, SaveName.CARD.value).with_suffix(".json"))
 
     _ = registry.list_cards(name=datacard.name, repository=datacard.repository, max_date=TODAY_YMD)
 
@@ -222,6 +224,10 @@ def test_runcard(
     assert loaded_card.get_metric("test_metric2").value == 20  # type: ignore
     loaded_card.load_artifacts()
 
+    # metrics for multiple runs are retrieved in a single request
+    metrics = registry._registry.get_run_metrics(run_uids=[run.uid, "missing_uid"], name=["test_metric"])
+    assert [(metric["run_uid"], metric["value"]) for metric in metrics] == [(run.uid, 10)]
+
 
 def test_register_model_data(
     api_registries: CardRegistries,
@@ -232,7 +238,7 @@ def test_register_model_data(
     data_registry = api_registries.data
     modelcard, datacard = populate_model_data_for_api
 
-    assert api_storage_client.exists(Path(datacard.uri, SaveName.CARD.value).with_suffix(".joblib"))
+    assert api_storage_client.exists(Path(datacard.uri, SaveName.CARD.value).with_suffix(".json"))
     assert api_storage_client.exists(
         Path(datacard.uri, SaveName.DATA.value).with_suffix(datacard.interface.data_suffix)
     )
@@ -814,3 +820,132 @@ def test_register_vit(
 
     assert api_storage_client.exists(Path(modelcard.uri, SaveName.TRAINED_MODEL.value).with_suffix(model.model_suffix))
     assert api_storage_client.exists(Path(modelcard.uri, SaveName.FEATURE_EXTRACTOR.value).with_suffix(""))
+
+
+def test_card_changes(test_app: TestClient, api_registries: CardRegistries, numpy_data: NumpyData) -> None:
+    registry = api_registries.data
+    start = registry._registry.get_card_changes()["cursor"]
+    watcher = registry.watch(name="stream_test", since=start, timeout=1)
+
+    data_card = DataCard(
+        interface=numpy_data,
+        name="stream_test",
+        repository="mlops",
+        contact="mlops.com",
+    )
+    registry.register_card(card=data_card)
+
+    change = next(watcher)
+    assert change["uid"] == data_card.uid
+    assert change["action"] == "registered"
+
+    # server-sent events
+
+    response = test_app.get(
+        f"/opsml/{ApiRoutes.CARD_CHANGES}",
+        params={"registry_type": "data", "since": start, "stream": True, "timeout": 0.5},
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+
+    events = [event for event in response.text.split("\n\n") if "data:" in event]
+    assert len(events) == 1
+    assert data_card.uid in events[0]
+    assert "event: card_change" in events[0]
+
+
+def test_card_lineage(api_registries: CardRegistries, numpy_data: NumpyData) -> None:
+    data_card = DataCard(interface=numpy_data, name="lineage_data", repository="mlops", contact="mlops.com")
+    api_registries.data.register_card(card=data_card)
+
+    run = RunCard(name="lineage_run", repository="mlops", contact="mlops.com", datacard_uids=[data_card.uid])
+    api_registries.run.register_card(card=run)
+
+    edges = api_registries.data.lineage(uid=data_card.uid, direction="upstream")
+    assert [(edge["parent_uid"], edge["child_uid"]) for edge in edges] == [(run.uid, data_card.uid)]
+
+
+def test_load_cards(api_registries: CardRegistries) -> None:
+    registry = api_registries.run
+
+    runs = []
+    for idx in range(3):
+        run = RunCard(name="batch_run", repository="mlops", contact="mlops.com")
+        run.log_parameter("idx", idx)
+        registry.register_card(card=run)
+        runs.append(run)
+
+    uids = [runs[2].uid, runs[0].uid, runs[1].uid]
+    cards = registry.load_cards(uids=uids)
+    assert [card.uid for card in cards] == uids
+    assert [card.get_parameter("idx").value for card in cards] == [2, 0, 1]
+
+
+def test_read_bytes(api_registries: CardRegistries, api_storage_client: client.StorageClient) -> None:
+    run = RunCard(name="read_bytes_run", repository="mlops", contact="mlops.com")
+    api_registries.run.register_card(card=run)
+
+    card_path = Path(run.uri, SaveName.CARD.value).with_suffix(Suffix.JSON.value)
+    card_bytes = api_storage_client.read_bytes(card_path)
+    assert read_card_envelope(card_bytes)["uid"] == run.uid
+
+    with api_storage_client.open(card_path, "rb") as card_file:
+        assert card_file.read() == card_bytes
+
+    with pytest.raises(FileNotFoundError):
+        api_storage_client.read_bytes(Path(run.uri, "missing.json"))
+
+
+def test_load_data_pushdown(api_registries: CardRegistries, pandas_data: PandasData) -> None:
+    datacard = DataCard(interface=pandas_data, name="pushdown", repository="mlops", contact="mlops.com")
+    api_registries.data.register_card(card=datacard)
+
+    loaded_card = api_registries.data.load_card(uid=datacard.uid)
+    loaded_card.load_data(columns=["year"], filters=[("year", ">", 2020)])
+
+    assert list(loaded_card.interface.data.columns) == ["year"]
+    assert len(loaded_card.interface.data) == 3
+
+
+def test_load_data_split(api_registries: CardRegistries, pandas_data: PandasData) -> None:
+    pandas_data.parquet_options = ParquetWriteOptions(save_splits=True)
+    datacard = DataCard(interface=pandas_data, name="saved_splits", repository="mlops", contact="mlops.com")
+    api_registries.data.register_card(card=datacard)
+
+    loaded_card = api_registries.data.load_card(uid=datacard.uid)
+    loaded_card.load_data(split="test")
+
+    assert loaded_card.interface.data["year"].tolist() == [2021]
+
+
+def test_polars_lazy_load(api_registries: CardRegistries, polars_data: PolarsData, tmp_path: Path) -> None:
+    datacard = DataCard(interface=polars_data, name="polars_lazy", repository="mlops", contact="mlops.com")
+    api_registries.data.register_card(card=datacard)
+
+    # downloads are removed after loading, so scanning in client mode requires the artifact cache
+    loaded_card = api_registries.data.load_card(uid=datacard.uid)
+    with pytest.raises(ValueError):
+        loaded_card.load_data(lazy=True)
+
+    with patch.object(config, "opsml_artifact_cache_dir", tmp_path.as_posix()):
+        loaded_card = api_registries.data.load_card(uid=datacard.uid)
+        loaded_card.load_data(lazy=True)
+
+    assert loaded_card.interface.data.collect().frame_equal(polars_data.data)
+
+
+def test_numpy_zarr_lazy_load(api_registries: CardRegistries, numpy_data: NumpyData) -> None:
+    numpy_data.zarr_options = ZarrWriteOptions(chunks=(2, None))
+    datacard = DataCard(interface=numpy_data, name="zarr_lazy", repository="mlops", contact="mlops.com")
+    api_registries.data.register_card(card=datacard)
+
+    loaded_card = api_registries.data.load_card(uid=datacard.uid)
+    loaded_card.load_data(lazy=True)
+    data = loaded_card.interface.data
+
+    # slicing only downloads the chunks it touches
+    read_bytes = client.ApiStorageClient.read_bytes
+    with patch.object(client.ApiStorageClient, "read_bytes", autospec=True, side_effect=read_bytes) as read_bytes:
+        np.testing.assert_array_equal(data[3:5], numpy_data.data[3:5])
+
+    assert sorted(call.args[1].name for call in read_bytes.call_args_list) == ["1.0", "2.0"]
@@ -38,7 +38,7 @@ def test_numpy_api_client(
 
     # check paths exist on server
     assert api_storage_client.exists(Path(datacard.uri, SaveName.DATA.value).with_suffix(Suffix.ZARR.value))
-    assert api_storage_client.exists(Path(datacard.uri, SaveName.CARD.value).with_suffix(".joblib"))
+    assert api_storage_client.exists(Path(datacard.uri, SaveName.CARD.value).with_suffix(".json"))
 
     # load objects
     loader = CardLoader(
@@ -79,7 +79,7 @@ def test_pandas_api_client(
     assert api_storage_client.exists(Path(datacard.uri, SaveName.DATA.value).with_suffix(data.data_suffix))
     assert api_storage_client.exists(Path(datacard.uri, SaveName.DATA_PROFILE.value).with_suffix(Suffix.JOBLIB.value))
     assert api_storage_client.exists(Path(datacard.uri, SaveName.DATA_PROFILE.value).with_suffix(Suffix.HTML.value))
-    assert api_storage_client.exists(Path(datacard.uri, SaveName.CARD.value).with_suffix(".joblib"))
+    assert api_storage_client.exists(Path(datacard.uri, SaveName.CARD.value).with_suffix(".json"))
 
     # load objects
     loader = CardLoader(
@@ -123,7 +123,7 @@ def test_polars_api_client(
     assert api_storage_client.exists(Path(datacard.uri, SaveName.DATA.value).with_suffix(data.data_suffix))
     assert api_storage_client.exists(Path(datacard.uri, SaveName.DATA_PROFILE.value).with_suffix(Suffix.JOBLIB.value))
     assert api_storage_client.exists(Path(datacard.uri, SaveName.DATA_PROFILE.value).with_suffix(Suffix.HTML.value))
-    assert api_storage_client.exists(Path(datacard.uri, SaveName.CARD.value).with_suffix(".joblib"))
+    assert api_storage_client.exists(Path(datacard.uri, SaveName.CARD.value).with_suffix(".json"))
 
     # load objects
     loader = CardLoader(
@@ -164,7 +164,7 @@ def test_arrow_api_client(
 
     # check paths exist on server
     assert api_storage_client.exists(Path(datacard.uri, SaveName.DATA.value).with_suffix(data.data_suffix))
-    assert api_storage_client.exists(Path(datacard.uri, SaveName.CARD.value).with_suffix(".joblib"))
+    assert api_storage_client.exists(Path(datacard.uri, SaveName.CARD.value).with_suffix(".json"))
 
     # load objects
     loader = CardLoader(
@@ -204,7 +204,7 @@ def test_image_data(
 
     # check paths exist on server
     assert api_storage_client.exists(Path(datacard.uri, SaveName.DATA.value))
-    assert api_storage_client.exists(Path(datacard.uri, SaveName.CARD.value).with_suffix(Suffix.JOBLIB.value))
+    assert api_storage_client.exists(Path(datacard.uri, SaveName.CARD.value).with_suffix(Suffix.JSON.value))
 
     # load objects
     loader = CardLoader(
@@ -229,6 +229,11 @@ def test_image_data(
     shutil.rmtree(loaded_card.interface.data_dir, ignore_errors=True)
     assert not loaded_card.interface.data_dir.exists()
 
+    # stream shards through the api
+    records = list(loaded_card.stream_data(batch_size=50))
+    assert sum(len(batch) for batch in records) == 200
+    assert not loaded_card.interface.data_dir.exists()
+
 
 def test_text_data(
     create_text_dataset: Path,
@@ -251,7 +256,7 @@ def test_text_data(
 
     # check paths exist on server
     assert api_storage_client.exists(Path(datacard.uri, SaveName.DATA.value))
-    assert api_storage_client.exists(Path(datacard.uri, SaveName.CARD.value).with_suffix(Suffix.JOBLIB.value))
+    assert api_storage_client.exists(Path(datacard.uri, SaveName.CARD.value).with_suffix(Suffix.JSON.value))
 
     # load objects
     loader = CardLoader(
@@ -67,7 +67,7 @@ def test_image_dataset(create_image_dataset: Path):
     save_card_artifacts(datacard)
 
     assert storage_client.exists(Path(datacard.uri, SaveName.DATA.value))
-    assert storage_client.exists(Path(datacard.uri, SaveName.CARD.value).with_suffix(Suffix.JOBLIB.value))
+    assert storage_client.exists(Path(datacard.uri, SaveName.CARD.value).with_suffix(Suffix.JSON.value))
     storage_client.rm(Path(OPSML_STORAGE_URI))
     assert not storage_client.exists(Path(OPSML_STORAGE_URI))
 
@@ -89,7 +89,7 @@ def test_image_dataset_multiproc(create_image_dataset: Path):
     save_card_artifacts(datacard)
 
     assert storage_client.exists(Path(datacard.uri, SaveName.DATA.value))
-    assert storage_client.exists(Path(datacard.uri, SaveName.CARD.value).with_suffix(Suffix.JOBLIB.value))
+    assert storage_client.exists(Path(datacard.uri, SaveName.CARD.value).with_suffix(Suffix.JSON.value))
     storage_client.rm(Path(OPSML_STORAGE_URI))
     assert not storage_client.exists(Path(OPSML_STORAGE_URI))
 
@@ -113,7 +113,7 @@ def test_image_split_dataset(create_split_image_dataset: Path):
     save_card_artifacts(datacard)
 
     assert storage_client.exists(Path(datacard.uri, SaveName.DATA.value))
-    assert storage_client.exists(Path(datacard.uri, SaveName.CARD.value).with_suffix(Suffix.JOBLIB.value))
+    assert storage_client.exists(Path(datacard.uri, SaveName.CARD.value).with_suffix(Suffix.JSON.value))
 
     # load objects
     loader = CardLoader(
@@ -157,6 +157,61 @@ def test_image_split_dataset(create_split_image_dataset: Path):
     assert not storage_client.exists(Path(OPSML_STORAGE_URI))
 
 
+def test_image_dataset_stream(create_split_image_dataset: Path):
+    data_dir = create_split_image_dataset
+    image_data = ImageDataset(data_dir=data_dir, shard_size="200KB")
+    storage_client = client.storage_client
+
+    datacard = DataCard(
+        interface=image_data,
+        name="test_data",
+        repository="mlops",
+        contact="test_email",
+        version="0.0.1",
+        uid=uuid.uuid4().hex,
+    )
+
+    save_card_artifacts(datacard)
+
+    loader = CardLoader(
+        card_args={
+            "name": datacard.name,
+            "repository": datacard.repository,
+            "version": datacard.version,
+        },
+        registry_type=RegistryType.DATA,
+    )
+
+    loaded_card = cast(DataCard, loader.load_card())
+    loaded_card.interface.data_dir = data_dir.parent / uuid.uuid4().hex
+
+    stream = loaded_card.stream_data(split="train", batch_size=64, shuffle=True)
+    assert len(stream.shards) > 1
+
+    batches = list(stream)
+    assert [len(batch) for batch in batches] == [64, 64, 64, 8]
+
+    records = [record for batch in batches for record in batch]
+    assert len({record["path"] for record in records}) == 200
+    assert all(record["split_label"] == "train" for record in records)
+    assert records[0]["image"].size == (100, 100)
+    assert records[0]["image"].mode == "RGBA"
+
+    # records are never written to files
+    assert not storage_client.exists(loaded_card.interface.data_dir)
+
+    # reshuffled per epoch
+    first_epoch = [record["path"] for record in loaded_card.stream_data(split="train", shuffle=True)]
+    stream = loaded_card.stream_data(split="train", shuffle=True)
+    stream.set_epoch(1)
+    second_epoch = [record["path"] for record in stream]
+    assert first_epoch != second_epoch
+    assert sorted(first_epoch) == sorted(second_epoch)
+
+    storage_client.rm(Path(OPSML_STORAGE_URI))
+    assert not storage_client.exists(Path(OPSML_STORAGE_URI))
+
+
 def test_text_metadata():
     record = {"filepath": Path("tests/assets/text_dataset/text1.txt")}
 
@@ -196,7 +251,7 @@ def test_text_dataset(create_text_dataset: Path):
     save_card_artifacts(datacard)
 
     assert storage_client.exists(Path(datacard.uri, SaveName.DATA.value))
-    assert storage_client.exists(Path(datacard.uri, SaveName.CARD.value).with_suffix(Suffix.JOBLIB.value))
+    assert storage_client.exists(Path(datacard.uri, SaveName.CARD.value).with_suffix(Suffix.JSON.value))
     storage_client.rm(Path(OPSML_STORAGE_URI))
     assert not storage_client.exists(Path(OPSML_STORAGE_URI))
 
@@ -220,7 +275,7 @@ def test_text_split_dataset(create_split_text_dataset: Path):
     save_card_artifacts(datacard)
 
     assert storage_client.exists(Path(datacard.uri, SaveName.DATA.value))
-    assert storage_client.exists(Path(datacard.uri, SaveName.CARD.value).with_suffix(Suffix.JOBLIB.value))
+    assert storage_client.exists(Path(datacard.uri, SaveName.CARD.value).with_suffix(Suffix.JSON.value))
 
     # load objects
     loader = CardLoader(
@@ -262,3 +317,27 @@ def test_text_split_dataset(create_split_text_dataset: Path):
     # cleanup datacard path
     storage_client.rm(Path(OPSML_STORAGE_URI))
     assert not storage_client.exists(Path(OPSML_STORAGE_URI))
+
+
+def test_text_dataset_stream(create_text_dataset: Path):
+    data_dir = create_text_dataset
+    text_data = TextDataset(data_dir=data_dir)
+    storage_client = client.storage_client
+
+    datacard = DataCard(
+        interface=text_data,
+        name="test_data",
+        repository="mlops",
+        contact="test_email",
+        version="0.0.1",
+        uid=uuid.uuid4().hex,
+    )
+
+    save_card_artifacts(datacard)
+
+    records = list(datacard.stream_data(prefetch=0))
+    assert len(records) == 200
+    assert all(record["text"] == "test" for record in records)
+
+    storage_client.rm(Path(OPSML_STORAGE_URI))
+    assert not storage_client.exists(Path(OPSML_STORAGE_URI))
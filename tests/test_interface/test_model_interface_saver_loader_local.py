@@ -1,8 +1,10 @@
+import json
 import sys
 import tempfile
 import uuid
 from pathlib import Path
 from typing import cast
+from unittest.mock import patch
 
 import pytest
 from transformers import Pipeline
@@ -20,9 +22,17 @@ from opsml.model import (
     VowpalWabbitModel,
     XGBoostModel,
 )
+from opsml.storage import client
 from opsml.storage.card_loader import CardLoader
 from opsml.storage.card_saver import save_card_artifacts
-from opsml.types import CommonKwargs, RegistryType, SaveName, Suffix
+from opsml.types import (
+    ArtifactManifest,
+    CommonKwargs,
+    RegistryType,
+    SaveName,
+    Suffix,
+    TorchSaveArgs,
+)
 
 DARWIN_EXCLUDE = sys.platform == "darwin" and sys.version_info < (3, 11)
 WINDOWS_EXCLUDE = sys.platform == "win32"
@@ -57,7 +67,7 @@ def test_save_huggingface_modelcard(huggingface_torch_distilbert: HuggingFaceMod
     assert Path(modelcard.uri, SaveName.SAMPLE_MODEL_DATA.value).with_suffix(".joblib").exists()
     assert Path(modelcard.uri, SaveName.ONNX_MODEL.value).exists()
     assert Path(modelcard.uri, SaveName.QUANTIZED_MODEL.value).exists()
-    assert Path(modelcard.uri, SaveName.CARD.value).with_suffix(".joblib").exists()
+    assert Path(modelcard.uri, SaveName.CARD.value).with_suffix(".json").exists()
 
     # load objects
     loader = CardLoader(
@@ -120,7 +130,7 @@ def test_save_huggingface_pipeline_modelcard(huggingface_text_classification_pip
     assert Path(modelcard.uri, SaveName.TOKENIZER.value).exists()
     assert Path(modelcard.uri, SaveName.SAMPLE_MODEL_DATA.value).with_suffix(".joblib").exists()
     assert Path(modelcard.uri, SaveName.ONNX_MODEL.value).exists()
-    assert Path(modelcard.uri, SaveName.CARD.value).with_suffix(".joblib").exists()
+    assert Path(modelcard.uri, SaveName.CARD.value).with_suffix(".json").exists()
 
     # load objects
     loader = CardLoader(
@@ -179,7 +189,7 @@ def test_save_sklearn_modelcard(random_forest_classifier: SklearnModel):
     assert Path(modelcard.uri, SaveName.PREPROCESSOR.value).with_suffix(".joblib").exists()
     assert Path(modelcard.uri, SaveName.SAMPLE_MODEL_DATA.value).with_suffix(".joblib").exists()
     assert Path(modelcard.uri, SaveName.ONNX_MODEL.value).with_suffix(".onnx").exists()
-    assert Path(modelcard.uri, SaveName.CARD.value).with_suffix(".joblib").exists()
+    assert Path(modelcard.uri, SaveName.CARD.value).with_suffix(".json").exists()
 
     # load objects
     loader = CardLoader(
@@ -231,7 +241,7 @@ def test_save_lgb_booster_modelcard(lgb_booster_model: LightGBMModel):
     assert Path(modelcard.uri, SaveName.PREPROCESSOR.value).with_suffix(".joblib").exists()
     assert Path(modelcard.uri, SaveName.SAMPLE_MODEL_DATA.value).with_suffix(".joblib").exists()
     assert Path(modelcard.uri, SaveName.ONNX_MODEL.value).with_suffix(".onnx").exists()
-    assert Path(modelcard.uri, SaveName.CARD.value).with_suffix(".joblib").exists()
+    assert Path(modelcard.uri, SaveName.CARD.value).with_suffix(".json").exists()
 
     # load objects
     loader = CardLoader(
@@ -254,6 +264,114 @@ def test_save_lgb_booster_modelcard(lgb_booster_model: LightGBMModel):
     assert loaded_card.interface.onnx_model.sess is not None
 
 
+def test_save_modelcard_upload_order(lgb_booster_model: LightGBMModel):
+    modelcard = ModelCard(
+        interface=lgb_booster_model,
+        name="test_model",
+        repository="mlops",
+        contact="test_email",
+        datacard_uid=uuid.uuid4().hex,
+        to_onnx=True,
+        version="0.0.1",
+        uid=uuid.uuid4().hex,
+    )
+
+    uploaded = []
+    storage_put = client.storage_client.put
+
+    def _put(lpath: Path, rpath: Path) -> None:
+        storage_put(lpath, rpath)
+        uploaded.append(rpath.name)
+
+    with patch.object(client.storage_client, "put", side_effect=_put):
+        save_card_artifacts(modelcard)
+
+    # artifacts are uploaded individually and the card is always uploaded last
+    assert uploaded[-3:] == ["model-metadata.json", "artifact-manifest.json", "card.json"]
+    assert {"trained-model.txt", "onnx-model.onnx", "sample-model-data.joblib"} <= set(uploaded[:-3])
+
+
+def test_load_modelcard_from_manifest(lgb_booster_model: LightGBMModel):
+    modelcard = ModelCard(
+        interface=lgb_booster_model,
+        name="test_model",
+        repository="mlops",
+        contact="test_email",
+        datacard_uid=uuid.uuid4().hex,
+        to_onnx=True,
+        version="0.0.1",
+        uid=uuid.uuid4().hex,
+    )
+    save_card_artifacts(modelcard)
+
+    manifest_path = Path(modelcard.uri, SaveName.ARTIFACT_MANIFEST.value).with_suffix(Suffix.JSON.value)
+    manifest = ArtifactManifest.model_validate_json(manifest_path.read_text("utf-8"))
+    assert manifest.files["trained-model.txt"].size == Path(modelcard.uri, "trained-model.txt").stat().st_size
+    assert "card.json" in manifest.files
+
+    loader = CardLoader(
+        card_args={"name": modelcard.name, "repository": modelcard.repository, "version": modelcard.version},
+        registry_type=RegistryType.MODEL,
+    )
+    loaded_card = cast(ModelCard, loader.load_card())
+
+    # existence checks are answered by the manifest
+    with patch.object(client.storage_client, "exists", side_effect=AssertionError("unexpected exists call")):
+        loaded_card.load_model(load_preprocessor=True)
+        loaded_card.load_onnx_model()
+
+    assert loaded_card.interface.model is not None
+    assert loaded_card.interface.sample_data is not None
+    assert loaded_card.interface.onnx_model is not None
+
+    # cards saved without a manifest fall back to checking storage
+    manifest_path.unlink()
+    loaded_card = cast(ModelCard, loader.load_card())
+    loaded_card.load_model()
+    assert loaded_card.interface.sample_data is not None
+
+
+def test_load_modelcard_fetch_plan(lgb_regressor_model: LightGBMModel):
+    modelcard = ModelCard(
+        interface=lgb_regressor_model,
+        name="test_model",
+        repository="mlops",
+        contact="test_email",
+        datacard_uid=uuid.uuid4().hex,
+        to_onnx=True,
+        version="0.0.1",
+        uid=uuid.uuid4().hex,
+    )
+    save_card_artifacts(modelcard)
+
+    loader = CardLoader(
+        card_args={"name": modelcard.name, "repository": modelcard.repository, "version": modelcard.version},
+        registry_type=RegistryType.MODEL,
+    )
+    loaded_card = cast(ModelCard, loader.load_card())
+
+    downloaded = []
+    storage_get = client.storage_client.get
+
+    def _get(rpath: Path, lpath: Path, files=None) -> None:
+        storage_get(rpath, lpath, files=files)
+        downloaded.append(rpath.name)
+
+    # all artifacts are downloaded once, up front, before any are deserialized
+    with patch.object(client.storage_client, "get", side_effect=_get):
+        loaded_card.load_model(load_preprocessor=True)
+
+    # the manifest is read into memory, so only artifacts are downloaded
+    assert sorted(downloaded) == [
+        "preprocessor.joblib",
+        "sample-model-data.joblib",
+        "trained-model.joblib",
+    ]
+    assert loaded_card.interface.model is not None
+    assert loaded_card.interface.preprocessor is not None
+    assert loaded_card.interface.sample_data is not None
+
+
 def test_save_lgb_sklearn_modelcard(
     lgb_regressor_model: LightGBMModel,
 ):
@@ -280,7 +398,7 @@ def test_save_lgb_sklearn_modelcard(
     assert Path(modelcard.uri, SaveName.PREPROCESSOR.value).with_suffix(".joblib").exists()
     assert Path(modelcard.uri, SaveName.SAMPLE_MODEL_DATA.value).with_suffix(".joblib").exists()
     assert Path(modelcard.uri, SaveName.ONNX_MODEL.value).with_suffix(".onnx").exists()
-    assert Path(modelcard.uri, SaveName.CARD.value).with_suffix(".joblib").exists()
+    assert Path(modelcard.uri, SaveName.CARD.value).with_suffix(".json").exists()
 
     # load objects
     loader = CardLoader(
@@ -328,7 +446,7 @@ def test_save_xgb_booster_modelcard(
     assert Path(modelcard.uri, SaveName.TRAINED_MODEL.value).with_suffix(Suffix.JSON.value).exists()
     assert Path(modelcard.uri, SaveName.PREPROCESSOR.value).with_suffix(Suffix.JOBLIB.value).exists()
     assert Path(modelcard.uri, SaveName.SAMPLE_MODEL_DATA.value).with_suffix(Suffix.DMATRIX.value).exists()
-    assert Path(modelcard.uri, SaveName.CARD.value).with_suffix(Suffix.JOBLIB.value).exists()
+    assert Path(modelcard.uri, SaveName.CARD.value).with_suffix(Suffix.JSON.value).exists()
 
     # load objects
     loader = CardLoader(
@@ -373,7 +491,7 @@ def test_save_torch_modelcard(pytorch_simple: TorchModel):
     assert Path(modelcard.uri, SaveName.TRAINED_MODEL.value).with_suffix(".pt").exists()
     assert Path(modelcard.uri, SaveName.SAMPLE_MODEL_DATA.value).with_suffix(".joblib").exists()
     assert Path(modelcard.uri, SaveName.ONNX_MODEL.value).with_suffix(".onnx").exists()
-    assert Path(modelcard.uri, SaveName.CARD.value).with_suffix(".joblib").exists()
+    assert Path(modelcard.uri, SaveName.CARD.value).with_suffix(".json").exists()
 
     # load objects
     loader = CardLoader(
@@ -431,7 +549,7 @@ def test_save_torch_tuple_modelcard(pytorch_simple_tuple: TorchModel):
     assert Path(modelcard.uri, SaveName.TRAINED_MODEL.value).with_suffix(".pt").exists()
     assert Path(modelcard.uri, SaveName.SAMPLE_MODEL_DATA.value).with_suffix(".joblib").exists()
     assert Path(modelcard.uri, SaveName.ONNX_MODEL.value).with_suffix(".onnx").exists()
-    assert Path(modelcard.uri, SaveName.CARD.value).with_suffix(".joblib").exists()
+    assert Path(modelcard.uri, SaveName.CARD.value).with_suffix(".json").exists()
 
     # load objects
     loader = CardLoader(
@@ -460,6 +578,53 @@ def test_save_torch_tuple_modelcard(pytorch_simple_tuple: TorchModel):
     assert loaded_card.interface.onnx_model.sess is not None
 
 
+@pytest.mark.skipif(EXCLUDE, reason="skipping")
+def test_save_torch_safetensors_modelcard(pytorch_simple: TorchModel):
+    model = pytorch_simple.model_copy(update={"save_args": TorchSaveArgs(as_safetensors=True, max_shard_size=4)})
+
+    modelcard = ModelCard(
+        interface=model,
+        name="test_model",
+        repository="mlops",
+        contact="test_email",
+        datacard_uid=uuid.uuid4().hex,
+        version="0.0.1",
+        uid=uuid.uuid4().hex,
+    )
+
+    save_card_artifacts(modelcard)
+
+    # each scalar parameter is saved to its own shard
+    model_path = Path(modelcard.uri, SaveName.TRAINED_MODEL.value)
+    index = json.loads((model_path / "model.safetensors.index.json").read_text(encoding="utf-8"))
+    assert index["weight_map"] == {
+        "x1": "model-00001-of-00002.safetensors",
+        "x2": "model-00002-of-00002.safetensors",
+    }
+    assert index["metadata"]["total_size"] == 8
+
+    assert TorchModel.load_tensors(model_path, ["x2"]) == {"x2": model.model.x2}
+
+    loader = CardLoader(
+        card_args={
+            "name": modelcard.name,
+            "repository": modelcard.repository,
+            "version": modelcard.version,
+        },
+        registry_type=RegistryType.MODEL,
+    )
+
+    loaded_card = cast(ModelCard, loader.load_card())
+    assert loaded_card.interface.model_suffix == Suffix.NONE.value
+
+    with pytest.raises(ValueError, match="model_arch is required"):
+        loaded_card.load_model()
+
+    loaded_card.load_model(model_arch=type(model.model)())
+    assert loaded_card.interface.model.x1 == model.model.x1
+    assert loaded_card.interface.model.x2 == model.model.x2
+
+
 @pytest.mark.skipif(EXCLUDE, reason="skipping")
 def test_save_torch_lightning_modelcard(lightning_regression: LightningModel):
     model, model_arch = lightning_regression
@@ -485,7 +650,7 @@ def test_save_torch_lightning_modelcard(lightning_regression: LightningModel):
     assert Path(modelcard.uri, SaveName.TRAINED_MODEL.value).with_suffix(".ckpt").exists()
     assert Path(modelcard.uri, SaveName.SAMPLE_MODEL_DATA.value).with_suffix(".joblib").exists()
     assert Path(modelcard.uri, SaveName.ONNX_MODEL.value).with_suffix(".onnx").exists()
-    assert Path(modelcard.uri, SaveName.CARD.value).with_suffix(".joblib").exists()
+    assert Path(modelcard.uri, SaveName.CARD.value).with_suffix(".json").exists()
 
     # load objects
     loader = CardLoader(
@@ -535,7 +700,7 @@ def test_save_tensorflow_modelcard(tf_transformer_example: TensorFlowModel):
     assert Path(modelcard.uri, SaveName.TRAINED_MODEL.value).exists()
     assert Path(modelcard.uri, SaveName.SAMPLE_MODEL_DATA.value).with_suffix(".joblib").exists()
     assert Path(modelcard.uri, SaveName.ONNX_MODEL.value).with_suffix(".onnx").exists()
-    assert Path(modelcard.uri, SaveName.CARD.value).with_suffix(".joblib").exists()
+    assert Path(modelcard.uri, SaveName.CARD.value).with_suffix(".json").exists()
 
     # load objects
     loader = CardLoader(
@@ -585,7 +750,7 @@ def test_save_tensorflow_multi_input_modelcard(multi_input_tf_example: TensorFlo
     assert Path(modelcard.uri, SaveName.TRAINED_MODEL.value).exists()
     assert Path(modelcard.uri, SaveName.SAMPLE_MODEL_DATA.value).with_suffix(".joblib").exists()
     assert Path(modelcard.uri, SaveName.ONNX_MODEL.value).with_suffix(".onnx").exists()
-    assert Path(modelcard.uri, SaveName.CARD.value).with_suffix(".joblib").exists()
+    assert Path(modelcard.uri, SaveName.CARD.value).with_suffix(".json").exists()
 
     # load objects
     loader = CardLoader(
@@ -635,7 +800,7 @@ def test_save_huggingface_pipeline_modelcard(huggingface_text_classification_pip
     assert Path(modelcard.uri, SaveName.TRAINED_MODEL.value).exists()
     assert Path(modelcard.uri, SaveName.SAMPLE_MODEL_DATA.value).with_suffix(".joblib").exists()
     assert Path(modelcard.uri, SaveName.ONNX_MODEL.value).exists()
-    assert Path(modelcard.uri, SaveName.CARD.value).with_suffix(".joblib").exists()
+    assert Path(modelcard.uri, SaveName.CARD.value).with_suffix(".json").exists()
 
     # load objects
     loader = CardLoader(
@@ -692,7 +857,7 @@ def test_save_huggingface_vit_pipeline_modelcard(huggingface_vit_pipeline: Huggi
     assert not Path(modelcard.uri, SaveName.TOKENIZER.value).exists()
     assert Path(modelcard.uri, SaveName.SAMPLE_MODEL_DATA.value).with_suffix(".joblib").exists()
     assert Path(modelcard.uri, SaveName.ONNX_MODEL.value).exists()
-    assert Path(modelcard.uri, SaveName.CARD.value).with_suffix(".joblib").exists()
+    assert Path(modelcard.uri, SaveName.CARD.value).with_suffix(".json").exists()
 
     # load objects
     loader = CardLoader(
@@ -776,7 +941,7 @@ def test_save_catboost_modelcard(catboost_regressor: CatBoostModel):
     assert Path(modelcard.uri, SaveName.PREPROCESSOR.value).with_suffix(Suffix.JOBLIB.value).exists()
     assert Path(modelcard.uri, SaveName.SAMPLE_MODEL_DATA.value).with_suffix(Suffix.JOBLIB.value).exists()
     assert Path(modelcard.uri, SaveName.ONNX_MODEL.value).with_suffix(Suffix.ONNX.value).exists()
-    assert Path(modelcard.uri, SaveName.CARD.value).with_suffix(Suffix.JOBLIB.value).exists()
+    assert Path(modelcard.uri, SaveName.CARD.value).with_suffix(Suffix.JSON.value).exists()
 
     # load objects
     loader = CardLoader(
@@ -825,7 +990,7 @@ def test_save_torch_byo_bytes_modelcard(pytorch_onnx_byo_bytes: TorchModel):
     assert Path(modelcard.uri, SaveName.TRAINED_MODEL.value).with_suffix(".pt").exists()
     assert Path(modelcard.uri, SaveName.SAMPLE_MODEL_DATA.value).with_suffix(".joblib").exists()
     assert Path(modelcard.uri, SaveName.ONNX_MODEL.value).with_suffix(".onnx").exists()
-    assert Path(modelcard.uri, SaveName.CARD.value).with_suffix(".joblib").exists()
+    assert Path(modelcard.uri, SaveName.CARD.value).with_suffix(".json").exists()
 
     # load objects
     loader = CardLoader(
@@ -883,7 +1048,7 @@ def test_save_torch_byo_file_modelcard(pytorch_onnx_byo_file: TorchModel):
     assert Path(modelcard.uri, SaveName.TRAINED_MODEL.value).with_suffix(".pt").exists()
     assert Path(modelcard.uri, SaveName.SAMPLE_MODEL_DATA.value).with_suffix(".joblib").exists()
     assert Path(modelcard.uri, SaveName.ONNX_MODEL.value).with_suffix(".onnx").exists()
-    assert Path(modelcard.uri, SaveName.CARD.value).with_suffix(".joblib").exists()
+    assert Path(modelcard.uri, SaveName.CARD.value).with_suffix(".json").exists()
 
     # load objects
     loader = CardLoader(
@@ -942,7 +1107,7 @@ def test_save_vowpal_modelcard(vowpal_wabbit_cb: VowpalWabbitModel):
     # check paths exist on server
     assert Path(modelcard.uri, SaveName.TRAINED_MODEL.value).with_suffix(Suffix.MODEL.value).exists()
     assert Path(modelcard.uri, SaveName.SAMPLE_MODEL_DATA.value).with_suffix(Suffix.JOBLIB.value).exists()
-    assert Path(modelcard.uri, SaveName.CARD.value).with_suffix(Suffix.JOBLIB.value).exists()
+    assert Path(modelcard.uri, SaveName.CARD.value).with_suffix(Suffix.JSON.value).exists()
 
     # load objects
     loader = CardLoader(
@@ -983,7 +1148,7 @@ def test_save_vowpal_modelcard(vowpal_wabbit_cb: VowpalWabbitModel):
     # check paths exist on server
     assert Path(modelcard.uri, SaveName.TRAINED_MODEL.value).with_suffix(Suffix.MODEL.value).exists()
     assert Path(modelcard.uri, SaveName.SAMPLE_MODEL_DATA.value).with_suffix(Suffix.JOBLIB.value).exists()
-    assert Path(modelcard.uri, SaveName.CARD.value).with_suffix(Suffix.JOBLIB.value).exists()
+    assert Path(modelcard.uri, SaveName.CARD.value).with_suffix(Suffix.JSON.value).exists()
 
     # load objects
     loader = CardLoader(
@@ -31,7 +31,7 @@ def test_delete_data_model(
 
     # assert card and artifacts exist
     assert len(cards) == 1
-    assert Path(datacard.uri, SaveName.CARD.value).with_suffix(".joblib").exists()
+    assert Path(datacard.uri, SaveName.CARD.value).with_suffix(".json").exists()
 
     modelcard = ModelCard(
         interface=model,
@@ -50,7 +50,7 @@ def test_delete_data_model(
     assert Path(modelcard.uri, SaveName.TRAINED_MODEL.value).with_suffix(".joblib").exists()
     assert Path(modelcard.uri, SaveName.SAMPLE_MODEL_DATA.value).with_suffix(".joblib").exists()
     assert Path(modelcard.uri, SaveName.MODEL_METADATA.value).with_suffix(".json").exists()
-    assert Path(modelcard.uri, SaveName.CARD.value).with_suffix(".joblib").exists()
+    assert Path(modelcard.uri, SaveName.CARD.value).with_suffix(".json").exists()
 
     # delete model card
     model_registry.delete_card(card=modelcard)
@@ -60,14 +60,14 @@ def test_delete_data_model(
     assert not Path(modelcard.uri, SaveName.TRAINED_MODEL.value).with_suffix(".joblib").exists()
     assert not Path(modelcard.uri, SaveName.SAMPLE_MODEL_DATA.value).with_suffix(".joblib").exists()
     assert not Path(modelcard.uri, SaveName.MODEL_METADATA.value).with_suffix(".json").exists()
-    assert not Path(modelcard.uri, SaveName.CARD.value).with_suffix(".joblib").exists()
+    assert not Path(modelcard.uri, SaveName.CARD.value).with_suffix(".json").exists()
 
     # delete datacard
     data_registry.delete_card(card=datacard)
     cards = data_registry.list_cards(name="pipeline_data", repository="mlops")
     assert len(cards) == 0
 
-    assert not Path(datacard.uri, SaveName.CARD.value).with_suffix(".joblib").exists()
+    assert not Path(datacard.uri, SaveName.CARD.value).with_suffix(".json").exists()
 
 
 @pytest.mark.skipif(sys.platform == "win32", reason="No wn_32 test")
@@ -85,13 +85,13 @@ def test_delete_runcard(db_registries: CardRegistries) -> None:
     assert run.get_metric("test_metric2").value == 20  # type: ignore
 
     registry.register_card(card=run)
-    assert Path(run.uri, SaveName.CARD.value).with_suffix(".joblib").exists()
+    assert Path(run.uri, SaveName.CARD.value).with_suffix(".json").exists()
 
     registry.delete_card(card=run)
     cards = registry.list_cards(name="test_run", repository="mlops")
     assert len(cards) == 0
 
-    assert not Path(run.uri, SaveName.CARD.value).with_suffix(".joblib").exists()
+    assert not Path(run.uri, SaveName.CARD.value).with_suffix(".json").exists()
 
 
 @pytest.mark.skipif(sys.platform == "win32", reason="No wn_32 test")
@@ -114,7 +114,7 @@ def test_delete_data_model_api(
 
     # assert card and artifacts exist
     assert len(cards) == 1
-    assert api_storage_client.exists(Path(datacard.uri, SaveName.CARD.value).with_suffix(".joblib"))
+    assert api_storage_client.exists(Path(datacard.uri, SaveName.CARD.value).with_suffix(".json"))
 
     modelcard = ModelCard(
         interface=model,
@@ -133,7 +133,7 @@ def test_delete_data_model_api(
     assert api_storage_client.exists(Path(modelcard.uri, SaveName.TRAINED_MODEL.value).with_suffix(".joblib"))
     assert api_storage_client.exists(Path(modelcard.uri, SaveName.SAMPLE_MODEL_DATA.value).with_suffix(".joblib"))
     assert api_storage_client.exists(Path(modelcard.uri, SaveName.MODEL_METADATA.value).with_suffix(".json"))
-    assert api_storage_client.exists(Path(modelcard.uri, SaveName.CARD.value).with_suffix(".joblib"))
+    assert api_storage_client.exists(Path(modelcard.uri, SaveName.CARD.value).with_suffix(".json"))
 
     # delete model card
     model_registry.delete_card(card=modelcard)
@@ -143,14 +143,14 @@ def test_delete_data_model_api(
     assert not api_storage_client.exists(Path(modelcard.uri, SaveName.TRAINED_MODEL.value).with_suffix(".joblib"))
     assert not api_storage_client.exists(Path(modelcard.uri, SaveName.SAMPLE_MODEL_DATA.value).with_suffix(".joblib"))
     assert not api_storage_client.exists(Path(modelcard.uri, SaveName.MODEL_METADATA.value).with_suffix(".json"))
-    assert not api_storage_client.exists(Path(modelcard.uri, SaveName.CARD.value).with_suffix(".joblib"))
+    assert not api_storage_client.exists(Path(modelcard.uri, SaveName.CARD.value).with_suffix(".json"))
 
     # delete datacard
     data_registry.delete_card(card=datacard)
     cards = data_registry.list_cards(name="pipeline_data", repository="mlops")
     assert len(cards) == 0
 
-    assert not api_storage_client.exists(Path(datacard.uri, SaveName.CARD.value).with_suffix(".joblib"))
+    assert not api_storage_client.exists(Path(datacard.uri, SaveName.CARD.value).with_suffix(".json"))
 
     # this will create a soft failure in the files path since the file is already deleted
     data_registry.delete_card(card=datacard)
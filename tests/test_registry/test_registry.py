@@ -1,16 +1,26 @@
+import json
 import os
 import sys
+import time
 import uuid
+from itertools import islice
 from pathlib import Path
 from typing import Tuple
+from unittest.mock import patch
 
 import joblib
+import numpy as np
+import pandas as pd
 import polars as pl
+import pyarrow.parquet as pq
 import pytest
+import torch
+import zarr
 from pytest_lazyfixture import lazy_fixture
-from sqlalchemy import select
+from sqlalchemy import insert, select
 
 from opsml.cards import (
+    CardInfo,
     DataCard,
     DataCardMetadata,
     Description,
@@ -25,13 +35,32 @@ from opsml.data import (
     PandasData,
     PolarsData,
     SqlData,
+    TorchData,
 )
 from opsml.helpers.exceptions import VersionError
 from opsml.model import ModelInterface, SklearnModel
 from opsml.registry import CardRegistries
 from opsml.registry.records import registry_name_record_map
 from opsml.registry.sql.base.query_engine import DialectHelper
-from opsml.registry.sql.base.sql_schema import DataSchema
+from opsml.registry.sql.base.sql_schema import (
+    CardChangeSchema,
+    CardTagSchema,
+    DataSchema,
+)
+from opsml.settings.config import config
+from opsml.storage import client
+from opsml.storage.card_cache import CardCache, card_cache
+from opsml.storage.card_envelope import CARD_SCHEMA_VERSION, read_card_envelope
+from opsml.types import (
+    CommonKwargs,
+    IpcWriteOptions,
+    Metric,
+    ParquetWriteOptions,
+    RegistryTableNames,
+    SaveName,
+    Suffix,
+    ZarrWriteOptions,
+)
 from tests.conftest import FOURTEEN_DAYS_STR, FOURTEEN_DAYS_TS, OPSML_TRACKING_URI
 
 
@@ -658,6 +687,23 @@ def test_pandas_dtypes(db_registries: CardRegistries, pandas_data: PandasData) -
     assert splits["test"].X.dtypes["animals"] == "category"
 
 
+def test_pandas_arrow_dtypes(db_registries: CardRegistries, pandas_data: PandasData) -> None:
+    registry = db_registries.data
+
+    data = pandas_data.model_copy(update={"arrow_dtypes": True})
+    datacard = DataCard(name="pandas_arrow", repository="mlops", contact="mlops.com", interface=data)
+    registry.register_card(card=datacard)
+
+    datacard = registry.load_card(uid=datacard.uid)
+    datacard.load_data()
+
+    assert all(isinstance(dtype, pd.ArrowDtype) for dtype in datacard.data.dtypes)
+    assert datacard.data.astype(object).equals(pandas_data.data.astype(object))
+
+    splits = datacard.interface.split_data()
+    assert splits["train"].X.astype(object).equals(pandas_data.split_data()["train"].X.astype(object))
+
+
 def test_polars_dtypes(db_registries: CardRegistries, iris_data_polars: PolarsData) -> None:
     registry = db_registries.data
     data = iris_data_polars.data
@@ -809,6 +855,334 @@ def test_list_cards(db_registries: CardRegistries) -> None:
     assert cards[4]["version"] == "1.20.100"
 
 
+def test_list_cards_tags(pandas_data: PandasData, db_registries: CardRegistries) -> None:
+    registry = db_registries.data
+
+    cards = []
+    for tags in [{"env": "prod", "team": "mlops"}, {"env": "prod", "team": "ds"}, {"env": "dev"}]:
+        data_card = DataCard(
+            interface=pandas_data,
+            name="tag_test",
+            repository="mlops",
+            contact="mlops.com",
+            tags=tags,
+        )
+        registry.register_card(card=data_card)
+        cards.append(data_card)
+
+    records = registry.list_cards(tags={"env": "prod"})
+    assert {record["uid"] for record in records} == {cards[0].uid, cards[1].uid}
+
+    # AND
+    records = registry.list_cards(tags={"env": "prod", "team": "mlops"})
+    assert [record["uid"] for record in records] == [cards[0].uid]
+
+    # OR
+    records = registry.list_cards(tags={"team": "ds", "env": "dev"}, match_all_tags=False)
+    assert {record["uid"] for record in records} == {cards[1].uid, cards[2].uid}
+
+    # tag table is kept in sync on update
+    cards[2].add_tag("team", "mlops")
+    registry.update_card(card=cards[2])
+    records = registry.list_cards(tags={"team": "mlops"})
+    assert {record["uid"] for record in records} == {cards[0].uid, cards[2].uid}
+
+    # and delete
+    registry.delete_card(card=cards[0])
+    records = registry.list_cards(tags={"team": "mlops"})
+    assert [record["uid"] for record in records] == [cards[2].uid]
+
+    with registry._registry.engine.session() as sess:
+        assert not sess.query(CardTagSchema).filter(CardTagSchema.card_uid == cards[0].uid).all()
+
+
+@pytest.mark.parametrize("registries", [lazy_fixture("db_registries"), lazy_fixture("api_registries")])
+def test_list_cards_columns(pandas_data: PandasData, registries: CardRegistries) -> None:
+    registry = registries.data
+
+    for _ in range(2):
+        data_card = DataCard(
+            interface=pandas_data,
+            name="column_test",
+            repository="mlops",
+            contact="mlops.com",
+        )
+        registry.register_card(card=data_card)
+
+    records = registry.list_cards(name="column_test", columns=["uid", "name"])
+    assert len(records) == 2
+
+    # version is always returned and records are still sorted by semver
+    assert all(set(record.keys()) == {"uid", "name", "version"} for record in records)
+    assert [record["version"] for record in records] == ["1.1.0", "1.0.0"]
+    assert records[0]["uid"] == data_card.uid
+
+    values = registry.query_value_from_card(uid=data_card.uid, columns=["contact", "repository"])
+    assert values == {"contact": "mlops.com", "repository": "mlops"}
+
+    with pytest.raises(Exception):
+        registry.list_cards(name="column_test", columns=["not_a_column"])
+
+
+def test_load_cards(db_registries: CardRegistries) -> None:
+    registry = db_registries.run
+
+    runs = []
+    for idx in range(3):
+        run = RunCard(name="batch_run", repository="mlops", contact="mlops.com")
+        run.log_parameter("idx", idx)
+        registry.register_card(card=run)
+        runs.append(run)
+
+    # cards are returned in input order
+    uids = [runs[2].uid, runs[0].uid, runs[1].uid]
+    cards = registry.load_cards(uids=uids)
+    assert [card.uid for card in cards] == uids
+    assert [card.get_parameter("idx").value for card in cards] == [2, 0, 1]
+
+    with pytest.raises(ValueError):
+        registry.load_cards(uids=[runs[0].uid, uuid.uuid4().hex])
+
+
+def test_card_changes_watch(pandas_data: PandasData, db_registries: CardRegistries) -> None:
+    registry = db_registries.data
+
+    start = registry._registry.get_card_changes()["cursor"]
+    watcher = registry.watch(name="change_test", since=start, timeout=1)
+    # cursor is retrieved when watch is called, not when iteration starts
+    latest_watcher = registry.watch(name="change_test", timeout=1)
+
+    data_card = DataCard(
+        interface=pandas_data,
+        name="change_test",
+        repository="mlops",
+        contact="mlops.com",
+    )
+    registry.register_card(card=data_card)
+    data_card.contact = "new_contact"
+    registry.update_card(card=data_card)
+    registry.delete_card(card=data_card)
+
+    changes = list(islice(watcher, 3))
+    assert [change["action"] for change in changes] == ["registered", "updated", "deleted"]
+    assert all(change["uid"] == data_card.uid for change in changes)
+    assert changes[0]["cursor"] < changes[1]["cursor"] < changes[2]["cursor"]
+    assert list(islice(latest_watcher, 3)) == changes
+
+    # no new changes; long-poll returns after the timeout with the same cursor
+    result = registry._registry.get_card_changes(since=changes[-1]["cursor"], timeout=0.1)
+    assert result == {"cursor": changes[-1]["cursor"], "changes": []}
+
+
+def test_card_changes_cursor_gap(db_registries: CardRegistries) -> None:
+    registry = db_registries.data
+    engine = registry._registry.engine
+    start = registry._registry.get_card_changes()["cursor"]
+
+    def _insert_change(idx: int, timestamp: int) -> None:
+        with engine.session() as sess:
+            sess.execute(
+                insert(CardChangeSchema),
+                {
+                    "idx": idx,
+                    "registry_name": registry._registry.table_name,
+                    "uid": uuid.uuid4().hex,
+                    "action": "registered",
+                    "timestamp": timestamp,
+                },
+            )
+            sess.commit()
+
+    now = int(round(time.time() * 1_000_000))
+
+    # start + 1 is still in-flight; the cursor is held back
+    _insert_change(idx=start + 2, timestamp=now)
+    assert registry._registry.get_card_changes(since=start) == {"cursor": start, "changes": []}
+
+    # late commit of the lower cursor releases both changes
+    _insert_change(idx=start + 1, timestamp=now)
+    result = registry._registry.get_card_changes(since=start)
+    assert result["cursor"] == start + 2
+    assert [change["cursor"] for change in result["changes"]] == [start + 1, start + 2]
+
+    # gaps older than the timeout are skipped (e.g. rolled back transactions)
+    _insert_change(idx=start + 4, timestamp=now - 60 * 1_000_000)
+    result = registry._registry.get_card_changes(since=start + 2)
+    assert result["cursor"] == start + 4
+    assert [change["cursor"] for change in result["changes"]] == [start + 4]
+
+
+def test_card_lineage(
+    linear_regression: Tuple[ModelInterface, NumpyData],
+    db_registries: CardRegistries,
+) -> None:
+    model, data = linear_regression
+
+    data_card = DataCard(interface=data, name="lineage_data", repository="mlops", contact="mlops.com")
+    db_registries.data.register_card(card=data_card)
+
+    model_card = ModelCard(
+        interface=model,
+        name="lineage_model",
+        repository="mlops",
+        contact="mlops.com",
+        datacard_uid=data_card.uid,
+    )
+    db_registries.model.register_card(card=model_card)
+
+    run = RunCard(name="lineage_run", repository="mlops", contact="mlops.com", datacard_uids=[data_card.uid])
+    db_registries.run.register_card(card=run)
+
+    edges = db_registries.run.lineage(uid=run.uid, direction="downstream")
+    assert [(edge["parent_uid"], edge["child_uid"], edge["depth"]) for edge in edges] == [
+        (run.uid, data_card.uid, 1),
+        (data_card.uid, model_card.uid, 2),
+    ]
+    assert edges[1]["child_registry"] == RegistryTableNames.MODEL.value
+
+    edges = db_registries.model.lineage(uid=model_card.uid, direction="upstream")
+    assert {edge["parent_uid"] for edge in edges} == {run.uid, data_card.uid}
+
+    edges = db_registries.model.lineage(uid=model_card.uid, direction="upstream", depth=1)
+    assert [edge["parent_uid"] for edge in edges] == [data_card.uid]
+
+    # edges are replaced when the card references change
+    other_data_card = DataCard(interface=data, name="lineage_data_other", repository="mlops", contact="mlops.com")
+    db_registries.data.register_card(card=other_data_card)
+    run.datacard_uids = [other_data_card.uid]
+    db_registries.run.update_card(card=run)
+
+    edges = db_registries.run.lineage(uid=run.uid, direction="downstream", depth=1)
+    assert [edge["child_uid"] for edge in edges] == [other_data_card.uid]
+
+    # edges recorded from another card's references are kept when a card is updated
+    other_run = RunCard(
+        name="lineage_run_other",
+        repository="mlops",
+        contact="mlops.com",
+        modelcard_uids=[model_card.uid],
+    )
+    db_registries.run.register_card(card=other_run)
+    db_registries.model.update_card(card=model_card)
+
+    edges = db_registries.model.lineage(uid=model_card.uid, direction="upstream", depth=1)
+    assert {edge["parent_uid"] for edge in edges} == {data_card.uid, other_run.uid}
+
+    # edges are removed with the card
+    db_registries.model.delete_card(card=model_card)
+    edges = db_registries.data.lineage(uid=data_card.uid, direction="downstream")
+    assert not edges
+
+
+def test_card_lineage_placeholder_uids(db_registries: CardRegistries) -> None:
+    run = RunCard(
+        name="lineage_placeholder",
+        repository="mlops",
+        contact="mlops.com",
+        datacard_uids=[CommonKwargs.UNDEFINED.value],
+    )
+    db_registries.run.register_card(card=run)
+
+    assert not db_registries.run.lineage(uid=run.uid, direction="downstream")
+
+
+def test_load_card_lazy(pandas_data: PandasData, db_registries: CardRegistries) -> None:
+    run = RunCard(name="lazy_run", repository="mlops", contact="mlops.com", tags={"env": "dev"})
+    run.log_parameter("lr", 0.1)
+    db_registries.run.register_card(card=run)
+
+    lazy_run = db_registries.run.load_card(uid=run.uid, lazy=True)
+    assert isinstance(lazy_run, RunCard)
+
+    # registry fields are read from the record without loading the card
+    with patch("opsml.storage.card_loader.CardLoader.load_card", side_effect=AssertionError("card loaded")):
+        assert lazy_run.name == run.name
+        assert lazy_run.version == run.version
+        assert lazy_run.tags == {"env": "dev"}
+
+    assert not lazy_run.is_loaded
+
+    # other fields load the full card
+    assert lazy_run.get_parameter("lr").value == 0.1
+    assert lazy_run.is_loaded
+
+
+def test_load_card_cache(db_registries: CardRegistries) -> None:
+    run = RunCard(name="cached_run", repository="mlops", contact="mlops.com")
+    run.log_parameter("lr", 0.1)
+    db_registries.run.register_card(card=run)
+
+    loaded = db_registries.run.load_card(uid=run.uid)
+    hits = card_cache.stats().hits
+
+    # repeat loads are served from memory and return independent copies
+    with patch("opsml.storage.card_loader.CardLoader._load_object", side_effect=AssertionError("storage accessed")):
+        cached = db_registries.run.load_card(uid=run.uid)
+
+    assert card_cache.stats().hits == hits + 1
+    assert cached is not loaded
+    cached.log_parameter("lr", 0.2)
+    assert db_registries.run.load_card(uid=run.uid).get_parameter("lr").value == 0.1
+
+    # updates invalidate the cached card
+    cached.contact = "updated.com"
+    db_registries.run.update_card(card=cached)
+    assert db_registries.run.load_card(uid=run.uid).contact == "updated.com"
+
+
+def test_card_cache_eviction() -> None:
+    cache = CardCache(max_size=2)
+    for idx in range(3):
+        cache.put(str(idx), Metric(name="metric", value=idx))
+
+    assert cache.get("0") is None
+    assert cache.get("2").value == 2
+    assert cache.stats().evictions == 1
+    assert cache.stats().size == 2
+
+    cache.invalidate("2")
+    assert cache.get("2") is None
+
+
+def test_load_card_envelope(db_registries: CardRegistries) -> None:
+    run = RunCard(name="envelope_run", repository="mlops", contact="mlops.com", tags={"env": "dev"})
+    run.log_parameter("lr", 0.1)
+    db_registries.run.register_card(card=run)
+
+    card_path = Path(run.uri, SaveName.CARD.value).with_suffix(Suffix.JSON.value)
+    envelope = json.loads(card_path.read_text("utf-8"))
+    assert envelope["schema_version"] == CARD_SCHEMA_VERSION
+    assert envelope["card"]["uid"] == run.uid
+
+    # cards saved before envelopes are loaded from joblib
+    joblib.dump(read_card_envelope(card_path.read_bytes()), card_path.with_suffix(Suffix.JOBLIB.value))
+    card_path.unlink()
+    card_cache.clear()
+
+    loaded = db_registries.run.load_card(uid=run.uid)
+    assert loaded.get_parameter("lr").value == 0.1
+    assert loaded.tags == {"env": "dev"}
+
+    # older servers may answer requests for missing json files with a server error instead of a 404
+    read_bytes = client.storage_client.read_bytes
+
+    def _old_server_read_bytes(path: Path) -> bytes:
+        if path.suffix == Suffix.JSON.value:
+            raise ValueError("Failed to make server call for get request. Status code: 500")
+        return read_bytes(path)
+
+    card_cache.clear()
+    with patch.object(client.storage_client, "read_bytes", side_effect=_old_server_read_bytes):
+        loaded = db_registries.run.load_card(uid=run.uid)
+    assert loaded.get_parameter("lr").value == 0.1
+
+    # newer envelopes are rejected
+    card_path.write_text(json.dumps({"schema_version": CARD_SCHEMA_VERSION + 1, "card": {}}), "utf-8")
+    card_cache.clear()
+    with pytest.raises(ValueError):
+        db_registries.run.load_card(uid=run.uid)
+
+
 def test_sql_version_logic() -> None:
     """This is more to ensure coverage. Postgres and Mysql have been tested offline"""
 
@@ -826,3 +1200,226 @@ def test_sql_version_logic() -> None:
         DialectHelper.get_dialect_logic(select_query, DataSchema, "fail")
 
     assert ve.match("Unsupported dialect: fail")
+
+
+def test_prefetch(
+    db_registries: CardRegistries,
+    linear_regression: Tuple[SklearnModel, NumpyData],
+    tmp_path: Path,
+) -> None:
+    model, data = linear_regression
+    datacard = DataCard(interface=data, name="prefetch_data", repository="mlops", contact="mlops.com")
+    db_registries.data.register_card(card=datacard)
+
+    modelcard = ModelCard(
+        interface=model,
+        name="prefetch_model",
+        repository="mlops",
+        contact="mlops.com",
+        datacard_uid=datacard.uid,
+        to_onnx=True,
+    )
+    db_registries.model.register_card(modelcard)
+    info = CardInfo(uid=modelcard.uid)
+
+    with pytest.raises(ValueError):
+        db_registries.model.prefetch(infos=[info])
+
+    with patch.object(config, "opsml_artifact_cache_dir", tmp_path.as_posix()):
+        futures = db_registries.model.prefetch(infos=[info], artifacts=["onnx", "preprocessor"])
+        prefetched = futures[0].result()
+
+        onnx_path = Path(tmp_path, modelcard.uid, SaveName.ONNX_MODEL.value).with_suffix(Suffix.ONNX.value)
+        assert onnx_path.exists()
+        assert prefetched.interface.onnx_model is None
+
+        # loads read from the artifact cache
+        with patch("opsml.storage.card_loader.CardLoader._get", side_effect=AssertionError("storage accessed")):
+            prefetched.load_onnx_model()
+        assert prefetched.interface.onnx_model.sess is not None
+
+        # sessions can be created in the background
+        futures = db_registries.model.prefetch(infos=[info], create_sessions=True)
+        assert futures[0].result().interface.onnx_model.sess is not None
+
+
+def test_download_model_artifact_cache(
+    db_registries: CardRegistries,
+    linear_regression: Tuple[SklearnModel, NumpyData],
+    tmp_path: Path,
+) -> None:
+    model, data = linear_regression
+    modelcard = ModelCard(interface=model, name="cached_download", repository="mlops", contact="mlops.com")
+    db_registries.model.register_card(modelcard)
+
+    with patch.object(config, "opsml_artifact_cache_dir", Path(tmp_path, "cache").as_posix()):
+        loaded_card = db_registries.model.load_card(uid=modelcard.uid)
+        download_path = Path(tmp_path, "download")
+        loaded_card.download_model(path=download_path)
+
+    assert Path(download_path, SaveName.MODEL_METADATA.value).with_suffix(Suffix.JSON.value).exists()
+    assert Path(download_path, SaveName.TRAINED_MODEL.value).with_suffix(model.model_suffix).exists()
+
+
+@pytest.mark.parametrize(
+    "interface, column, value",
+    [
+        (lazy_fixture("pandas_data"), "year", 2020),
+        (lazy_fixture("polars_data"), "foo", 3),
+    ],
+)
+def test_load_data_pushdown(db_registries: CardRegistries, interface: DataInterface, column: str, value: int) -> None:
+    datacard = DataCard(interface=interface, name="pushdown", repository="mlops", contact="mlops.com")
+    db_registries.data.register_card(card=datacard)
+
+    loaded_card = db_registries.data.load_card(uid=datacard.uid)
+    loaded_card.load_data(columns=[column], filters=[(column, ">", value)])
+
+    data = loaded_card.interface.data
+    assert list(data.columns) == [column]
+    assert len(data) == 3
+    assert (data[column] > value).all()
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        ParquetWriteOptions(row_group_size=2, compression="zstd", compression_level=3),
+        ParquetWriteOptions(partition_cols=["year"], max_rows_per_file=2),
+    ],
+)
+def test_parquet_write_options(
+    db_registries: CardRegistries,
+    pandas_data: PandasData,
+    options: ParquetWriteOptions,
+) -> None:
+    pandas_data.parquet_options = options
+    datacard = DataCard(interface=pandas_data, name="parquet_options", repository="mlops", contact="mlops.com")
+    db_registries.data.register_card(card=datacard)
+
+    data_path = Path(datacard.uri, SaveName.DATA.value).with_suffix(pandas_data.data_suffix)
+    if options.is_dataset:
+        assert data_path.is_dir()
+        assert len(list(data_path.rglob("*.parquet"))) > 1
+    else:
+        assert pq.ParquetFile(data_path).metadata.num_row_groups == 4
+
+    loaded_card = db_registries.data.load_card(uid=datacard.uid)
+    loaded_card.load_data()
+    pd.testing.assert_frame_equal(loaded_card.interface.data, pandas_data.data.reset_index(drop=True))
+    assert loaded_card.interface.data.dtypes.equals(pandas_data.data.dtypes)
+
+    loaded_card = db_registries.data.load_card(uid=datacard.uid)
+    loaded_card.load_data(filters=[("year", "=", 2020)])
+    assert len(loaded_card.interface.data) == 3
+
+
+def test_load_data_split(db_registries: CardRegistries, pandas_data: PandasData) -> None:
+    pandas_data.parquet_options = ParquetWriteOptions(save_splits=True)
+    datacard = DataCard(interface=pandas_data, name="saved_splits", repository="mlops", contact="mlops.com")
+    db_registries.data.register_card(card=datacard)
+
+    splits_path = Path(datacard.uri, SaveName.DATA_SPLITS.value)
+    assert sorted(path.name for path in splits_path.iterdir()) == ["test.parquet", "train.parquet"]
+
+    loaded_card = db_registries.data.load_card(uid=datacard.uid)
+    loaded_card.load_data(split="train")
+    assert list(loaded_card.interface.data.columns) == list(pandas_data.data.columns)
+    assert loaded_card.interface.data["year"].tolist() == [2020, 2020, 2020]
+
+    # pushdown applies to saved splits
+    loaded_card = db_registries.data.load_card(uid=datacard.uid)
+    loaded_card.load_data(split="train", columns=["n_legs"], filters=[("n_legs", ">", 2)])
+    assert loaded_card.interface.data["n_legs"].tolist() == [100]
+
+    # splits that were not saved individually are split in memory
+    pandas_data.parquet_options = None
+    datacard = DataCard(interface=pandas_data, name="memory_splits", repository="mlops", contact="mlops.com")
+    db_registries.data.register_card(card=datacard)
+    assert not Path(datacard.uri, SaveName.DATA_SPLITS.value).exists()
+
+    loaded_card = db_registries.data.load_card(uid=datacard.uid)
+    loaded_card.load_data(split="test")
+    assert loaded_card.interface.data["year"].tolist() == [2021]
+
+    loaded_card = db_registries.data.load_card(uid=datacard.uid)
+    with pytest.raises(ValueError):
+        loaded_card.load_data(split="test", columns=["year"])
+
+    with pytest.raises(ValueError):
+        loaded_card.load_data(split="missing")
+
+
+def test_polars_lazy_frame(db_registries: CardRegistries, polars_data: PolarsData) -> None:
+    df = polars_data.data
+    polars_data.data = df.lazy().filter(pl.col("foo") > 1)
+    datacard = DataCard(interface=polars_data, name="polars_lazy", repository="mlops", contact="mlops.com")
+    db_registries.data.register_card(card=datacard)
+
+    # feature map comes from the plan schema
+    assert list(datacard.metadata.feature_map) == ["foo", "bar", "y"]
+    data_path = Path(datacard.uri, SaveName.DATA.value).with_suffix(Suffix.PARQUET.value)
+    assert pq.ParquetFile(data_path).metadata.num_rows == 5
+
+    loaded_card = db_registries.data.load_card(uid=datacard.uid)
+    loaded_card.load_data(lazy=True, columns=["foo", "y"])
+    assert isinstance(loaded_card.interface.data, pl.LazyFrame)
+    assert loaded_card.interface.data.filter(pl.col("foo") > 5).collect()["y"].to_list() == [6]
+
+    loaded_card = db_registries.data.load_card(uid=datacard.uid)
+    loaded_card.load_data()
+    assert loaded_card.interface.data.frame_equal(df.filter(pl.col("foo") > 1))
+
+    # queries the streaming engine can't run are collected before saving
+    polars_data.data = df.lazy().map(lambda data: data.head(2))
+    datacard = DataCard(interface=polars_data, name="polars_lazy", repository="mlops", contact="mlops.com")
+    db_registries.data.register_card(card=datacard)
+
+    loaded_card = db_registries.data.load_card(uid=datacard.uid)
+    loaded_card.load_data(lazy=True)
+    assert loaded_card.interface.data.collect().frame_equal(df.head(2))
+
+
+def test_numpy_zarr_lazy(db_registries: CardRegistries, numpy_data: NumpyData) -> None:
+    numpy_data.zarr_options = ZarrWriteOptions(chunks=(2, None), compressor="zstd", compression_level=3)
+    datacard = DataCard(interface=numpy_data, name="zarr_lazy", repository="mlops", contact="mlops.com")
+    db_registries.data.register_card(card=datacard)
+
+    stored = zarr.open_array(Path(datacard.uri, SaveName.DATA.value).with_suffix(Suffix.ZARR.value).as_posix())
+    assert stored.chunks == (2, 100)
+    assert stored.compressor.cname == "zstd"
+
+    loaded_card = db_registries.data.load_card(uid=datacard.uid)
+    loaded_card.load_data(lazy=True)
+
+    assert isinstance(loaded_card.interface.data, zarr.Array)
+    np.testing.assert_array_equal(loaded_card.interface.data[3:5], numpy_data.data[3:5])
+
+
+def test_torch_data_safetensors(db_registries: CardRegistries) -> None:
+    data = TorchData(data=torch.randn(10, 4), as_safetensors=True)
+    datacard = DataCard(interface=data, name="torch_safetensors", repository="mlops", contact="mlops.com")
+    db_registries.data.register_card(card=datacard)
+
+    assert Path(datacard.uri, SaveName.DATA.value).with_suffix(Suffix.SAFETENSORS.value).exists()
+
+    loaded_card = db_registries.data.load_card(uid=datacard.uid)
+    loaded_card.load_data()
+
+    assert torch.equal(loaded_card.interface.data, data.data)
+
+
+def test_arrow_ipc(db_registries: CardRegistries, arrow_data: ArrowData) -> None:
+    arrow_data.ipc_options = IpcWriteOptions()
+    datacard = DataCard(interface=arrow_data, name="arrow_ipc", repository="mlops", contact="mlops.com")
+    db_registries.data.register_card(card=datacard)
+
+    assert Path(datacard.uri, SaveName.DATA.value).with_suffix(Suffix.ARROW.value).exists()
+
+    loaded_card = db_registries.data.load_card(uid=datacard.uid)
+    loaded_card.load_data()
+    assert loaded_card.interface.data.equals(arrow_data.data)
+
+    loaded_card = db_registries.data.load_card(uid=datacard.uid)
+    loaded_card.load_data(columns=["animals"], filters=[("n_legs", ">", 4)])
+    assert loaded_card.interface.data.to_pydict() == {"animals": ["Brittle stars", "Centipede"]}
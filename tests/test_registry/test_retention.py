@@ -0,0 +1,61 @@
+from pathlib import Path
+
+from opsml.cards import AuditCard, DataCard
+from opsml.data import PandasData
+from opsml.registry import CardRegistries
+from opsml.registry.retention import RetentionManager, RetentionPolicy
+from opsml.storage import client
+from opsml.types import RegistryType
+
+
+def test_retention_keep_last(db_registries: CardRegistries, pandas_data: PandasData) -> None:
+    registry = db_registries.data
+
+    cards = []
+    for _ in range(4):
+        card = DataCard(interface=pandas_data, name="retention", repository="mlops", contact="mlops.com")
+        registry.register_card(card=card)
+        cards.append(card)
+
+    # the oldest version is referenced by an audit card
+    auditcard = AuditCard(name="retention_audit", repository="mlops", contact="mlops.com")
+    auditcard.add_card(cards[0])
+    db_registries.audit.register_card(card=auditcard)
+
+    manager = RetentionManager(registries=db_registries, max_deletes_per_second=100)
+    policy = RetentionPolicy(keep_last=2)
+
+    report = manager.apply(RegistryType.DATA, policy, dry_run=True)
+    assert [card["version"] for card in report.cards] == ["1.1.0"]
+    assert [card["version"] for card in report.protected] == ["1.0.0"]
+    assert not report.deleted
+    assert len(registry.list_cards(name="retention")) == 4
+
+    report = manager.apply(RegistryType.DATA, policy, dry_run=False)
+    assert report.deleted == [cards[1].uid]
+    assert not report.failed
+
+    versions = [card["version"] for card in registry.list_cards(name="retention")]
+    assert versions == ["1.3.0", "1.2.0", "1.0.0"]
+    assert not Path(cards[1].uri).exists()
+    assert Path(cards[0].uri).exists()
+
+
+def test_retention_orphans(db_registries: CardRegistries, pandas_data: PandasData) -> None:
+    registry = db_registries.data
+    card = DataCard(interface=pandas_data, name="orphan", repository="mlops", contact="mlops.com")
+    registry.register_card(card=card)
+
+    # simulate a failed registration where artifacts were saved but no record was written
+    orphan_uri = card.uri.parent / "v9.0.0"
+    client.storage_client.copy(card.uri, orphan_uri)
+
+    manager = RetentionManager(registries=db_registries)
+    assert [Path(orphan).name for orphan in manager.apply(RegistryType.DATA, include_orphans=True).orphans] == [
+        "v9.0.0"
+    ]
+
+    report = manager.apply(RegistryType.DATA, include_orphans=True, dry_run=False)
+    assert len(report.deleted) == 1
+    assert not orphan_uri.exists()
+    assert Path(card.uri).exists()
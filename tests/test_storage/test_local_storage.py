@@ -1,9 +1,16 @@
 import sys
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
+from fsspec.implementations.local import LocalFileSystem
 
-from opsml.storage.client import StorageClient, StorageClientBase
+from opsml.storage.client import (
+    CloudStorageClientBase,
+    StorageClient,
+    StorageClientBase,
+)
+from opsml.types import S3StorageClientSettings
 
 pytestmark = [pytest.mark.skipif(sys.platform == "win32", reason="No wn_32 test")]
 
@@ -160,3 +167,51 @@ def test_local_storage_client_presigned_uri(local_storage_client: StorageClient)
     base = StorageClientBase(settings=local_storage_client.settings)
     path = base.generate_presigned_url(Path("fake"), 1)
     assert path == "fake"
+
+
+def test_cloud_storage_client_read_cache(tmp_path: Path) -> None:
+    cache_dir = tmp_path / "cache"
+    settings = S3StorageClientSettings(
+        max_concurrency=4,
+        chunk_size=1024,
+        cache_type="filecache",
+        cache_dir=cache_dir.as_posix(),
+        cache_max_bytes=250_000,
+    )
+    file_system = LocalFileSystem(auto_mkdir=True)
+    storage_client = CloudStorageClientBase(settings=settings, client=file_system)
+
+    assert storage_client._transfer_kwargs() == {"batch_size": 4}
+    assert storage_client._transfer_kwargs(upload=True) == {"batch_size": 4, "chunksize": 1024}
+
+    content = b"0123456789" * 10_000
+    rpath = tmp_path / "model.txt"
+    rpath.write_bytes(content)
+
+    # repeated reads are served from the local cache
+    assert storage_client.read_bytes(rpath) == content
+    with patch.object(file_system, "get_file", side_effect=AssertionError("remote read")):
+        assert storage_client.read_bytes(rpath) == content
+
+    # overwritten files are not served stale
+    rpath.write_bytes(content[::-1])
+    assert storage_client.read_bytes(rpath) == content[::-1]
+
+    # downloads go through the cache
+    model_dir = tmp_path / "model"
+    (model_dir / "nested").mkdir(parents=True)
+    (model_dir / "nested" / "weights.bin").write_bytes(content)
+
+    storage_client.get(model_dir, tmp_path / "download")
+    with patch.object(file_system, "get_file", side_effect=AssertionError("remote read")):
+        storage_client.get(model_dir, tmp_path / "download_cached")
+    assert (tmp_path / "download_cached" / "nested" / "weights.bin").read_bytes() == content
+
+    # the cache is trimmed to its max size, measured in allocated blocks
+    for idx in range(3):
+        path = tmp_path / f"artifact_{idx}.txt"
+        path.write_bytes(content)
+        storage_client.read_bytes(path)
+
+    cached_files = [path for path in cache_dir.iterdir() if path.name != "cache"]
+    assert sum(path.stat().st_blocks * 512 for path in cached_files) <= 250_000
@@ -1,9 +1,11 @@
 import numpy as np
+import pandas as pd
+import polars as pl
 import pyarrow as pa
 import pytest
 
 from opsml.data import ArrowData
-from opsml.data.splitter import DataSplit, DataSplitter, DataSplitterBase
+from opsml.data.splitter import DataSplit, DataSplitter
 from opsml.types import AllowedDataType
 
 
@@ -15,25 +17,91 @@ def test_pyarrow_splitter(arrow_data: ArrowData):
     assert isinstance(data.X, pa.Table)
 
 
-def test_base_splitter():
-    split = DataSplit(label="train", indices=np.array([0, 2]))
+@pytest.mark.parametrize("data_type", [AllowedDataType.PANDAS, AllowedDataType.POLARS, AllowedDataType.PYARROW])
+def test_split_all(data_type: str):
+    df = pd.DataFrame({"day": [5, 1, 3, 2, 4, 1], "value": [0.5, 0.1, 0.3, 0.2, 0.4, 0.1]})
+    data = {
+        AllowedDataType.PANDAS: df,
+        AllowedDataType.POLARS: pl.from_pandas(df),
+        AllowedDataType.PYARROW: pa.Table.from_pandas(df),
+    }[data_type]
 
-    splitter = DataSplitterBase(split=split, dependent_vars=[])
+    splits = [
+        DataSplit(label="train", column_name="day", column_value=3, inequality="<"),
+        DataSplit(label="test", column_name="day", column_value=3, inequality=">="),
+        DataSplit(label="first", start=0, stop=2),
+        DataSplit(label="picked", indices=[4, 0]),
+    ]
+    result = DataSplitter.split_all(splits=splits, data=data, data_type=data_type, dependent_vars=[])
 
-    with pytest.raises(ValueError):
-        splitter.column_name
+    def days(data) -> list:
+        if isinstance(data, pd.DataFrame):
+            return data["day"].tolist()
+        return data["day"].to_pylist() if isinstance(data, pa.Table) else data["day"].to_list()
 
-    with pytest.raises(ValueError):
-        splitter.column_value
+    # rows keep their original order within column splits
+    assert days(result["train"].X) == [1, 2, 1]
+    assert days(result["test"].X) == [5, 3, 4]
+    assert days(result["first"].X) == [5, 1]
+    assert days(result["picked"].X) == [4, 5]
 
-    with pytest.raises(ValueError):
-        splitter.start
+    # overlapping column splits are filtered individually
+    splits = [
+        DataSplit(label="train", column_name="day", column_value=3, inequality="<="),
+        DataSplit(label="test", column_name="day", column_value=3, inequality=">="),
+    ]
+    result = DataSplitter.split_all(splits=splits, data=data, data_type=data_type, dependent_vars=[])
+    assert days(result["train"].X) == [1, 3, 2, 1]
+    assert days(result["test"].X) == [5, 3, 4]
 
-    with pytest.raises(ValueError):
-        splitter.stop
 
-    split = DataSplit(label="train", start=0, stop=1)
+def test_split_all_dependent_vars():
+    df = pd.DataFrame({"day": [5, 1, 3, 2], "value": [0.5, 0.1, 0.3, 0.2]})
+    splits = [DataSplit(label="train", column_name="day", column_value=3, inequality="<")]
+
+    result = DataSplitter.split_all(splits=splits, data=df, data_type=AllowedDataType.PANDAS, dependent_vars=["value"])
+    assert list(result["train"].X.columns) == ["day"]
+    assert result["train"].y["value"].tolist() == [0.1, 0.2]
+
+    result = DataSplitter.split_all(
+        splits=splits,
+        data=pl.from_pandas(df),
+        data_type=AllowedDataType.POLARS,
+        dependent_vars=["value"],
+    )
+    assert result["train"].X.columns == ["day"]
+    assert result["train"].y["value"].to_list() == [0.1, 0.2]
+
+
+def test_split_all_numpy():
+    data = np.arange(10)
+    splits = [DataSplit(label="train", start=0, stop=8), DataSplit(label="test", indices=[9, 8])]
+    result = DataSplitter.split_all(splits=splits, data=data, data_type=AllowedDataType.NUMPY, dependent_vars=[])
+
+    # row splits are views
+    assert np.shares_memory(result["train"].X, data)
+    assert result["test"].X.tolist() == [9, 8]
 
-    splitter = DataSplitterBase(split=split, dependent_vars=[])
     with pytest.raises(ValueError):
-        splitter.indices
+        DataSplitter.split_all(
+            splits=[DataSplit(label="train", column_name="day", column_value=1)],
+            data=data,
+            data_type=AllowedDataType.NUMPY,
+            dependent_vars=[],
+        )
+
+
+def test_split_all_sorted_column():
+    data = pa.table({"day": [1, 1, 2, 3, 3, 3]})
+    splits = [
+        DataSplit(label="train", column_name="day", column_value=3, inequality="<"),
+        DataSplit(label="test", column_name="day", column_value=3),
+        DataSplit(label="empty", column_name="day", column_value=4),
+    ]
+    result = DataSplitter.split_all(splits=splits, data=data, data_type=AllowedDataType.PYARROW, dependent_vars=[])
+
+    # contiguous splits are zero-copy slices
+    assert result["test"].X["day"].chunks[0].buffers()[1].address == data["day"].chunks[0].buffers()[1].address
+    assert result["train"].X["day"].to_pylist() == [1, 1, 2]
+    assert result["test"].X["day"].to_pylist() == [3, 3, 3]
+    assert result["empty"].X.num_rows == 0